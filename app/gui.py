@@ -2,72 +2,67 @@
 import json
 import logging
 import os
-import random
-import tempfile
+import queue
 import textwrap
 import threading
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-
-from app.paradigm_display import display_paradigm
-from app.utils.definition_utility import edit_definition
-from app.utils.full_paradigm_utility import generate_full_paradigm
-from app.utils.load_verbs_utility import load_verbs
-
-# Configure logging
-
-# Get a temporary directory
-temp_dir = tempfile.gettempdir()
-log_file_path = os.path.join(temp_dir, 'app.log')
-
-# Handle Exceptions When Configuring Logging
-try:
-    logging.basicConfig(
-        level=logging.DEBUG,  # Set to DEBUG to capture all levels of logs
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        filename=log_file_path,
-        filemode='a'
-    )
-except PermissionError as e:
-    # If logging to a file fails, log to stderr
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(levelname)s - %(message)s'
-    )
-    logging.error(f"Failed to write log to {log_file_path}: {e}")
+from tkinter import ttk, messagebox
+
+from app.verb_selection_list import VirtualCheckList
+from app.utils.audio_cache_utility import AudioCache
+from app.utils.audio_prefetch_utility import AudioPrefetcher
+from app.utils.file_utility import get_data_file_path
+from app.utils.form_index_utility import FormIndex
+from app.utils.load_verbs_utility import iter_verb_chunks
+from app.utils.paradigm_cache_utility import paradigm_cache
+from app.utils.quiz_engine_utility import Answer, QuizEngine, QuizError
+from app.utils.verb_search_utility import VerbSearchIndex
+
+logger = logging.getLogger(__name__)
+
+# Background verb loading: entries per chunk, poll interval and chunks handled per poll
+VERB_LOAD_CHUNK_SIZE = 1000
+VERB_LOAD_POLL_MS = 50
+VERB_LOAD_CHUNKS_PER_POLL = 4
+
+# Delay after the last keystroke before the Select Verbs list is filtered
+VERB_SEARCH_DEBOUNCE_MS = 150
 
 class VerbConjugationApp():
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Irish Verb Conjugation Quiz")
 
-        # Initialize verb data
-        self.verbs = []
-        self.current_paradigm = None
-        self.current_verb_data = None
-
-        # **Initialize verb selection variables**
-        self.verb_selection_vars = {}
-
-        # Load default verbs
-        self.load_default_verbs()
-
-        # Initialize state variables
-        self.correct_verb = None
-        self.correct_definition = None
-        self.correct_pronoun = None
-        self.correct_form_type = None
-        self.correct_tense = None
-        self.correct_form_marker = None
+        # **Initialize the quiz engine, which holds the verbs and draws the questions**
+        # Its form index is built on worker threads and handed over when ready
+        self.engine = QuizEngine(lazy_form_index=False)
+        self.question = None  # The question being answered
+
+        # Verb selections are kept by the quiz engine; the Select Verbs dialog reads and updates them
+        self.verb_search_index = None  # Built by the loader thread, or when the Select Verbs dialog opens
+        self._verb_selection_updates = []  # Refresh the open Select Verbs dialogs with the current verbs
+
+        # **Initialize background verb loading state**
+        self._load_id = 0
+        self._load_queue = None
+        self._loading = False
+        self._form_index_id = 0  # Latest form index build; older ones are dropped
+        self._load_form_index_id = 0
+        self._replaced_verbs = None
+        self.data_file = None  # Verb data file the current verbs were loaded from
+
+        # Pronunciation recordings are cached on disk and replayed offline
+        self.audio_cache = AudioCache()
+        # Recordings of the current verb are downloaded while the user answers
+        self.audio_prefetcher = AudioPrefetcher(self.audio_cache)
+        self.root.protocol('WM_DELETE_WINDOW', self.close)
 
         # **Initialize the Freeze Verb Variable**
         self.freeze_verb_var = tk.BooleanVar(value=False)  # Default is not frozen
 
         # **Initialize the Dialect Variable**
         self.dialect_var = tk.StringVar(value='O')  # Default dialect is Official
-
-        # Initialize a flag to track if we're in dictionary-form-only mode
-        self.only_dictionary_form_selected = False
+        self.dialect_var.trace_add('write', lambda *args: self._change_dialect(self.dialect_var.get()))
 
         # Initialize GUI components
         self._init_gui()
@@ -76,24 +71,253 @@ class VerbConjugationApp():
         self.root.bind('<Command-r>', lambda event: self.display_random_form())
         self.root.bind('<Command-c>', lambda event: self.check_answer())
 
+        # Load default verbs in the background so the window appears immediately
+        self.load_default_verbs()
+
+    @property
+    def verbs(self):
+        return self.engine.verbs
+
+    def close(self):
+        """
+        Cancel pending pronunciation downloads and close the window.
+        """
+        self.audio_prefetcher.shutdown()
+        self.root.destroy()
 
     def load_default_verbs(self):
         """
-        Load verbs from the default data file.
+        Load verbs from the default data file in the background.
+        """
+        self.start_loading_verbs()
+
+    def start_loading_verbs(self, custom_path=None):
         """
+        Start loading verbs on a worker thread.
+
+        Chunks of verbs are handed back to the Tk main loop through a queue that is
+        polled with `root.after`; the first chunk replaces the current verb list and
+        re-enables the generate button while the rest of the file is still loading.
+        If the load fails, the previous verbs and data file are put back. A fresh
+        compiled lexicon arrives as one chunk and is kept memory-mapped. The
+        form index, which flags ambiguous forms, is built on the worker thread too and
+        handed over after the last chunk.
+
+        Args:
+            custom_path (str, optional): Custom path to the verb data file. Defaults to None.
+        """
+        # A newer load supersedes any load still running
+        self._load_id += 1
+        load_id = self._load_id
+        self._load_queue = queue.Queue()
+        self._load_received_chunk = False
+        self._loading = True
+        # The loader builds the form index of the new verbs
+        self._form_index_id += 1
+        self._load_form_index_id = self._form_index_id
+
+        self.generate_button.config(state="disabled")
+        self.loading_progress.config(value=0)
+        self.loading_label.grid()
+        self.loading_progress.grid()
+
+        threading.Thread(
+            target=self._load_verbs_thread,
+            args=(load_id, custom_path, self.engine.dialect, self._load_queue),
+            daemon=True
+        ).start()
+        self.root.after(VERB_LOAD_POLL_MS, self._poll_verb_loading, load_id, custom_path)
+
+    def _load_verbs_thread(self, load_id, custom_path, dialect, results):
+        # Runs on the worker thread: never touch Tk here, only the queue
+        errors = []
+        chunks = []
+        names = []
         try:
-            self.verbs = load_verbs()
-            logging.debug(f"Loaded {len(self.verbs)} verbs from default data file.")
-
-            # **Update verb selection variables**
-            for verb_data in self.verbs:
-                verb = verb_data['verb']
-                if verb not in self.verb_selection_vars:
-                    self.verb_selection_vars[verb] = tk.BooleanVar(value=True)
-        except FileNotFoundError as e:
-            logging.error(f"Default data file not found: {e}")
-            messagebox.showerror("Error", f"Default data file not found: {e}")
-            self.verbs = []
+            for chunk in iter_verb_chunks(
+                    custom_path,
+                    chunk_size=VERB_LOAD_CHUNK_SIZE,
+                    errors=errors,
+                    on_progress=lambda done, total: results.put(('progress', done, total))):
+                if load_id != self._load_id:
+                    return
+                # Reading the names here decodes lexicon entries off the Tk thread
+                names.extend(verb_data['verb'] for verb_data in chunk)
+                results.put(('chunk', chunk))
+                chunks.append(chunk)
+            # Index the names for the Select Verbs dialog here rather than when it opens
+            results.put(('done', errors, VerbSearchIndex(names)))
+        except Exception as e:
+            results.put(('error', e))
+            return
+        if load_id != self._load_id:
+            return
+        # Indexing every form takes longest; the quiz runs without it until it arrives
+        verbs = chunks[0] if len(chunks) == 1 else [verb_data for chunk in chunks for verb_data in chunk]
+        results.put(('form_index', self._build_form_index(verbs, dialect)))
+
+    @staticmethod
+    def _build_form_index(verbs, dialect):
+        # Runs on a worker thread
+        try:
+            return FormIndex.build(verbs, dialect)
+        except Exception:
+            logger.exception("Error indexing the verb forms")
+            return None
+
+    def _poll_verb_loading(self, load_id, custom_path):
+        if load_id != self._load_id:
+            return  # Superseded by a newer load
+        chunks_handled = 0
+        try:
+            # Handle a few chunks per poll so the window stays responsive
+            while chunks_handled < VERB_LOAD_CHUNKS_PER_POLL:
+                message = self._load_queue.get_nowait()
+                if message[0] == 'progress':
+                    _, done, total = message
+                    self.loading_progress.config(value=done / total if total else 1.0)
+                elif message[0] == 'chunk':
+                    self._add_loaded_verbs(message[1], custom_path)
+                    chunks_handled += 1
+                elif message[0] == 'done':
+                    self._finish_verb_loading(custom_path, message[1], message[2])
+                elif message[0] == 'form_index':
+                    self._use_form_index(self._load_form_index_id, message[1])
+                    return
+                elif message[0] == 'error':
+                    self._fail_verb_loading(custom_path, message[1])
+                    return
+        except queue.Empty:
+            pass
+        self.root.after(VERB_LOAD_POLL_MS, self._poll_verb_loading, load_id, custom_path)
+
+    def _add_loaded_verbs(self, chunk, custom_path):
+        if not self._load_received_chunk:
+            # First chunk: replace the previous verb list
+            self._load_received_chunk = True
+            # Kept until the load has finished, to be put back if it fails; a superseded
+            # load that never finished has already saved the verbs before it
+            if self._replaced_verbs is None:
+                self._replaced_verbs = (self.engine.verbs, self.engine.selection, self.engine.form_index,
+                                        self.data_file, self.verb_search_index)
+            # A whole compiled lexicon is kept as it is rather than copied
+            self.engine.set_verbs(chunk)
+            self.question = None
+            paradigm_cache.clear()  # Paradigms of the previous file no longer apply
+            self.data_file = get_data_file_path(custom_path)  # Definition edits are saved to this file
+            if custom_path:
+                self._clear_question()
+            self.generate_button.config(state="normal")
+            self.verb_search_index = None
+            self._update_verb_selection_dialogs()
+        else:
+            self.engine.add_verbs(chunk)
+            self.verb_search_index = None
+
+    def _finish_verb_loading(self, custom_path, load_errors, search_index):
+        self._loading = False
+        self._replaced_verbs = None
+        self._hide_loading_progress()
+        self.verb_search_index = search_index
+        # Verbs of the later chunks
+        self._update_verb_selection_dialogs()
+        if custom_path:
+            logger.info("Loaded %d verbs from custom file: %s", len(self.verbs), custom_path)
+            messagebox.showinfo("Success", f"Successfully loaded verb data from '{os.path.basename(custom_path)}'.")
+        else:
+            logger.info("Loaded %d verbs from default data file.", len(self.verbs))
+        if load_errors:
+            details = "\n".join(f"Item {error.index} (byte {error.offset}): {error.message}"
+                                for error in load_errors[:10])
+            messagebox.showwarning("Skipped Items",
+                                   f"{len(load_errors)} item(s) could not be loaded and were skipped:\n\n{details}")
+
+    def _fail_verb_loading(self, custom_path, error):
+        self._loading = False
+        self._hide_loading_progress()
+        if self._load_received_chunk:
+            self._restore_replaced_verbs()
+        if self.verbs:
+            self.generate_button.config(state="normal")
+        if not custom_path:
+            if isinstance(error, FileNotFoundError):
+                logger.error("Default data file not found: %s", error)
+                messagebox.showerror("Error", f"Default data file not found: {error}")
+            else:
+                logger.error("Error loading default verb data: %s", error)
+                messagebox.showerror("Error", f"An error occurred while loading the verb data: {error}")
+        elif isinstance(error, FileNotFoundError):
+            logger.error("Custom data file not found: %s", error)
+            messagebox.showerror("Error", f"Custom data file not found: {error}")
+        elif isinstance(error, json.JSONDecodeError):
+            logger.error("Selected file is not a valid JSON: %s", error)
+            messagebox.showerror("Error", "The selected file is not a valid JSON.")
+        elif isinstance(error, KeyError):
+            logger.error("Missing key %s in the selected JSON file.", error)
+            messagebox.showerror("Error", f"Missing key {error} in the selected JSON file.")
+        else:
+            logger.error("Error loading custom verb data: %s", error)
+            messagebox.showerror("Error", f"An error occurred while loading the file: {error}")
+
+    def _restore_replaced_verbs(self):
+        # Put back the verbs a failed load had started to replace
+        verbs, selection, form_index, self.data_file, self.verb_search_index = self._replaced_verbs
+        self._replaced_verbs = None
+        self.engine.set_verbs(verbs, selection)
+        self.question = None
+        self._clear_question()
+        paradigm_cache.clear()
+        self._update_verb_selection_dialogs()
+        if form_index is not None and form_index.dialect == self.engine.dialect:
+            self.engine.set_form_index(form_index)
+        elif self.verbs:
+            self._start_form_indexing()
+
+    def _update_verb_selection_dialogs(self):
+        for update in list(self._verb_selection_updates):
+            update()
+
+    def _change_dialect(self, dialect):
+        self.engine.set_dialect(dialect)
+        # A load in progress re-indexes once it has finished if the dialect changed
+        if not self._loading and self.verbs:
+            self._start_form_indexing()
+
+    def _start_form_indexing(self):
+        """
+        Build the form index of the current verbs and dialect on a worker thread.
+        Until it is ready, questions are not flagged as ambiguous.
+        """
+        self._form_index_id += 1
+        index_id = self._form_index_id
+        results = queue.Queue()
+        # The sequence itself, so a memory-mapped lexicon is decoded on the worker thread
+        verbs, dialect = self.verbs, self.engine.dialect
+        threading.Thread(target=lambda: results.put(self._build_form_index(verbs, dialect)), daemon=True).start()
+        self.root.after(VERB_LOAD_POLL_MS, self._poll_form_indexing, index_id, results)
+
+    def _poll_form_indexing(self, index_id, results):
+        if index_id != self._form_index_id:
+            return
+        try:
+            form_index = results.get_nowait()
+        except queue.Empty:
+            self.root.after(VERB_LOAD_POLL_MS, self._poll_form_indexing, index_id, results)
+            return
+        self._use_form_index(index_id, form_index)
+
+    def _use_form_index(self, index_id, form_index):
+        if index_id != self._form_index_id or form_index is None:
+            return  # Superseded by a newer load or dialect
+        if form_index.dialect != self.engine.dialect:
+            self._start_form_indexing()  # The dialect changed while it was built
+        else:
+            self.engine.set_form_index(form_index)
+
+    def _hide_loading_progress(self):
+        self.loading_label.grid_remove()
+        self.loading_progress.grid_remove()
+        self.generate_button.config(state="normal")
 
     def _init_gui(self):
         # Create Frames for better layout management
@@ -124,7 +348,7 @@ class VerbConjugationApp():
         self.edit_definition_button = ttk.Button(
             top_frame,
             text="Edit Definition",
-            command=lambda: edit_definition(self.current_verb_data, self.root)
+            command=self.edit_definition
         )
         self.edit_definition_button.grid(row=0, column=2, padx=5, pady=5)
 
@@ -163,6 +387,14 @@ class VerbConjugationApp():
         )
         self.select_verbs_button.grid(row=0, column=6, padx=5, pady=5)
 
+        # Progress indicator shown while verbs load in the background
+        self.loading_label = ttk.Label(top_frame, text="Loading verbs...")
+        self.loading_label.grid(row=0, column=7, padx=5, pady=5)
+        self.loading_progress = ttk.Progressbar(top_frame, mode='determinate', maximum=1.0, length=120)
+        self.loading_progress.grid(row=0, column=8, padx=5, pady=5)
+        self.loading_label.grid_remove()
+        self.loading_progress.grid_remove()
+
         # === Top Frame: Verb Forms Selection ===
 
         # **Added RadioButtons for selecting dialect**
@@ -212,6 +444,10 @@ class VerbConjugationApp():
             'dictionary_form': tk.BooleanVar(value=True),  # Added Dictionary Form
         }
 
+        # Keep the quiz engine in step with the checkboxes
+        for tense, var in self.selected_tenses.items():
+            var.trace_add('write', lambda *args, tense=tense: self.on_quiz_tense_toggled(tense))
+
         # Create Checkbuttons for each verb form
         # Checkbuttons allow user to select/deselect verb forms
         # on which they will be tested.
@@ -401,13 +637,17 @@ class VerbConjugationApp():
         for rb in radio_buttons:
             rb.config(state="disabled")
 
+    def on_quiz_tense_toggled(self, tense):
+        self.engine.set_tense_selected(tense, self.selected_tenses[tense].get())
+
+    def on_verb_selection_changed(self, verb, selected):
+        self.engine.set_verb_selected(verb, selected)
+
     def select_all_verbs(self):
-        for var in self.verb_selection_vars.values():
-            var.set(True)
+        self.engine.set_all_verbs_selected(True)
 
     def deselect_all_verbs(self):
-        for var in self.verb_selection_vars.values():
-            var.set(False)
+        self.engine.set_all_verbs_selected(False)
 
     def select_verbs(self):
         """
@@ -433,57 +673,59 @@ class VerbConjugationApp():
         button_frame = ttk.Frame(verb_selection_window)
         button_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
 
-        select_all_button = ttk.Button(button_frame, text="Select All", command=self.select_all_verbs)
+        select_all_button = ttk.Button(button_frame, text="Select All",
+                                       command=lambda: (self.select_all_verbs(), verb_list.refresh()))
         select_all_button.pack(side=tk.LEFT, padx=5)
 
-        deselect_all_button = ttk.Button(button_frame, text="Deselect All", command=self.deselect_all_verbs)
+        deselect_all_button = ttk.Button(button_frame, text="Deselect All",
+                                         command=lambda: (self.deselect_all_verbs(), verb_list.refresh()))
         deselect_all_button.pack(side=tk.LEFT, padx=5)
 
         show_definitions_var = tk.BooleanVar(value=True)  # Default is True (definitions are shown)
+        pending_search = [None]  # after() id of the debounced search
+        shown_verbs = [self.verbs]  # The verb list the items of the list index
+
+        def display_text(idx):
+            verb_data = shown_verbs[0][idx]
+            verb = verb_data['verb']
+            if not show_definitions_var.get():
+                return verb
+            # Shorten the definition
+            definition = textwrap.shorten(verb_data.get('definition', ''), width=35, placeholder='...')
+            return f"{verb} - {definition}"
+
+        def is_checked(idx):
+            return shown_verbs[0] is self.verbs and self.engine.selection[idx]
+
+        def toggle_verb(idx, selected):
+            if shown_verbs[0] is not self.verbs:
+                # A different file was loaded: the item belongs to the old verb list
+                update_displayed_verbs()
+                return
+            self.on_verb_selection_changed(self.verbs[idx]['verb'], selected)
+            # Other entries with the same dictionary form follow; show them if visible
+            verb_list.refresh()
 
-        # Function to update displayed verbs
-        def update_displayed_verbs(*args):
-            search_term = search_var.get().lower()
-            for child in frame.winfo_children():
-                child.destroy()
+        # Only the visible rows have widgets, so opening and filtering do not depend on the verb count
+        verb_list = VirtualCheckList(verb_selection_window, display_text, is_checked, toggle_verb)
 
+        # Function to update displayed verbs
+        def update_displayed_verbs():
+            pending_search[0] = None
+            if not verb_list.winfo_exists():
+                return  # The dialog was closed while a search was pending
+            shown_verbs[0] = self.verbs
+            if self.verb_search_index is None:
+                self.verb_search_index = VerbSearchIndex([verb_data['verb'] for verb_data in self.verbs])
             # Increase the number of columns if the definitions are hidden
-            if show_definitions_var.get():
-                num_columns = 3
-            else:
-                num_columns = 9
-
-            filtered_verbs = sorted(
-                [verb_data for verb_data in self.verbs if search_term in verb_data['verb'].lower()],
-                key=lambda vd: vd['verb'].lower()
-            )
-
-            verbs_per_column = len(filtered_verbs) // num_columns + 1
+            verb_list.set_columns(3 if show_definitions_var.get() else 9)
+            verb_list.set_items(self.verb_search_index.search(search_var.get()))
 
-            for idx, verb_data in enumerate(filtered_verbs):
-                verb = verb_data['verb']
-                if show_definitions_var.get():
-                    # Shorten the definition
-                    definition = verb_data.get('definition', '')
-                    definition = textwrap.shorten(definition, width=35, placeholder='...')
-                    display_text = f"{verb} - {definition}"
-                else:
-                    display_text = verb
-                var = self.verb_selection_vars.get(verb, tk.BooleanVar(value=True))
-                self.verb_selection_vars[verb] = var
-
-                # Use tk.Checkbutton to enable text wrapping
-                cb = tk.Checkbutton(
-                    frame,
-                    text=display_text,
-                    variable=var,
-                    wraplength=300,
-                    justify='left',
-                    anchor='w'  # Align text to the left within the checkbutton
-                )
-                row = idx % verbs_per_column
-                column = idx // verbs_per_column
-                cb.grid(row=row, column=column, sticky='w', padx=5, pady=2)
+        def schedule_update(*args):
+            # Debounce typing: filter once the user pauses
+            if pending_search[0] is not None:
+                verb_selection_window.after_cancel(pending_search[0])
+            pending_search[0] = verb_selection_window.after(VERB_SEARCH_DEBOUNCE_MS, update_displayed_verbs)
 
         show_definitions_checkbutton = ttk.Checkbutton(
             button_frame,
@@ -496,24 +738,19 @@ class VerbConjugationApp():
         save_button = ttk.Button(button_frame, text="Save Selection", command=verb_selection_window.destroy)
         save_button.pack(side=tk.RIGHT, padx=5)
 
-        # Create a canvas with scrollbar for the list of verbs
-        canvas = tk.Canvas(verb_selection_window)
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        scrollbar = ttk.Scrollbar(verb_selection_window, orient=tk.VERTICAL, command=canvas.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        canvas.configure(yscrollcommand=scrollbar.set)
+        verb_list.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        frame = ttk.Frame(canvas)
-        canvas.create_window((0, 0), window=frame, anchor='nw')
+        search_var.trace_add('write', schedule_update)
 
-        frame.bind("<Configure>", lambda event: canvas.configure(scrollregion=canvas.bbox("all")))
+        # Loading a file while the dialog is open resets the list
+        self._verb_selection_updates.append(update_displayed_verbs)
 
-        # search_var.trace_add('write', lambda *args: update_displayed_verbs())
-        # show_definitions_var.trace_add('write', lambda *args: update_displayed_verbs())
+        def on_destroy(event):
+            # Child widgets report their own Destroy events to the window's bindings
+            if event.widget is verb_selection_window:
+                self._verb_selection_updates.remove(update_displayed_verbs)
 
-        search_var.trace_add('write', update_displayed_verbs)
-        show_definitions_var.trace_add('write', update_displayed_verbs)
+        verb_selection_window.bind('<Destroy>', on_destroy)
 
         # Initially display all verbs
         update_displayed_verbs()
@@ -521,61 +758,42 @@ class VerbConjugationApp():
     def load_custom_verb_data(self):
         """
         Open a file dialog for the user to select a custom verb data file.
-        Load verbs from the selected file.
+        Load verbs from the selected file in the background.
         """
+        from tkinter import filedialog
+
         file_path = filedialog.askopenfilename(
             title="Select Verb Data File",
             filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
         )
         if file_path:
-            try:
-                # Load verbs from the selected file
-                self.verbs = load_verbs(custom_path=file_path)
-                # **Reset verb selection variables**
-                self.verb_selection_vars = {}
-                for verb_data in self.verbs:
-                    verb = verb_data['verb']
-                    self.verb_selection_vars[verb] = tk.BooleanVar(value=True)
-                self.current_paradigm = None  # Reset current paradigm
-                self.current_verb_data = None  # Reset current verb data
-                messagebox.showinfo("Success", f"Successfully loaded verb data from '{os.path.basename(file_path)}'.")
-                logging.debug(f"Loaded verbs from custom file: {file_path}")
-
-                # Clear any existing questions and UI elements
-                self.output_text.config(state='normal')
-                self.output_text.delete('1.0', tk.END)
-                self.output_text.config(state='disabled')
-
-                self.verb_entry.delete(0, tk.END)
-
-                self.result_text.config(state='normal')
-                self.result_text.delete('1.0', tk.END)
-                self.result_text.config(state='disabled')
-
-                self.user_tense_var.set('')
-                self.user_form_marker_var.set('')
-                self.user_form_var.set('')
-
-                # Disable form buttons and check answer button
-                self._disable_radio_buttons(self.form_radio_buttons)
-                self._disable_radio_buttons(self.form_marker_radio_buttons)
-                self.check_answer_button.config(state="disabled")
+            self.start_loading_verbs(custom_path=file_path)
+
+    def _clear_question(self):
+        """
+        Clear any existing question and reset the answer inputs.
+        """
+        self.output_text.config(state='normal')
+        self.output_text.delete('1.0', tk.END)
+        self.output_text.config(state='disabled')
+
+        self.verb_entry.delete(0, tk.END)
+
+        self.result_text.config(state='normal')
+        self.result_text.delete('1.0', tk.END)
+        self.result_text.config(state='disabled')
 
-                # Hide pronunciation buttons
-                self.pronunciation_frame.grid_remove()
-
-            except FileNotFoundError as e:
-                logging.error(f"Custom data file not found: {e}")
-                messagebox.showerror("Error", f"Custom data file not found: {e}")
-            except json.JSONDecodeError:
-                logging.error("Selected file is not a valid JSON.")
-                messagebox.showerror("Error", "The selected file is not a valid JSON.")
-            except KeyError as e:
-                logging.error(f"Missing key {e} in the selected JSON file.")
-                messagebox.showerror("Error", f"Missing key {e} in the selected JSON file.")
-            except Exception as e:
-                logging.error(f"Error loading custom verb data: {e}")
-                messagebox.showerror("Error", f"An error occurred while loading the file: {e}")
+        self.user_tense_var.set('')
+        self.user_form_marker_var.set('')
+        self.user_form_var.set('')
+
+        # Disable form buttons and check answer button
+        self._disable_radio_buttons(self.form_radio_buttons)
+        self._disable_radio_buttons(self.form_marker_radio_buttons)
+        self.check_answer_button.config(state="disabled")
+
+        # Hide pronunciation buttons
+        self.pronunciation_frame.grid_remove()
 
     def update_frozen_label(self, *args):
         if self.freeze_verb_var.get():
@@ -584,287 +802,139 @@ class VerbConjugationApp():
             self.frozen_label.grid_remove()
 
     def display_random_form(self):
-        if not self.verbs:
-            messagebox.showwarning("No Verbs Loaded", "No verbs are loaded. Please load a verb data file first.")
-            return
         try:
-            # Retrieve selected tenses from checkboxes
-            selected_tenses = [tense for tense, var in self.selected_tenses.items() if var.get()]
-            if not selected_tenses:
-                messagebox.showwarning("No Forms Selected", "Please select at least one verb form to test on.")
-                return
-            logging.debug(f"Selected Tenses for Quiz: {selected_tenses}")
+            # **Draw a form of a random selected verb, or of the current verb if it is frozen**
+            question = self.engine.next_question(frozen=self.freeze_verb_var.get())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Paradigm cache: %s", paradigm_cache.cache_info())
+        except QuizError as qe:
+            logger.warning("No question drawn: %s", qe)
+            messagebox.showwarning(qe.title, str(qe))
+            return
+        except ValueError as ve:
+            logger.error("ValueError in display_random_form: %s", ve)
+            messagebox.showerror("Error", f"An error occurred: {ve}")
+            return
+        except Exception as e:
+            logger.exception("Unexpected error in display_random_form: %s", e)
+            messagebox.showerror("Error", f"An unexpected error occurred: {e}")
+            return
 
-            # Check if only "Dictionary Form" is selected
-            self.only_dictionary_form_selected = len(selected_tenses) == 1 and 'dictionary_form' in selected_tenses
+        self.question = question
+        self.audio_prefetcher.prefetch(question.verb)
 
+        # Display the question to the user
+        self.output_text.config(state='normal')
+        self.output_text.delete('1.0', tk.END)
+        self.output_text.insert(tk.END, question.prompt)
+        self.output_text.config(state='disabled')
 
-            # **Get the selected dialect**
-            selected_dialect = self.dialect_var.get()
-            logging.debug(f"Selected Dialect: {selected_dialect}")
+        # Clear the result_text widget
+        self.result_text.config(state='normal')
+        self.result_text.delete('1.0', tk.END)
+        self.result_text.config(state='disabled')
 
-            # **Get the list of selected verbs**
-            selected_verbs = [verb_data for verb_data in self.verbs if
-                              self.verb_selection_vars.get(verb_data['verb'], tk.BooleanVar(value=True)).get()]
-            if not selected_verbs:
-                messagebox.showwarning("No Verbs Selected", "Please select at least one verb to include in the quiz.")
-                return
-            logging.debug(f"Number of Selected Verbs: {len(selected_verbs)}")
-
-            # **Determine Whether to Use a Frozen Verb or Select a New One**
-            if self.freeze_verb_var.get() and self.current_verb_data:
-                # Use the currently frozen verb
-                verb_data = self.current_verb_data
-                verb = verb_data['verb']
-                definition = verb_data.get('definition', '')
-                logging.debug(f"Using frozen verb: {verb}")
-            else:
-                # Select a new random verb from selected verbs
-                verb_data = random.choice(selected_verbs)
-                verb = verb_data['verb']
-                definition = verb_data.get('definition', '')
-                logging.debug(f"Selected Random Verb: {verb}")
-
-                # **Update the Current Verb Data Only If Not Frozen**
-                if not self.freeze_verb_var.get():
-                    self.current_verb_data = verb_data
-                    logging.debug(f"Set current_verb_data to: {verb}")
-
-            # Step 2: Generate the full paradigm with the selected dialect
-            paradigm_data = generate_full_paradigm(verb_data, dialect=selected_dialect)
-            self.current_paradigm = paradigm_data  # Save the paradigm
-            logging.debug(f"Generated Paradigm: {json.dumps(paradigm_data, indent=2)}")
-
-            # Step 3: Select a random form from the paradigm
-            # Flatten the paradigm to a list of (tense, pronoun, form_entry)
-            forms_list = []
-            for tense, conjugations in paradigm_data.items():
-                if tense not in selected_tenses:
-                    continue  # Skip tenses not selected
-                logging.debug(f"Processing Tense: {tense}")
-                for pronoun, forms in conjugations.items():
-                    for form_entry in forms:
-                        forms_list.append((tense, pronoun, form_entry))
-
-            # Safely retrieve 'verbal_nouns' and 'verbal_adjectives' from verb_data
-            verbal_nouns = verb_data.get("verbal_nouns", [])
-            verbal_adjectives = verb_data.get("verbal_adjectives", [])
-
-            # Optional: Validate that they are lists and check if their tenses are selected
-            if isinstance(verbal_nouns, list) and 'verbal_noun' in selected_tenses:
-                for form in verbal_nouns:
-                    forms_list.append(('verbal_noun', 'verbal_noun', form))
-            else:
-                if not isinstance(verbal_nouns, list):
-                    logging.warning(f"'verbal_nouns' is not a list in verb_data: {verb_data}")
+        # Clear the verb entry
+        self.verb_entry.config(state='normal')
+        self.verb_entry.delete(0, tk.END)
 
-            if isinstance(verbal_adjectives, list) and 'verbal_adjective' in selected_tenses:
-                for form in verbal_adjectives:
-                    forms_list.append(('verbal_adjective', 'verbal_adjective', form))
-            else:
-                if not isinstance(verbal_adjectives, list):
-                    logging.warning(f"'verbal_adjectives' is not a list in verb_data: {verb_data}")
-
-            # Include dictionary form if selected
-            if 'dictionary_form' in selected_tenses:
-                forms_list.append(('dictionary_form', 'dictionary_form', verb_data['verb']))
-
-            logging.debug(f"Total Forms Collected: {len(forms_list)}")
-            if not forms_list:
-                logging.warning("No forms found for the selected tenses.")
-                messagebox.showwarning("No Forms Available",
-                                       "No verb forms found for the selected tenses. Please try selecting different tenses or load a different verb.")
-                return
+        # Clear user's selections
+        self.user_tense_var.set('')
+        self.user_form_marker_var.set('')
+        self.user_form_var.set('')
 
-            selected_tense, selected_pronoun, selected_form_entry = random.choice(forms_list)
-            logging.debug(
-                f"Selected Form: Tense='{selected_tense}', Pronoun='{selected_pronoun}', Form='{selected_form_entry}'")
-
-            # Handle different lengths of form_entry
-            if isinstance(selected_form_entry, list) or isinstance(selected_form_entry, tuple):
-                if len(selected_form_entry) == 3:
-                    form, form_type, form_marker = selected_form_entry
-                elif len(selected_form_entry) == 2:
-                    form, form_type = selected_form_entry
-                    form_marker = ''
-                else:
-                    form = selected_form_entry
-                    form_type = ''
-                    form_marker = ''
-            else:
-                form = selected_form_entry
-                form_type = ''
-                form_marker = ''
-
-            if self.only_dictionary_form_selected:
-                # Display the verb
-                self.output_text.config(state='normal')
-                self.output_text.delete('1.0', tk.END)
-                self.output_text.insert(tk.END, f"Recall the definition for the verb:\n\n{self.correct_verb}\n")
-                self.output_text.config(state='disabled')
-
-                # Disable all input fields
-                self.verb_entry.delete(0, tk.END)
-                self.verb_entry.config(state='disabled')
-                self._disable_radio_buttons(self.tense_radio_buttons)
-                self._disable_radio_buttons(self.form_marker_radio_buttons)
-                self._disable_radio_buttons(self.form_radio_buttons)
+        if question.recall_only:
+            # Disable all input fields
+            self.verb_entry.config(state='disabled')
+            self._disable_radio_buttons(self.tense_radio_buttons)
+            self._disable_radio_buttons(self.form_marker_radio_buttons)
+            self._disable_radio_buttons(self.form_radio_buttons)
 
+            # Enable 'Check Answer' button
+            self.check_answer_button.config(state="normal")
+        else:
+            # Adjust GUI based on tense
+            # Verbal nouns, verbal adjectives and dictionary forms have no form markers or pronouns
+            if not question.has_form:
+                # Disable form buttons and form marker radio buttons
+                self._disable_radio_buttons(self.form_radio_buttons)
+                self._disable_radio_buttons(self.form_marker_radio_buttons)
                 # Enable 'Check Answer' button
                 self.check_answer_button.config(state="normal")
             else:
+                # Enable form marker radio buttons
+                self._enable_radio_buttons(self.form_marker_radio_buttons)
+                # Disable form buttons initially
+                self._disable_radio_buttons(self.form_radio_buttons)
+                # Disable 'Check Answer' button
+                self.check_answer_button.config(state="disabled")
 
-                # Display the form to the user
-                self.output_text.config(state='normal')
-                self.output_text.delete('1.0', tk.END)
-                self.output_text.insert(tk.END, f"Identify the verb, tense, form, and type:\n\n{form}\n")
-                self.output_text.config(state='disabled')
-
-                # Clear the result_text widget
-                self.result_text.config(state='normal')
-                self.result_text.delete('1.0', tk.END)
-                self.result_text.config(state='disabled')
-
-                # Clear the verb entry
-                self.verb_entry.delete(0, tk.END)
-
-                # Store the correct answers for later comparison
-                self.correct_verb = verb
-                self.correct_definition = definition
-                self.correct_pronoun = selected_pronoun
-                self.correct_form_type = form_type
-                self.correct_tense = selected_tense
-                self.correct_form_marker = form_marker
-                self.current_conjugations = paradigm_data  # Update current conjugations
-                self.current_verb_data = verb_data  # Store verb data for later use
-
-                # Clear user's selections
-                self.user_tense_var.set('')
-                self.user_form_marker_var.set('')
-                self.user_form_var.set('')
-
-                # Adjust GUI based on tense
-                # These are conditions that check if the selected tense
-                # is one that doesn't require form markers or pronouns
-                if selected_tense in ['verbal_noun', 'verbal_adjective', 'dictionary_form']:
-                    # Disable form buttons and form marker radio buttons
-                    self._disable_radio_buttons(self.form_radio_buttons)
-                    self._disable_radio_buttons(self.form_marker_radio_buttons)
-                    # Enable 'Check Answer' button
-                    self.check_answer_button.config(state="normal")
-                else:
-                    # Enable form marker radio buttons
-                    self._enable_radio_buttons(self.form_marker_radio_buttons)
-                    # Disable form buttons initially
-                    self._disable_radio_buttons(self.form_radio_buttons)
-                    # Disable 'Check Answer' button
-                    self.check_answer_button.config(state="disabled")
-
-                # Enable tense radio buttons
-                self._enable_radio_buttons(self.tense_radio_buttons)
-
-            # Hide pronunciation buttons
-            self.pronunciation_frame.grid_remove()
+            # Enable tense radio buttons
+            self._enable_radio_buttons(self.tense_radio_buttons)
 
-        except ValueError as ve:
-            logging.error(f"ValueError in display_random_form: {ve}")
-            messagebox.showerror("Error", f"An error occurred: {ve}")
-        except Exception as e:
-            logging.error(f"Unexpected error in display_random_form: {e}")
-            messagebox.showerror("Error", f"An unexpected error occurred: {e}")
+        # Hide pronunciation buttons
+        self.pronunciation_frame.grid_remove()
 
     def show_all_forms(self) -> None:
         """
         Show all forms of the current verb by using the saved paradigm.
         """
         # Check if a paradigm has been generated
-        if not self.current_paradigm or not self.current_verb_data:
+        if not self.engine.current_paradigm or not self.engine.current_verb_data:
             messagebox.showinfo("No Verb Selected", "Please generate a verb form first.")
             return
 
         try:
             # Use the saved paradigm_data
-            paradigm_data = self.current_paradigm
-            logging.debug(f"Using Saved Paradigm: {paradigm_data}")
+            paradigm_data = self.engine.current_paradigm
+            # Formatted only if DEBUG is enabled for this module
+            logger.debug("Using Saved Paradigm: %s", paradigm_data)
 
-            # Display the paradigm
-            display_paradigm(self.root, self.current_verb_data, paradigm_data)
+            # Display the paradigm; the window is loaded on first use to keep startup short
+            from app.paradigm_display import display_paradigm
+            display_paradigm(self.root, self.engine.current_verb_data, paradigm_data)
         except Exception as e:
-            logging.error(f"Error in show_all_forms: {e}")
+            logger.exception("Error in show_all_forms: %s", e)
             messagebox.showerror("Error", f"An error occurred while showing all forms: {e}")
 
     def check_answer(self):
 
-        # Check if correct_verb is set
-        if not self.correct_verb:
+        # Check if a question has been drawn
+        if not self.question:
             messagebox.showinfo("No Verb Generated", "Please generate a verb form first.")
             return
 
         # Get user inputs
-        user_verb = self.verb_entry.get().strip()
-        user_tense = self.user_tense_var.get()
-        user_form_marker = self.user_form_marker_var.get() # e.g. Unmarked, Negative, Interrogative
-        user_pronoun = self.user_form_var.get()
+        answer = Answer(
+            verb=self.verb_entry.get().strip(),
+            tense=self.user_tense_var.get(),
+            form_marker=self.user_form_marker_var.get(),  # e.g. Unmarked, Negative, Interrogative
+            pronoun=self.user_form_var.get(),
+        )
+        logger.debug("User Tense: '%s' | Correct Tense: '%s'", answer.tense, self.question.tense)
+        result = self.engine.check_answer(self.question, answer)
 
         # Clear the result_text widget
         self.result_text.config(state='normal')
         self.result_text.delete('1.0', tk.END)
 
-        # Initialize feedback
-        feedback = []
+        # Display feedback
+        for message, tag in result.feedback:
+            self.result_text.insert(tk.END, message + "\n", tag)
 
-        if self.only_dictionary_form_selected:
-            pass
-        else:
-
-            # Check verb correctness
-            if user_verb.lower() == self.correct_verb.lower(): # Case-Insensitive Check
-                feedback.append((f"Correct: Verb ({self.correct_verb})", 'correct'))
-            else:
-                feedback.append((f"Incorrect: Verb (Correct: '{self.correct_verb}')", 'incorrect'))
-
-            # Log the values for debugging
-            logging.debug(f"User Tense: '{user_tense}' | Correct Tense: '{self.correct_tense}'")
-
-            # Check tense correctness
-            if user_tense.lower() == self.correct_tense.lower(): # Case-Insensitive Check
-                feedback.append((f"Correct: Tense '{self.correct_tense}'", 'correct'))
-            else:
-                feedback.append((f"Incorrect: Tense (Correct: '{self.correct_tense}')", 'incorrect'))
-
-            # Check pronoun and form marker based on tense type
-            # These tense types don't have pronouns or form markers to check.
-            if self.correct_tense.lower() in ['verbal_noun', 'verbal_adjective', 'dictionary_form']:
-                # No form marker or pronoun to check
-                pass
-            else:
-                # Check pronoun/form type
-                pronoun_match = False
-                if user_pronoun == self.correct_pronoun:
-                    pronoun_match = True
-                elif self.correct_pronoun in ['relative1', 'relative2'] and user_pronoun == 'relative':
-                    pronoun_match = True
-                elif user_pronoun == self.correct_form_type:
-                    pronoun_match = True
-
-                if pronoun_match:
-                    feedback.append((f"Correct: Form [{self.correct_pronoun}]", 'correct'))
-                else:
-                    feedback.append((f"Incorrect: Form (Correct: [{self.correct_pronoun}])", 'incorrect'))
-
-                # Check form marker
-                if user_form_marker == self.correct_form_marker:
-                    feedback.append((f"Correct: Form Type '{self.correct_form_marker}'", 'correct'))
+        # Other analyses that produce the same form
+        if result.alternatives:
+            self.result_text.insert(tk.END, "\nThis form can also be:\n", 'bold')
+            for analysis in result.alternatives:
+                if analysis.form_marker:
+                    description = f"{analysis.tense} [{analysis.pronoun}] '{analysis.form_marker}'"
                 else:
-                    feedback.append((f"Incorrect: Form Type (Correct: '{self.correct_form_marker}')", 'incorrect'))
-
-            # Display feedback
-            for message, tag in feedback:
-                self.result_text.insert(tk.END, message + "\n", tag)
+                    description = analysis.tense
+                self.result_text.insert(tk.END, f"{analysis.verb}: {description}\n", 'info')
 
         # Display the definition if available
-        if self.correct_definition:
-            self.result_text.insert(tk.END, f"\nDefinition: {self.correct_definition}", 'info')
+        if result.definition:
+            self.result_text.insert(tk.END, f"\nDefinition: {result.definition}", 'info')
         else:
             self.result_text.insert(tk.END, "No definition available.", 'info')
 
@@ -899,10 +969,10 @@ class VerbConjugationApp():
 
     def on_verb_entry_change(self, *args):
         entry_content = self.verb_entry_var.get()
-        if not self.correct_verb or self.only_dictionary_form_selected:
+        if not self.question or self.question.recall_only:
             return
         if entry_content.strip() and self.user_tense_var.get():
-            if self.correct_tense.lower() in ['verbal_noun', 'verbal_adjective', 'dictionary_form']:
+            if not self.question.has_form:
                 # Enable the 'Check Answer' button
                 self.check_answer_button.config(state="normal")
                 # Disable form buttons
@@ -923,10 +993,10 @@ class VerbConjugationApp():
             self.check_answer_button.config(state="disabled")
 
     def on_tense_selected(self, *args):
-        if not self.correct_verb or self.only_dictionary_form_selected:
+        if not self.question or self.question.recall_only:
             return
         if self.verb_entry_var.get().strip() and self.user_tense_var.get():
-            if self.correct_tense.lower() in ['verbal_noun', 'verbal_adjective', 'dictionary_form']:
+            if not self.question.has_form:
                 # Enable the 'Check Answer' button
                 self.check_answer_button.config(state="normal")
                 # Disable form buttons
@@ -947,7 +1017,7 @@ class VerbConjugationApp():
             self.check_answer_button.config(state="disabled")
 
     def on_form_marker_selected(self, *args):
-        if not self.correct_verb or self.only_dictionary_form_selected:
+        if not self.question or self.question.recall_only:
             return
         if self.verb_entry_var.get().strip() and self.user_tense_var.get() and self.user_form_marker_var.get():
             # Enable form buttons
@@ -961,7 +1031,7 @@ class VerbConjugationApp():
             self.check_answer_button.config(state="disabled")
 
     def on_form_selected(self, *args):
-        if not self.correct_verb or self.only_dictionary_form_selected:
+        if not self.question or self.question.recall_only:
             return
         if self.verb_entry_var.get().strip() and self.user_tense_var.get() and self.user_form_var.get():
             # Enable 'Check Answer' button
@@ -976,6 +1046,14 @@ class VerbConjugationApp():
     def play_munster_audio(self):
         self.play_audio('M')
 
+    def edit_definition(self) -> None:
+        """
+        Open the Edit Definition dialog for the current verb.
+        """
+        # Loaded on first use to keep startup short
+        from app.utils.definition_utility import edit_definition
+        edit_definition(self.engine.current_verb_data, self.root, self.data_file)
+
     def play_connacht_audio(self):
         self.play_audio('C')
 
@@ -983,38 +1061,21 @@ class VerbConjugationApp():
         threading.Thread(target=self._play_audio_thread, args=(dialect_code,), daemon=True).start()
 
     def _play_audio_thread(self, dialect_code):
-        import requests
-        import urllib.parse
         from playsound import playsound
-        import tempfile
-        import os
 
         try:
-            verb = self.correct_verb
-            encoded_verb = urllib.parse.quote(verb)
-            if dialect_code == 'U':
-                url = f'https://www.teanglann.ie/CanU/{encoded_verb}.mp3'
-            elif dialect_code == 'M':
-                url = f'https://www.teanglann.ie/CanM/{encoded_verb}.mp3'
-            elif dialect_code == 'C':
-                url = f'https://www.teanglann.ie/CanC/{encoded_verb}.mp3'
-            else:
-                raise ValueError(f"Unknown dialect code: {dialect_code}")
-            # Download the mp3 file
-            response = requests.get(url)
-            if response.status_code == 200:
-                # Save to a temp file
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as temp_file:
-                    temp_file.write(response.content)
-                    temp_file.flush()  # Ensure data is written
-                    temp_file_name = temp_file.name
+            verb = self.question.verb
+            # Download the mp3 file, or reuse the cached copy
+            audio_path = self.audio_prefetcher.get(verb, dialect_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Audio prefetch: %s, hit rate %.0f%%", self.audio_prefetcher.prefetch_info(),
+                             self.audio_prefetcher.hit_rate() * 100)
+            if audio_path is not None:
                 # Play the audio file
-                playsound(temp_file_name)
-                # Remove the temp file after playing
-                os.remove(temp_file_name)
+                playsound(audio_path)
             else:
                 self.root.after(0, messagebox.showerror, "Error", f"Audio file not found for '{verb}' in dialect '{dialect_code}'")
         except Exception as e:
-            logging.error(f"Error playing audio: {e}")
+            logger.error("Error playing audio: %s", e)
             # Since we're in a thread, need to use tkinter's thread-safe method to show messagebox
             self.root.after(0, messagebox.showerror, "Error", f"An error occurred while playing audio: {e}")
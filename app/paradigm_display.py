@@ -3,6 +3,8 @@ from tkinter import ttk, messagebox, filedialog
 from typing import Dict, Any
 import logging
 
+logger = logging.getLogger(__name__)
+
 
 
 def display_paradigm(root:tk.Tk, verb_data: Dict[str, Any], paradigm_data: Dict[str, Any]) -> None:
@@ -105,48 +107,73 @@ def display_paradigm(root:tk.Tk, verb_data: Dict[str, Any], paradigm_data: Dict[
         notebook = ttk.Notebook(main_frame)
         notebook.pack(fill=tk.BOTH, expand=True)
 
-        # Display forms for each tense
-        for tense_name, conjugations in paradigm_data.items():
+        # Create one tab per tense. The forms of a tense are only inserted (and, for a
+        # lazy paradigm, only conjugated) the first time its tab is opened.
+        tense_tabs = {}
+        for tense_name in paradigm_data:
             # Create a frame for each tense
             tense_frame = ttk.Frame(notebook)
             notebook.add(tense_frame, text=f"{tense_name.title()} Tense")
-
-            # Create a scrollbar for the text widget
-            scrollbar = ttk.Scrollbar(tense_frame)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-            # Display the forms in the text widget
-            forms_text = tk.Text(tense_frame, wrap='word', yscrollcommand=scrollbar.set)
-            forms_text.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
-
-            # Configure the 'bold' tag for the forms_text widget
-            forms_text.tag_configure('bold', font=('Arial', 10, 'bold'))
-
-            # Insert all forms into the text widget
-            for pronoun, forms in conjugations.items():
-                forms_text.insert(tk.END, f"{pronoun}:\n", 'bold')
-                for form_entry in forms:
-                    # Handle different lengths of form_entry
-                    if isinstance(form_entry, (list, tuple)):
-                        if len(form_entry) == 3:
-                            form, form_type, form_marker = form_entry
-                            forms_text.insert(tk.END, f"  - {form} ({form_type}, {form_marker})\n")
-                        elif len(form_entry) == 2:
-                            form, form_type = form_entry
-                            forms_text.insert(tk.END, f"  - {form} ({form_type})\n")
-                        else:
-                            forms_text.insert(tk.END, f"  - {form_entry}\n")
-                    else:
-                        forms_text.insert(tk.END, f"  - {form_entry}\n")
-                forms_text.insert(tk.END, "\n")
-            forms_text.config(state='disabled')  # Make the text read-only
-
-            # Configure the scrollbar
-            scrollbar.config(command=forms_text.yview)
+            tense_tabs[str(tense_frame)] = (tense_frame, tense_name)
+
+        def populate_tab(event=None):
+            selected_tab = notebook.select()
+            if selected_tab not in tense_tabs:
+                return
+            tense_frame, tense_name = tense_tabs.pop(selected_tab)
+            try:
+                _fill_tense_frame(tense_frame, paradigm_data[tense_name])
+            except Exception as e:
+                logger.error("Error displaying tense '%s': %s", tense_name, e)
+                messagebox.showerror("Error", f"An error occurred while displaying the {tense_name} tense: {e}")
+            forms_window.update_idletasks()
 
         # **Bind the <<NotebookTabChanged>> Event**
-        notebook.bind("<<NotebookTabChanged>>", lambda event: forms_window.update_idletasks())
+        notebook.bind("<<NotebookTabChanged>>", populate_tab)
+        populate_tab()
 
     except Exception as e:
-        logging.error(f"Error in display_paradigm: {e}")
-        messagebox.showerror("Error", f"An error occurred while displaying the paradigm: {e}")
\ No newline at end of file
+        logger.exception("Error in display_paradigm: %s", e)
+        messagebox.showerror("Error", f"An error occurred while displaying the paradigm: {e}")
+
+
+def _fill_tense_frame(tense_frame: ttk.Frame, conjugations: Dict[str, Any]) -> None:
+    """
+    Insert the forms of one tense into its notebook tab.
+
+    Args:
+        tense_frame (ttk.Frame): The notebook tab for the tense.
+        conjugations (dict): The conjugations of the tense, keyed by pronoun.
+    """
+    # Create a scrollbar for the text widget
+    scrollbar = ttk.Scrollbar(tense_frame)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    # Display the forms in the text widget
+    forms_text = tk.Text(tense_frame, wrap='word', yscrollcommand=scrollbar.set)
+    forms_text.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+
+    # Configure the 'bold' tag for the forms_text widget
+    forms_text.tag_configure('bold', font=('Arial', 10, 'bold'))
+
+    # Insert all forms into the text widget
+    for pronoun, forms in conjugations.items():
+        forms_text.insert(tk.END, f"{pronoun}:\n", 'bold')
+        for form_entry in forms:
+            # Handle different lengths of form_entry
+            if isinstance(form_entry, (list, tuple)):
+                if len(form_entry) == 3:
+                    form, form_type, form_marker = form_entry
+                    forms_text.insert(tk.END, f"  - {form} ({form_type}, {form_marker})\n")
+                elif len(form_entry) == 2:
+                    form, form_type = form_entry
+                    forms_text.insert(tk.END, f"  - {form} ({form_type})\n")
+                else:
+                    forms_text.insert(tk.END, f"  - {form_entry}\n")
+            else:
+                forms_text.insert(tk.END, f"  - {form_entry}\n")
+        forms_text.insert(tk.END, "\n")
+    forms_text.config(state='disabled')  # Make the text read-only
+
+    # Configure the scrollbar
+    scrollbar.config(command=forms_text.yview)
@@ -0,0 +1,333 @@
+import asyncio
+import json
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, FrozenSet, Optional, Sequence, Tuple
+
+from app.utils.form_index_utility import FormIndex
+from app.utils.quiz_engine_utility import DEFAULT_QUIZ_TENSES, Answer, Question, QuizEngine, QuizError
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 64 * 1024
+
+_REASONS = {200: 'OK', 201: 'Created', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            409: 'Conflict', 413: 'Payload Too Large', 422: 'Unprocessable Entity', 500: 'Internal Server Error'}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class Session:
+    """
+    One learner's quiz: the engine it draws from and its current question.
+    """
+    __slots__ = ('session_id', 'engine_key', 'question', 'last_seen')
+
+    def __init__(self, session_id: str, engine_key: Tuple[str, FrozenSet[str]], now: float):
+        self.session_id = session_id
+        self.engine_key = engine_key
+        self.question: Optional[Question] = None
+        self.last_seen = now
+
+
+class SessionStore:
+    """
+    In-memory sessions that expire `ttl` seconds after their last request.
+
+    Sessions are kept in last-use order, so expiring them only looks at the
+    oldest ones.
+    """
+
+    def __init__(self, ttl: float = 30 * 60, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self, engine_key: Tuple[str, FrozenSet[str]]) -> Session:
+        self.expire()
+        session = Session(secrets.token_urlsafe(16), engine_key, self._clock())
+        self._sessions[session.session_id] = session
+        return session
+
+    def get(self, session_id: str) -> Optional[Session]:
+        """
+        Return a live session and mark it as used, or None if it is unknown or expired.
+        """
+        self.expire()
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.last_seen = self._clock()
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def expire(self) -> int:
+        """
+        Drop the sessions idle for longer than the TTL.
+
+        Returns:
+            int: The number of sessions dropped.
+        """
+        deadline = self._clock() - self.ttl
+        expired = 0
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if session.last_seen > deadline:
+                break
+            del self._sessions[session.session_id]
+            expired += 1
+        return expired
+
+
+class QuizService:
+    """
+    JSON-over-HTTP quiz server running on an asyncio event loop.
+
+    Endpoints:
+        POST /sessions               {"dialect": "O", "tenses": [...]} -> {"session_id", ...}
+        POST /sessions/<id>/question {"frozen": false}                -> question
+        POST /sessions/<id>/answer   {"verb", "tense", "form_marker", "pronoun"} -> feedback
+        GET  /health                                                  -> counts
+
+    Sessions with the same dialect and tenses share one QuizEngine, and engines of
+    the same dialect share one FormIndex. Drawing a question (which may conjugate a
+    tense) runs on a thread pool, so the event loop only parses requests and formats
+    responses.
+    """
+
+    def __init__(self, verbs: Sequence[Dict[str, Any]], session_ttl: float = 30 * 60,
+                 max_workers: int = 4, clock: Callable[[], float] = time.monotonic):
+        self.verbs = list(verbs)
+        self.sessions = SessionStore(session_ttl, clock)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='quiz-service')
+        self._engines: Dict[Tuple[str, FrozenSet[str]], QuizEngine] = {}
+        self._engine_locks: Dict[Tuple[str, FrozenSet[str]], asyncio.Lock] = {}
+        self._form_indices: Dict[str, FormIndex] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._expiry_task: Optional[asyncio.Task] = None
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8080) -> int:
+        """
+        Start listening. Returns the bound port (useful with port 0).
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self._expiry_task = asyncio.create_task(self._expire_periodically())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._expiry_task is not None:
+            self._expiry_task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def serve_forever(self, host: str = '127.0.0.1', port: int = 8080) -> None:
+        port = await self.start(host, port)
+        logger.info("Quiz service listening on http://%s:%d", host, port)
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    # --- Endpoints ---
+
+    async def create_session(self, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        dialect = body.get('dialect', 'O')
+        tenses = body.get('tenses', list(DEFAULT_QUIZ_TENSES))
+        if not isinstance(dialect, str) or not isinstance(tenses, list) \
+                or not all(tense in DEFAULT_QUIZ_TENSES for tense in tenses):
+            raise HTTPError(400, f"'tenses' must be a list of {', '.join(DEFAULT_QUIZ_TENSES)}.")
+        engine_key = (dialect, frozenset(tenses))
+        try:
+            await self._get_engine(engine_key)
+        except KeyError:
+            raise HTTPError(400, f"Unknown dialect: {dialect}")
+        session = self.sessions.create(engine_key)
+        return 201, {'session_id': session.session_id, 'dialect': dialect, 'tenses': sorted(tenses)}
+
+    async def next_question(self, session: Session, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        engine = await self._get_engine(session.engine_key)
+        verb_index = session.question.verb_index if body.get('frozen') and session.question else None
+        loop = asyncio.get_running_loop()
+        try:
+            question = await loop.run_in_executor(self._executor, lambda: engine.next_question(verb_index=verb_index))
+        except QuizError as e:
+            raise HTTPError(422, str(e))
+        session.question = question
+        return 200, {
+            'prompt': question.prompt,
+            'form': question.form,
+            'recall_only': question.recall_only,
+            'has_form': question.has_form,
+            'ambiguous': question.ambiguous,
+        }
+
+    async def check_answer(self, session: Session, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        if session.question is None:
+            raise HTTPError(409, "Ask for a question first.")
+        answer = Answer(**{field: str(body.get(field, '')) for field in Answer._fields})
+        engine = await self._get_engine(session.engine_key)
+        question = session.question
+        result = engine.check_answer(question, answer)
+        return 200, {
+            'correct': result.correct,
+            'feedback': [{'message': message, 'result': tag} for message, tag in result.feedback],
+            'definition': result.definition,
+            'answer': {'verb': question.verb, 'tense': question.tense, 'pronoun': question.pronoun,
+                       'form_type': question.form_type, 'form_marker': question.form_marker},
+            'alternatives': [{'verb': analysis.verb, 'tense': analysis.tense, 'pronoun': analysis.pronoun,
+                              'form_type': analysis.form_type, 'form_marker': analysis.form_marker}
+                             for analysis in result.alternatives],
+        }
+
+    # --- Internals ---
+
+    async def _get_engine(self, engine_key: Tuple[str, FrozenSet[str]]) -> QuizEngine:
+        engine = self._engines.get(engine_key)
+        if engine is not None:
+            return engine
+        lock = self._engine_locks.setdefault(engine_key, asyncio.Lock())
+        try:
+            async with lock:
+                engine = self._engines.get(engine_key)
+                if engine is None:
+                    dialect, tenses = engine_key
+                    engine = QuizEngine(self.verbs, dialect=dialect, selected_tenses=tenses,
+                                        form_index=self._form_indices.get(dialect))
+                    # Building the sampler and form index walks every verb; keep it off the event loop
+                    await asyncio.get_running_loop().run_in_executor(self._executor, engine.prepare)
+                    self._form_indices[dialect] = engine.form_index
+                    self._engines[engine_key] = engine
+        finally:
+            # Once built the engine needs no lock, and a key that failed (e.g. an unknown
+            # dialect) must not keep one; waiters still hold a reference to this one
+            if self._engine_locks.get(engine_key) is lock:
+                del self._engine_locks[engine_key]
+        return engine
+
+    async def _route(self, method: str, path: str, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        parts = [part for part in path.split('?', 1)[0].split('/') if part]
+        if parts == ['health']:
+            if method != 'GET':
+                raise HTTPError(405, "Use GET.")
+            return 200, {'status': 'ok', 'sessions': len(self.sessions), 'verbs': len(self.verbs)}
+        if method != 'POST':
+            raise HTTPError(405, "Use POST.")
+        if parts == ['sessions']:
+            return await self.create_session(body)
+        if len(parts) == 3 and parts[0] == 'sessions' and parts[2] in ('question', 'answer'):
+            session = self.sessions.get(parts[1])
+            if session is None:
+                raise HTTPError(404, "Unknown or expired session.")
+            if parts[2] == 'question':
+                return await self.next_question(session, body)
+            return await self.check_answer(session, body)
+        raise HTTPError(404, f"No such endpoint: {path}")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': "Malformed request line."}, keep_alive=False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version.upper() == 'HTTP/1.1')
+
+                try:
+                    length = int(headers.get('content-length', 0))
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    await self._respond(writer, 400, {'error': "Invalid Content-Length."}, keep_alive=False)
+                    break
+
+                try:
+                    if length > MAX_BODY_BYTES:
+                        raise HTTPError(413, "Request body too large.")
+                    raw_body = await reader.readexactly(length) if length else b''
+                    try:
+                        body = json.loads(raw_body) if raw_body else {}
+                    except ValueError:
+                        raise HTTPError(400, "Request body is not valid JSON.")
+                    if not isinstance(body, dict):
+                        raise HTTPError(400, "Request body must be a JSON object.")
+                    status, payload = await self._route(method.upper(), path, body)
+                except HTTPError as e:
+                    status, payload = e.status, {'error': str(e)}
+                    keep_alive = keep_alive and e.status != 413
+                except Exception as e:
+                    logger.exception("Error handling %s %s: %s", method, path, e)
+                    status, payload = 500, {'error': "Internal server error."}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any], keep_alive: bool) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    async def _expire_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(max(self.sessions.ttl / 4, 1.0))
+            expired = self.sessions.expire()
+            if expired:
+                logger.debug("Expired %d quiz sessions", expired)
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    from app.utils.load_verbs_utility import load_verbs
+    from app.utils.logging_utility import configure_logging
+
+    parser = argparse.ArgumentParser(description='Serve Irish verb quizzes over HTTP.')
+    parser.add_argument('data_file', nargs='?',
+                        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils', 'data', 'verbs.json'),
+                        help='Path to the verb JSON file. Defaults to the bundled data.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--session-ttl', type=float, default=30 * 60, help='Seconds an idle session is kept.')
+    parser.add_argument('--workers', type=int, default=4, help='Threads used to draw questions.')
+    parser.add_argument('--log-file', help='Write the log to this file (rotated) instead of stderr.')
+    parser.add_argument('--log-level', default='INFO', help='Log level, e.g. INFO or DEBUG.')
+    parser.add_argument('--log-json', action='store_true', help='Write one JSON object per log record.')
+    args = parser.parse_args()
+
+    configure_logging(args.log_file, level=args.log_level, json_format=args.log_json)
+    service = QuizService(load_verbs(args.data_file), session_ttl=args.session_ttl, max_workers=args.workers)
+    try:
+        asyncio.run(service.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,192 @@
+import logging
+import os
+import tempfile
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import appdirs
+
+logger = logging.getLogger(__name__)
+
+TEANGLANN_AUDIO_URL = 'https://www.teanglann.ie/Can{dialect}/{verb}.mp3'
+AUDIO_DIALECTS = ('U', 'M', 'C')
+
+_AUDIO_SUFFIX = '.mp3'
+_MISSING_SUFFIX = '.missing'
+
+
+def default_audio_cache_dir() -> str:
+    return os.path.join(appdirs.user_cache_dir("IrishVerbQuiz", "YourCompany"), 'audio')
+
+
+class AudioCache:
+    """
+    On-disk cache of pronunciation recordings, keyed by (dialect, verb).
+
+    Recordings are downloaded once through a pooled HTTP session and kept as files,
+    so replaying a verb needs no network access. The total size of the recordings
+    is kept under `max_bytes` by evicting the least recently played ones (a file's
+    modification time is its last use). A 404 is remembered as an empty marker
+    file for `missing_ttl` seconds, so verbs without a recording are not requested
+    again on every press.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 50 * 1024 * 1024,
+                 base_url: str = TEANGLANN_AUDIO_URL, missing_ttl: float = 30 * 24 * 3600,
+                 timeout: float = 10.0):
+        self.cache_dir = cache_dir or default_audio_cache_dir()
+        self.max_bytes = max_bytes
+        self.base_url = base_url
+        self.missing_ttl = missing_ttl
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.missing_hits = 0
+        self._lock = threading.Lock()
+        self._session = None
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # path -> size of every cached recording, least recently used first
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        recordings = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(_AUDIO_SUFFIX):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                recordings.append((stat.st_mtime, os.path.join(self.cache_dir, name), stat.st_size))
+        for _, path, size in sorted(recordings):
+            self._sizes[path] = size
+        self._total_bytes = sum(self._sizes.values())
+
+    def get(self, verb: str, dialect: str) -> Optional[str]:
+        """
+        Return the path of the recording of a verb, downloading it on a miss.
+
+        Args:
+            verb (str): The verb to pronounce.
+            dialect (str): 'U', 'M' or 'C'.
+
+        Returns:
+            str: Path to the cached mp3 file, or None if the server has no recording.
+
+        Raises:
+            ValueError: If the dialect is unknown.
+            requests.RequestException: If the recording is not cached and cannot be downloaded.
+        """
+        if dialect not in AUDIO_DIALECTS:
+            raise ValueError(f"Unknown dialect code: {dialect}")
+        audio_path, missing_path = self._paths(verb, dialect)
+
+        with self._lock:
+            if audio_path in self._sizes:
+                if self._touch(audio_path):
+                    self.hits += 1
+                    self._sizes.move_to_end(audio_path)
+                    return audio_path
+                # Removed behind our back: download it again
+                self._total_bytes -= self._sizes.pop(audio_path)
+            try:
+                if time.time() - os.path.getmtime(missing_path) < self.missing_ttl:
+                    self.missing_hits += 1
+                    return None
+            except OSError:
+                pass
+            self.misses += 1
+
+        # Download outside the lock so one slow request does not block cached replays
+        response = self._get_session().get(self._url(verb, dialect), timeout=self.timeout)
+        if response.status_code == 404:
+            with open(missing_path, 'wb'):
+                pass
+            return None
+        response.raise_for_status()
+        self._store(audio_path, response.content)
+        return audio_path
+
+    def is_cached(self, verb: str, dialect: str) -> bool:
+        """
+        Check whether `get` can answer without a download (a recording or a 404 is cached).
+        """
+        audio_path, missing_path = self._paths(verb, dialect)
+        with self._lock:
+            if audio_path in self._sizes:
+                return True
+        try:
+            return time.time() - os.path.getmtime(missing_path) < self.missing_ttl
+        except OSError:
+            return False
+
+    def clear(self) -> None:
+        """
+        Remove every cached recording and 404 marker.
+        """
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith((_AUDIO_SUFFIX, _MISSING_SUFFIX)):
+                    os.remove(os.path.join(self.cache_dir, name))
+            self._sizes.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _paths(self, verb: str, dialect: str) -> Tuple[str, str]:
+        stem = os.path.join(self.cache_dir, f"{dialect}_{urllib.parse.quote(verb, safe='')}")
+        return stem + _AUDIO_SUFFIX, stem + _MISSING_SUFFIX
+
+    def _url(self, verb: str, dialect: str) -> str:
+        return self.base_url.format(dialect=dialect, verb=urllib.parse.quote(verb))
+
+    def _get_session(self):
+        if self._session is None:
+            # Imported here so the app starts without loading requests
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session
+        return self._session
+
+    def _store(self, audio_path: str, content: bytes) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(content)
+            os.replace(temp_path, audio_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        with self._lock:
+            self._total_bytes += len(content) - self._sizes.get(audio_path, 0)
+            self._sizes[audio_path] = len(content)
+            self._sizes.move_to_end(audio_path)
+            self._evict(keep=audio_path)
+
+    def _touch(self, path: str) -> bool:
+        # The modification time records the last use across restarts
+        try:
+            os.utime(path)
+        except OSError:
+            return False
+        return True
+
+    def _evict(self, keep: str) -> None:
+        for path in list(self._sizes):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Could not evict cached audio '%s': %s", path, e)
+                continue
+            self._total_bytes -= self._sizes.pop(path)
@@ -0,0 +1,136 @@
+import logging
+import threading
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from app.utils.audio_cache_utility import AUDIO_DIALECTS, AudioCache
+
+logger = logging.getLogger(__name__)
+
+PrefetchInfo = namedtuple('PrefetchInfo', ['prefetched', 'hits', 'misses', 'wasted', 'cancelled'])
+
+AudioKey = Tuple[str, str]  # (dialect, verb)
+
+
+class AudioPrefetcher:
+    """
+    Download pronunciation recordings ahead of time on a bounded thread pool.
+
+    `prefetch` queues the recordings of the verb about to be quizzed; queuing the
+    next verb cancels those of the previous one that have not started. `get`
+    returns a recording, joining a download already in flight for it rather than
+    starting a second one.
+
+    Metrics: a hit is the first `get` of a prefetched recording (finished or still
+    running), a miss a `get` that had to start its own download, and a wasted
+    download a prefetch that had already started when the next verb was queued
+    but was never played.
+    """
+
+    def __init__(self, cache: AudioCache, max_workers: int = 3):
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='audio-prefetch')
+        # Reentrant: cancelling a future runs its done callback on the cancelling thread
+        self._lock = threading.RLock()
+        self._in_flight: Dict[AudioKey, Future] = {}
+        self._verb: Optional[str] = None
+        self._prefetched: Dict[AudioKey, Future] = {}  # Prefetches of the current verb
+        self._played: Set[AudioKey] = set()
+        self.prefetched = 0
+        self.hits = 0
+        self.misses = 0
+        self.wasted = 0
+        self.cancelled = 0
+
+    def prefetch(self, verb: str, dialects: Iterable[str] = AUDIO_DIALECTS) -> None:
+        """
+        Queue the recordings of a verb, superseding the previous prefetch.
+
+        Args:
+            verb (str): The verb about to be quizzed.
+            dialects (iterable): The dialects to fetch. Defaults to all three.
+        """
+        with self._lock:
+            if verb == self._verb:
+                return  # The same verb again, e.g. while it is frozen
+            self._retire_prefetches()
+            self._verb = verb
+            for dialect in dialects:
+                key = (dialect, verb)
+                if self.cache.is_cached(verb, dialect):
+                    continue
+                future = self._in_flight.get(key) or self._submit(key)
+                self._prefetched[key] = future
+                self.prefetched += 1
+
+    def get(self, verb: str, dialect: str, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Return the cached recording of a verb, waiting for or starting its download.
+
+        Args:
+            verb (str): The verb to pronounce.
+            dialect (str): 'U', 'M' or 'C'.
+            timeout (float, optional): Seconds to wait for a download in flight.
+
+        Returns:
+            str: Path to the mp3 file, or None if there is no recording.
+        """
+        key = (dialect, verb)
+        with self._lock:
+            if key in self._prefetched and key not in self._played:
+                self._played.add(key)
+                self.hits += 1
+            future = self._in_flight.get(key)
+            if future is None and key not in self._prefetched:
+                if not self.cache.is_cached(verb, dialect):
+                    self.misses += 1
+                    future = self._submit(key)
+        if future is not None:
+            return future.result(timeout)
+        return self.cache.get(verb, dialect)
+
+    def prefetch_info(self) -> PrefetchInfo:
+        with self._lock:
+            return PrefetchInfo(self.prefetched, self.hits, self.misses, self.wasted, self.cancelled)
+
+    def hit_rate(self) -> float:
+        """
+        Fraction of recordings played that were served by a prefetch.
+        """
+        with self._lock:
+            played = self.hits + self.misses
+            return self.hits / played if played else 0.0
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._retire_prefetches()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, key: AudioKey) -> Future:
+        # Called with the lock held
+        dialect, verb = key
+        future = self._executor.submit(self.cache.get, verb, dialect)
+        self._in_flight[key] = future
+        future.add_done_callback(lambda done: self._finished(key, done))
+        return future
+
+    def _finished(self, key: AudioKey, future: Future) -> None:
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning("Could not fetch audio for %s: %s", key, future.exception())
+
+    def _retire_prefetches(self) -> None:
+        # Called with the lock held: cancel what has not started, count what was never played
+        for key, future in self._prefetched.items():
+            if key in self._played:
+                continue
+            if future.cancel():
+                self.cancelled += 1
+            else:
+                self.wasted += 1
+        self._verb = None
+        self._prefetched = {}
+        self._played = set()
@@ -0,0 +1,110 @@
+import gc
+from typing import Dict, Any, Callable, Iterable, List, Tuple
+
+from app.utils.conjugation_utility import TENSE_RULES, compile_tense, root_variants, tense_key
+
+# (class, width) per tense, then the dialect -> function conjugating a list of verbs
+_group_programs: Dict[Tuple, Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = {}
+
+
+def _group_key(verb_data: Dict[str, Any], dialect: str) -> Tuple:
+    return tuple(tense_key(verb_data, tense) for tense in TENSE_RULES) + (dialect,)
+
+
+def _form_expression(stems: str, variant: int, particle: str, ending: str) -> str:
+    parts = ([repr(particle)] if particle else []) + [f"{stems}[{variant}]"] + ([repr(ending)] if ending else [])
+    return ' + '.join(parts)
+
+
+def compile_group(key: Tuple) -> Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """
+    Compile the tense programs of one group into a single function that
+    conjugates a list of verbs.
+
+    The programs of every tense are unrolled into one paradigm literal, with the
+    pronouns, lytic types, markers, particles and endings as constants. The root
+    variants of each root field chain are built once per verb and shared by the
+    tenses that read the same chain, so a verb costs one dictionary build and
+    one concatenation per form. Functions are cached per group.
+
+    Args:
+        key (tuple): The (class, width) of each tense of TENSE_RULES, then the dialect.
+
+    Returns:
+        callable: verbs -> their paradigms, in order.
+    """
+    function = _group_programs.get(key)
+    if function is not None:
+        return function
+    dialect = key[-1]
+    chains: List[Tuple[str, ...]] = []
+    tenses = []
+    for tense, class_width in zip(TENSE_RULES, key):
+        program = compile_tense(tense, *class_width, dialect)
+        names = []
+        for root_fields in program.roots:
+            if root_fields not in chains:
+                chains.append(root_fields)
+            names.append(f"s{chains.index(root_fields)}")
+        pronouns: Dict[str, List[str]] = {}
+        for pronoun, variant, particle, ending, lytic_info, marker in program.forms:
+            form = _form_expression(names[variant // 4], variant % 4, particle, ending)
+            pronouns.setdefault(pronoun, []).append(f"({form}, {lytic_info!r}, {marker!r})")
+        tenses.append(f"{tense!r}: {{" + ', '.join(f"{pronoun!r}: [{', '.join(forms)}]"
+                                                   for pronoun, forms in pronouns.items()) + "}")
+
+    lines = ["def conjugate_group(verbs):",
+             "    paradigms = []",
+             "    append = paradigms.append",
+             "    for verb_data in verbs:"]
+    for number, root_fields in enumerate(chains):
+        lines.append(f"        root = verb_data.get({root_fields[0]!r})")
+        for field in root_fields[1:]:
+            lines.append(f"        if root is None: root = verb_data.get({field!r})")
+        lines.append(f"        if root is None: raise KeyError({root_fields[0]!r})")
+        lines.append(f"        s{number} = root_variants(root)")
+    lines.append("        append({" + ', '.join(tenses) + "})")
+    lines.append("    return paradigms")
+    namespace = {'root_variants': root_variants}
+    exec(compile('\n'.join(lines), f"<conjugation group {key!r}>", 'exec'), namespace)
+    function = _group_programs[key] = namespace['conjugate_group']
+    return function
+
+
+def generate_full_paradigms(verbs: Iterable[Dict[str, Any]], dialect: str = "O") -> List[Dict[str, Any]]:
+    """
+    Generate the full paradigm of many verbs in one pass.
+
+    Verbs are grouped by the (class, width) of each tense and the dialect, and
+    each group is conjugated by one function compiled for it (see `compile_group`),
+    which runs over all the verbs of the group in a single loop. The mutated forms
+    of each root are memoized by `mutation_utility.mutations`. The result for each
+    verb is identical to `generate_full_paradigm(verb_data, dialect)`.
+
+    A batch allocates tens of tuples per verb and none of them form cycles, so
+    the cyclic garbage collector, which would otherwise rescan the growing result
+    over and over, is paused until the batch is done.
+
+    Args:
+        verbs (iterable): The verb entries to conjugate.
+        dialect (str): The dialect code. Defaults to "O".
+
+    Returns:
+        list: One paradigm per verb, in input order.
+    """
+    verbs = list(verbs)
+    groups: Dict[Tuple, List[int]] = {}
+    for idx, verb_data in enumerate(verbs):
+        groups.setdefault(_group_key(verb_data, dialect), []).append(idx)
+
+    paradigms: List[Dict[str, Any]] = [None] * len(verbs)
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        for key, indices in groups.items():
+            for idx, paradigm in zip(indices, compile_group(key)([verbs[idx] for idx in indices])):
+                paradigms[idx] = paradigm
+    finally:
+        if collecting:
+            gc.enable()
+    return paradigms
@@ -0,0 +1,202 @@
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
+
+from app.utils.batch_conjugation_utility import generate_full_paradigms
+
+# Interned label tables. A label's code is its index in the table; unknown labels are appended on first use,
+# so codes are only meaningful within one process and are remapped when a paradigm is unpickled.
+TENSE_LABELS: List[str] = ['Present', 'Future', 'Past', 'Conditional', 'Past Habitual']
+PRONOUN_LABELS: List[str] = ['analytic', '1sg', '2sg', '1pl', '3pl', 'impersonal', 'relative', 'relative1',
+                             'relative2']
+LYTIC_LABELS: List[str] = ['analytic', 'synthetic']
+MARKER_LABELS: List[str] = ['unmarked', 'negative', 'interrogative']
+
+_LABEL_TABLES = (TENSE_LABELS, PRONOUN_LABELS, LYTIC_LABELS, MARKER_LABELS)
+
+_codes_by_table = {id(table): {label: code for code, label in enumerate(table)} for table in _LABEL_TABLES}
+
+# Code of a record that holds no form: an empty pronoun (lytic and marker codes) or an
+# empty tense (pronoun code too), kept so that empty entries survive packing
+EMPTY_CODE = 255
+
+
+def _intern(table: List[str], label: str) -> int:
+    codes = _codes_by_table[id(table)]
+    code = codes.get(label)
+    if code is None:
+        if len(table) >= EMPTY_CODE:
+            raise ValueError(f"Too many distinct labels to intern '{label}'.")
+        code = codes[label] = len(table)
+        table.append(label)
+    return code
+
+
+class CompactParadigm(Mapping):
+    """
+    Read-only paradigm stored as flat arrays.
+
+    Each form takes four one-byte codes (tense, pronoun, lytic type, marker) and an
+    offset into a single packed string buffer. Reading it behaves like the nested
+    `Dict[tense, Dict[pronoun, List[(form, lytic, marker)]]]` returned by
+    `generate_full_paradigm`; the tuples are rebuilt on access from interned labels.
+    """
+
+    __slots__ = ('_codes', '_offsets', '_buffer')
+
+    def __init__(self, codes: bytes, offsets: array, buffer: str):
+        self._codes = codes
+        self._offsets = offsets
+        self._buffer = buffer
+
+    @classmethod
+    def from_paradigm(cls, paradigm: Dict[str, Any]) -> "CompactParadigm":
+        """
+        Pack a nested paradigm dictionary.
+
+        Args:
+            paradigm (dict): A paradigm as returned by `generate_full_paradigm`.
+
+        Returns:
+            CompactParadigm: The packed paradigm.
+        """
+        codes = bytearray()
+        offsets = array('I', [0])
+        forms = []
+        position = 0
+        for tense, conjugations in paradigm.items():
+            tense_code = _intern(TENSE_LABELS, tense)
+            if not conjugations:
+                codes += bytes((tense_code, EMPTY_CODE, EMPTY_CODE, EMPTY_CODE))
+                offsets.append(position)
+            for pronoun, entries in conjugations.items():
+                pronoun_code = _intern(PRONOUN_LABELS, pronoun)
+                if not entries:
+                    codes += bytes((tense_code, pronoun_code, EMPTY_CODE, EMPTY_CODE))
+                    offsets.append(position)
+                for form, lytic_info, marker in entries:
+                    codes += bytes((tense_code, pronoun_code, _intern(LYTIC_LABELS, lytic_info),
+                                    _intern(MARKER_LABELS, marker)))
+                    forms.append(form)
+                    position += len(form)
+                    offsets.append(position)
+        return cls(bytes(codes), offsets, ''.join(forms))
+
+    def __len__(self) -> int:
+        return len(self._tense_codes())
+
+    def __iter__(self) -> Iterator[str]:
+        return (TENSE_LABELS[code] for code in self._tense_codes())
+
+    def __getitem__(self, tense: str) -> "_CompactTenseView":
+        tense_code = _codes_by_table[id(TENSE_LABELS)].get(tense)
+        codes = self._codes
+        start = None
+        for idx in range(0, len(codes), 4):
+            if codes[idx] == tense_code:
+                if start is None:
+                    start = idx // 4
+                end = idx // 4 + 1
+            elif start is not None:
+                break
+        if start is None:
+            raise KeyError(tense)
+        return _CompactTenseView(self, start, end)
+
+    def __repr__(self) -> str:
+        return f"CompactParadigm({self.to_dict()!r})"
+
+    def __reduce__(self):
+        # The codes index this process' label tables, so the labels travel with them
+        return _unpickle_compact_paradigm, (self._codes, self._offsets, self._buffer,
+                                            tuple(tuple(table) for table in _LABEL_TABLES))
+
+    def form_count(self) -> int:
+        return sum(1 for code in self._codes[2::4] if code != EMPTY_CODE)
+
+    def to_dict(self) -> Dict[str, Dict[str, List[Tuple[str, str, str]]]]:
+        return {tense: {pronoun: list(forms) for pronoun, forms in conjugations.items()}
+                for tense, conjugations in self.items()}
+
+    def _tense_codes(self) -> List[int]:
+        # Tenses are stored contiguously, so distinct codes in storage order are the keys
+        tense_codes = []
+        for code in self._codes[::4]:
+            if not tense_codes or tense_codes[-1] != code:
+                tense_codes.append(code)
+        return tense_codes
+
+    def _form(self, idx: int) -> Tuple[str, str, str]:
+        base = idx * 4
+        return (self._buffer[self._offsets[idx]:self._offsets[idx + 1]],
+                LYTIC_LABELS[self._codes[base + 2]],
+                MARKER_LABELS[self._codes[base + 3]])
+
+
+class _CompactTenseView(Mapping):
+    """
+    Pronoun -> list of (form, lytic, marker) view over one tense of a CompactParadigm.
+    """
+
+    __slots__ = ('_paradigm', '_start', '_end')
+
+    def __init__(self, paradigm: CompactParadigm, start: int, end: int):
+        self._paradigm = paradigm
+        self._start = start
+        self._end = end
+
+    def _pronoun_ranges(self) -> Dict[str, Tuple[int, int]]:
+        codes = self._paradigm._codes
+        ranges = {}
+        for idx in range(self._start, self._end):
+            pronoun_code = codes[idx * 4 + 1]
+            if pronoun_code == EMPTY_CODE:
+                continue
+            pronoun = PRONOUN_LABELS[pronoun_code]
+            first, _ = ranges.get(pronoun, (idx, idx))
+            ranges[pronoun] = (first, idx + 1)
+        return ranges
+
+    def __len__(self) -> int:
+        return len(self._pronoun_ranges())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._pronoun_ranges())
+
+    def __getitem__(self, pronoun: str) -> List[Tuple[str, str, str]]:
+        first, last = self._pronoun_ranges()[pronoun]
+        codes = self._paradigm._codes
+        return [self._paradigm._form(idx) for idx in range(first, last) if codes[idx * 4 + 2] != EMPTY_CODE]
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+def _unpickle_compact_paradigm(codes: bytes, offsets: array, buffer: str,
+                               tables: Tuple[Tuple[str, ...], ...]) -> CompactParadigm:
+    """
+    Rebuild a pickled CompactParadigm, translating its codes from the label tables
+    of the process that pickled it to this process' tables.
+    """
+    code_maps = [bytes([_intern(table, label) for label in labels] + [0] * (EMPTY_CODE - len(labels)) + [EMPTY_CODE])
+                 for table, labels in zip(_LABEL_TABLES, tables)]
+    if any(code_map[:len(labels)] != bytes(range(len(labels))) for code_map, labels in zip(code_maps, tables)):
+        remapped = bytearray(codes)
+        for column, code_map in enumerate(code_maps):
+            remapped[column::4] = bytes(codes[column::4]).translate(code_map)
+        codes = bytes(remapped)
+    return CompactParadigm(codes, offsets, buffer)
+
+
+def compact_paradigms(verbs: Iterable[Dict[str, Any]], dialect: str = "O") -> List[CompactParadigm]:
+    """
+    Generate and pack the paradigms of many verbs.
+
+    Args:
+        verbs (iterable): The verb entries to conjugate.
+        dialect (str): The dialect code. Defaults to "O".
+
+    Returns:
+        list: One CompactParadigm per verb, in input order.
+    """
+    return [CompactParadigm.from_paradigm(paradigm) for paradigm in generate_full_paradigms(verbs, dialect)]
@@ -1,6 +1,6 @@
-import pprint
+from typing import Dict, Any, NamedTuple, Tuple
 
-from app.utils.initial_mutation_utility import eclipse_verb, lenite_verb, starts_with_vowel_or_f
+from app.utils.mutation_utility import ECLIPSIS_KIND, LENITION_KIND, PAST_PARTICLE_KIND, mutate, mutations
 
 future_root_endings = {
     1: {
@@ -231,169 +231,199 @@ past_root_endings = {
 }
 
 
-def add_past_particle(verb_form, particle = "do", dialect='O'):
-    if particle == 'do':
-        if starts_with_vowel_or_f(verb_form):
-            return f"d'{lenite_verb(verb_form)}"
-        else:
-            return f"{lenite_verb(verb_form)}"
-    elif particle == "níor":
-        return f"níor {lenite_verb(verb_form)}"
-    elif particle == "ar":
-        return f"ar {lenite_verb(verb_form)}"
-    else:
-        return lenite_verb(verb_form)
-
-def add_unmarked_particle(verb_form, particle = "", dialect = 'O'):
-    if particle == "":
-        return verb_form
-    elif particle == "Negative":
-        return f"ní {lenite_verb(verb_form)}"
-    elif particle == "Interrogative":
-        return f"an {eclipse_verb(verb_form)}"
-    else:
-        return verb_form
-
-# Conjugating PRESENT and FUTURE
-def conjugate_futurey(tense, root, root_class, root_width, dialect):
-
-    conjugation = {}
-
-    tense_endings  = present_root_endings if tense == "present" else future_root_endings
-
-    endings = tense_endings[root_class][root_width][dialect]
-
-    # Apply endings to future root form
-    for pronoun, ending in endings.items():
-        conjugation[pronoun] = []
-        base_form = f"{root}{ending}"
-        base_form_lytic = 'analytic' if pronoun == 'analytic' else 'synthetic'
-
-        # base form
-        conjugation[pronoun].append((base_form, base_form_lytic, 'unmarked'))
-
-        # Negative form with "ní"
-        if not pronoun.startswith("relative"):
-            lenited_verb = lenite_verb(root)
-            negative_form = f"ní {lenited_verb}{ending}"
-            conjugation[pronoun].append((negative_form, base_form_lytic, 'negative'))
-
-            # Question form with "an"
-            eclipsed_verb = eclipse_verb(root)
-            question_form = f"an {eclipsed_verb}{ending}"
-            conjugation[pronoun].append((question_form, base_form_lytic, 'interrogative'))
-
-    return conjugation
+# --- Rule programs ---
+#
+# A tense is described by data: its ending table, where its roots come from, and how
+# each form marker is built as (marker, particle, mutation of the root). Mutations
+# index a root's variants: 0 plain, 1 lenited, 2 eclipsed, 3 with the past particle
+# "do" (lenited, and d' before a vowel or f).
+PLAIN, LENITED, ECLIPSED, DO_PARTICLE = range(4)
+
+PRESENT_MARKERS = (('unmarked', '', PLAIN), ('negative', 'ní ', LENITED), ('interrogative', 'an ', ECLIPSED))
+LENITED_MARKERS = (('unmarked', '', DO_PARTICLE), ('negative', 'ní ', LENITED), ('interrogative', 'an ', ECLIPSED))
+PAST_MARKERS = (('unmarked', '', DO_PARTICLE), ('negative', 'níor ', LENITED), ('interrogative', 'ar ', LENITED))
+# Past impersonal forms are not lenited
+PAST_IMPERSONAL_MARKERS = (('unmarked', '', PLAIN), ('negative', 'níor ', PLAIN), ('interrogative', 'ar ', PLAIN))
+# Relative forms have no negative or interrogative
+RELATIVE_MARKERS = (('unmarked', '', PLAIN),)
+
+
+class TenseRule(NamedTuple):
+    """
+    How to conjugate a tense. Adding a tense means adding an entry to TENSE_RULES.
+    """
+    endings: Dict[Any, Any]                        # class -> width -> dialect -> pronoun -> ending
+    roots: Tuple[str, ...]                         # Verb entry fields tried in order for the root
+    class_fields: Tuple[str, str]                  # (class, width) fields tried before 'class' and 'width'
+    lytic: str                                     # 'pronoun': only the 'analytic' pronoun is analytic;
+                                                   # 'ending': the forms with no ending are
+    markers: Tuple[Tuple[str, str, int], ...]      # (marker, particle, mutation) of each form
+    pronoun_markers: Dict[str, Tuple[Tuple[str, str, int], ...]]  # Pronoun -> markers, overriding `markers`
+    pronoun_roots: Dict[str, Tuple[str, ...]]      # Pronoun -> root fields, overriding `roots`
+
+
+TENSE_RULES: Dict[str, TenseRule] = {
+    'Present': TenseRule(present_root_endings, ('present_root', 'future_root'), ('future_class', 'future_width'),
+                         'pronoun', PRESENT_MARKERS,
+                         {'relative1': RELATIVE_MARKERS, 'relative2': RELATIVE_MARKERS}, {}),
+    'Future': TenseRule(future_root_endings, ('future_root',), ('future_class', 'future_width'),
+                        'pronoun', PRESENT_MARKERS, {'relative': RELATIVE_MARKERS}, {}),
+    'Past': TenseRule(past_root_endings, ('past_root', 'future_root', 'verb'), ('past_class', 'past_width'),
+                      'ending', PAST_MARKERS, {'impersonal': PAST_IMPERSONAL_MARKERS}, {'analytic': ('verb',)}),
+    'Conditional': TenseRule(conditional_root_endings, ('future_root', 'verb'), ('future_class', 'future_width'),
+                             'pronoun', LENITED_MARKERS, {}, {}),
+    'Past Habitual': TenseRule(past_habitual_root_endings, ('future_root', 'verb'), ('future_class', 'future_width'),
+                               'pronoun', LENITED_MARKERS, {}, {}),
+}
 
-def conjugate_future_tense(verb_data, dialect='O'):
-    root = verb_data['future_root']
-    root_class = verb_data.get('future_class' , verb_data['class'])
-    root_width = verb_data.get('future_width' , verb_data['width'])
 
-    return conjugate_futurey("future", root, root_class, root_width, dialect)
+class Program(NamedTuple):
+    """
+    A tense compiled for one (class, width, dialect).
 
-def conjugate_present_tense(verb_data, dialect = 'O'):
-    root = verb_data.get('present_root', verb_data['future_root'])
-    root_class = verb_data.get('future_class' , verb_data['class'])
-    root_width = verb_data.get('future_width' , verb_data['width'])
+    `roots` lists the root field chains the tense reads. `forms` holds one
+    instruction per form, in output order: (pronoun, variant, particle, ending,
+    lytic_info, marker), where `variant` indexes the concatenated root variants,
+    i.e. 4 * root number + mutation.
+    """
+    roots: Tuple[Tuple[str, ...], ...]
+    forms: Tuple[Tuple[str, int, str, str, str, str], ...]
 
-    return conjugate_futurey("present", root, root_class, root_width, dialect)
 
-def conjugate_past_habitual_tense(verb_data, dialect = 'O'):
-    synthetic_form_root = verb_data.get('future_root', verb_data['verb'])
-    endings_class = verb_data.get('future_class', verb_data['class'])
-    endings_width = verb_data.get('future_width', verb_data['width'])
+_programs: Dict[Tuple[str, Any, str, str], Program] = {}
 
-    conjugation = {}
-    endings = past_habitual_root_endings[endings_class][endings_width][dialect]
 
-    for pronoun, ending in endings.items():
+def compile_tense(tense: str, root_class, root_width: str, dialect: str = 'O') -> Program:
+    """
+    Compile the rule of a tense for one (class, width, dialect) into a program.
 
-        active_root = synthetic_form_root
-        lytic_info = 'analytic' if pronoun == 'analytic' else 'synthetic'
+    Programs are cached, so each combination is compiled once per process.
 
+    Raises:
+        KeyError: If the tense, class, width or dialect has no endings.
+    """
+    key = (tense, root_class, root_width, dialect)
+    program = _programs.get(key)
+    if program is None:
+        rule = TENSE_RULES[tense]
+        roots = []
         forms = []
-
-        # All Past Habitual forms, including impersonal, get lenited
-
-        unmarked_form = f"{add_past_particle(active_root, "do")}{ending}"
-        negative_form =  f"{add_unmarked_particle(active_root, "Negative")}{ending}"
-        interrogative_form =  f"{add_unmarked_particle(active_root, "Interrogative")}{ending}"
-
-        forms.append((unmarked_form, lytic_info, 'unmarked'))
-        forms.append((negative_form, lytic_info, 'negative'))
-        forms.append((interrogative_form, lytic_info, 'interrogative'))
-
-        conjugation[pronoun] = forms
-
+        for pronoun, ending in rule.endings[root_class][root_width][dialect].items():
+            if rule.lytic == 'pronoun':
+                lytic_info = 'analytic' if pronoun == 'analytic' else 'synthetic'
+            else:
+                lytic_info = 'synthetic' if ending else 'analytic'
+            root_fields = rule.pronoun_roots.get(pronoun, rule.roots)
+            if root_fields not in roots:
+                roots.append(root_fields)
+            base = 4 * roots.index(root_fields)
+            for marker, particle, mutation in rule.pronoun_markers.get(pronoun, rule.markers):
+                forms.append((pronoun, base + mutation, particle, ending, lytic_info, marker))
+        program = _programs[key] = Program(tuple(roots), tuple(forms))
+    return program
+
+
+def tense_key(verb_data: Dict[str, Any], tense: str) -> Tuple[Any, str]:
+    """
+    The (class, width) whose endings a verb takes in a tense.
+    """
+    class_field, width_field = TENSE_RULES[tense].class_fields
+    return verb_data.get(class_field, verb_data['class']), verb_data.get(width_field, verb_data['width'])
+
+
+def root_variants(root: str) -> Tuple[str, str, str, str]:
+    """
+    (plain, lenited, eclipsed, with the past particle "do") forms of a root.
+    """
+    return (root,) + mutations(root)
+
+
+def _root(verb_data: Dict[str, Any], fields: Tuple[str, ...]) -> str:
+    for field in fields:
+        root = verb_data.get(field)
+        if root is not None:
+            return root
+    raise KeyError(fields[0])
+
+
+def run_program(program: Program, verb_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run a compiled program for one verb.
+
+    Args:
+        program: From `compile_tense`.
+        verb_data (dict): The verb entry.
+
+    Returns:
+        dict: pronoun -> [(form, lytic_info, marker), ...]
+    """
+    roots = program.roots
+    stems = root_variants(_root(verb_data, roots[0]))
+    for root_fields in roots[1:]:
+        stems += root_variants(_root(verb_data, root_fields))
+    conjugation = {}
+    last_pronoun = None
+    for pronoun, variant, particle, ending, lytic_info, marker in program.forms:
+        if pronoun is not last_pronoun:
+            forms = conjugation[pronoun] = []
+            last_pronoun = pronoun
+        forms.append((particle + stems[variant] + ending, lytic_info, marker))
     return conjugation
 
-def conjugate_conditional_tense(verb_data, dialect = 'O'):
-    synthetic_form_root = verb_data.get('future_root', verb_data['verb'])
-    endings_class = verb_data.get('future_class', verb_data['class'])
-    endings_width = verb_data.get('future_width', verb_data['width'])
 
-    conjugation = {}
-    endings = conditional_root_endings[endings_class][endings_width][dialect]
+def conjugate(verb_data: Dict[str, Any], tense: str, dialect: str = 'O') -> Dict[str, Any]:
+    """
+    Conjugate a verb in one tense.
 
-    for pronoun, ending in endings.items():
+    Args:
+        verb_data (dict): The verb entry.
+        tense (str): A key of TENSE_RULES, e.g. 'Past Habitual'.
+        dialect (str): The dialect code. Defaults to "O".
 
-        active_root = synthetic_form_root
-        lytic_info = 'analytic' if pronoun == 'analytic' else 'synthetic'
+    Returns:
+        dict: pronoun -> [(form, lytic_info, marker), ...]
+    """
+    return run_program(compile_tense(tense, *tense_key(verb_data, tense), dialect), verb_data)
 
-        forms = []
 
-        # All conditional forms, including impersonal, get lenited
+# Helpers of the per-tense functions the rule programs replaced, kept for existing callers
 
-        unmarked_form = f"{add_past_particle(active_root, "do")}{ending}"
-        negative_form =  f"{add_unmarked_particle(active_root, "Negative")}{ending}"
-        interrogative_form =  f"{add_unmarked_particle(active_root, "Interrogative")}{ending}"
-
-        forms.append((unmarked_form, lytic_info, 'unmarked'))
-        forms.append((negative_form, lytic_info, 'negative'))
-        forms.append((interrogative_form, lytic_info, 'interrogative'))
+def add_past_particle(verb_form, particle="do", dialect='O'):
+    if particle == 'do':
+        return mutate(verb_form, PAST_PARTICLE_KIND)
+    lenited = mutate(verb_form, LENITION_KIND)
+    return f"{particle} {lenited}" if particle in ("níor", "ar") else lenited
 
-        conjugation[pronoun] = forms
 
-    return conjugation
+def add_unmarked_particle(verb_form, particle="", dialect='O'):
+    if particle == "Negative":
+        return f"ní {mutate(verb_form, LENITION_KIND)}"
+    if particle == "Interrogative":
+        return f"an {mutate(verb_form, ECLIPSIS_KIND)}"
+    return verb_form
 
 
-def conjugate_past_tense(verb_data, dialect = 'O'):
+def conjugate_futurey(tense, root, root_class, root_width, dialect):
+    # tense is "present" or any other value for the future, as before
+    program = compile_tense('Present' if tense == "present" else 'Future', root_class, root_width, dialect)
+    return run_program(program, {fields[0]: root for fields in program.roots})
 
-    analytic_form_root = verb_data.get('verb', '')
-    synthetic_form_root = verb_data.get('past_root', verb_data.get('future_root', analytic_form_root))
-    root_class = verb_data.get('past_class', verb_data['class'])
-    root_width = verb_data.get('past_width', verb_data['width'])
 
-    conjugation = {}
-    endings = past_root_endings[root_class][root_width][dialect]
+def conjugate_future_tense(verb_data, dialect='O'):
+    return conjugate(verb_data, 'Future', dialect)
 
-    for pronoun, ending in endings.items():
-        """
-            'analytic': '',
-            '1pl': 'íomar',
-            '3pl': 'íodar',
-            'impersonal': 'íodh'
-        """
 
-        active_root = analytic_form_root if pronoun == 'analytic' else synthetic_form_root
-        lytic_info = 'synthetic' if ending else 'analytic'
+def conjugate_present_tense(verb_data, dialect='O'):
+    return conjugate(verb_data, 'Present', dialect)
 
-        forms = []
 
-        # past impersonal forms not lenited
+def conjugate_past_habitual_tense(verb_data, dialect='O'):
+    return conjugate(verb_data, 'Past Habitual', dialect)
 
-        unmarked_form = (f"{active_root}{ending}" if pronoun == "impersonal" else
-            f"{add_past_particle(active_root, "do")}{ending}")
-        negative_form =  (f"níor {active_root}{ending}" if pronoun == "impersonal" else
-            f"{add_past_particle(active_root, "níor")}{ending}")
-        interrogative_form = (f"ar {active_root}{ending}" if pronoun == "impersonal" else
-                         f"{add_past_particle(active_root, "ar")}{ending}")
 
-        forms.append((unmarked_form, lytic_info, 'unmarked'))
-        forms.append((negative_form, lytic_info, 'negative'))
-        forms.append((interrogative_form, lytic_info, 'interrogative'))
+def conjugate_conditional_tense(verb_data, dialect='O'):
+    return conjugate(verb_data, 'Conditional', dialect)
 
-        conjugation[pronoun] = forms
 
-    return conjugation
\ No newline at end of file
+def conjugate_past_tense(verb_data, dialect='O'):
+    return conjugate(verb_data, 'Past', dialect)
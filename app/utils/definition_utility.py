@@ -1,28 +1,31 @@
-import json
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+from app.utils.edit_journal_utility import append_edit
 from app.utils.file_utility import get_data_file_path
+from app.utils.paradigm_cache_utility import paradigm_cache
 
 
-def update_definition_in_json(updated_verb_data):
-    data_file = get_data_file_path()
-    # Load the entire verbs data
-    with open(data_file, 'r', encoding='utf-8') as file:
-        verbs = json.load(file)
+def update_definition_in_json(updated_verb_data, data_file=None):
+    """
+    Save the definition of a verb to the data file it was loaded from.
 
-    # Find the verb in the list and update its definition
-    for verb in verbs:
-        if verb['verb'] == updated_verb_data['verb']:
-            verb['definition'] = updated_verb_data['definition']
-            break
+    The change is appended to the file's edit journal rather than rewriting the
+    whole file; it is applied whenever the file is loaded and folded into the
+    file by `compact_journal`.
 
-    # Write the updated data back to the file
-    with open(data_file, 'w', encoding='utf-8') as file:
-        json.dump(verbs, file, ensure_ascii=False, indent=4)
+    Args:
+        updated_verb_data (dict): The verb entry with its new definition.
+        data_file (str, optional): The loaded verb data file. Defaults to the default data file.
+    """
+    data_file = get_data_file_path(data_file)
+    append_edit(data_file, updated_verb_data['verb'], 'definition', updated_verb_data['definition'])
 
+    # Drop any paradigms generated from the old entry
+    paradigm_cache.invalidate(updated_verb_data['verb'])
 
-def edit_definition(current_verb_data, root):
+
+def edit_definition(current_verb_data, root, data_file=None):
     if current_verb_data is None:
         messagebox.showinfo("No Verb Selected", "Please generate a verb form first.")
         return
@@ -45,7 +48,7 @@ def edit_definition(current_verb_data, root):
     def save_definition():
         new_def = definition_var.get().strip()
         current_verb_data['definition'] = new_def
-        update_definition_in_json(current_verb_data)
+        update_definition_in_json(current_verb_data, data_file)
         edit_window.destroy()
         messagebox.showinfo("Success", f"Definition updated for '{current_verb_data['verb']}'.")
 
@@ -0,0 +1,183 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import Dict, Any, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = '.journal.jsonl'
+# A journal being folded into its data file is renamed aside with this suffix
+COMPACTING_SUFFIX = '.compacting'
+
+# verb -> {field: value}, the latest value of every edited field
+Edits = Dict[str, Dict[str, Any]]
+
+
+def journal_path(data_file: str) -> str:
+    """
+    Get the path of the edit journal that sits next to a verb data file.
+
+    Args:
+        data_file (str): Path to the verb JSON file.
+
+    Returns:
+        str: Path to the edit journal.
+    """
+    return os.path.splitext(data_file)[0] + JOURNAL_SUFFIX
+
+
+def append_edit(data_file: str, verb: str, field: str, value: Any) -> None:
+    """
+    Record a change to one field of a verb entry.
+
+    The change is appended to the journal as a single JSON line and flushed to
+    disk, so saving costs the same however large the data file is. A crash can
+    at worst leave a partial last line, which `read_journal` ignores.
+
+    Args:
+        data_file (str): Path to the verb JSON file the verb was loaded from.
+        verb (str): The dictionary form of the verb.
+        field (str): The field to change, e.g. 'definition'.
+        value: The new value of the field.
+    """
+    line = json.dumps({'verb': verb, 'field': field, 'value': value}, ensure_ascii=False) + '\n'
+    with open(journal_path(data_file), 'ab+') as file:
+        # Never continue a partial line left behind by an interrupted write
+        if file.tell() > 0:
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b'\n':
+                line = '\n' + line
+        file.write(line.encode('utf-8'))
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def read_journal(data_file: str) -> Edits:
+    """
+    Read the edits recorded for a verb data file.
+
+    A journal that is being compacted (or whose compaction was interrupted) is
+    read first, then the journal that receives new edits.
+
+    Args:
+        data_file (str): Path to the verb JSON file.
+
+    Returns:
+        dict: verb -> {field: value}, later edits overriding earlier ones. Empty
+            if there is no journal.
+    """
+    edits: Edits = {}
+    path = journal_path(data_file)
+    _read_journal_file(path + COMPACTING_SUFFIX, data_file, edits)
+    _read_journal_file(path, data_file, edits)
+    return edits
+
+
+def _read_journal_file(path: str, data_file: str, edits: Edits) -> None:
+    try:
+        file = open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                edits.setdefault(record['verb'], {})[record['field']] = record['value']
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning("Ignoring unreadable line %d of the edit journal of '%s': %s", line_number, data_file, e)
+
+
+def apply_edits(entries: Iterable[Dict[str, Any]], edits: Edits) -> Iterator[Dict[str, Any]]:
+    """
+    Apply journal edits to verb entries as they go by.
+
+    Args:
+        entries (iterable): The verb entries.
+        edits (dict): The edits, as returned by `read_journal`.
+
+    Yields:
+        dict: The entries; edited ones are copies with their edited fields replaced,
+            so the input entries still match the data file.
+    """
+    for entry in entries:
+        changes = edits.get(entry['verb'])
+        yield {**entry, **changes} if changes else entry
+
+
+def compact_journal(data_file: str) -> int:
+    """
+    Fold the edit journal into the verb data file and remove the journal.
+
+    The journal is first renamed aside, so edits appended while the data file is
+    rewritten start a new journal and are kept for the next compaction. The
+    updated data is written to a temporary file in the same directory, with the
+    data file's permissions, and renamed over the data file, so a crash leaves
+    either the old or the new file. The renamed journal is only removed
+    afterwards; replaying it over the new file is harmless, as every edit just
+    sets a value.
+
+    Args:
+        data_file (str): Path to the verb JSON file.
+
+    Returns:
+        int: The number of verb items changed.
+    """
+    compacting_path = journal_path(data_file) + COMPACTING_SUFFIX
+    changed = 0
+    if os.path.exists(compacting_path):
+        # Left by an interrupted compaction; its edits are older than the journal's
+        changed += _fold_journal(data_file, compacting_path)
+    try:
+        os.replace(journal_path(data_file), compacting_path)
+    except FileNotFoundError:
+        return changed
+    return changed + _fold_journal(data_file, compacting_path)
+
+
+def _fold_journal(data_file: str, path: str) -> int:
+    # Apply the edits of one journal file to the data file, then remove it
+    edits: Edits = {}
+    _read_journal_file(path, data_file, edits)
+    if not edits:
+        os.remove(path)
+        return 0
+
+    # Load the raw items so fields the app does not know about are kept
+    with open(data_file, 'r', encoding='utf-8-sig') as file:
+        verbs = json.load(file)
+    changed = 0
+    for item in verbs:
+        changes = edits.get(item.get('verb')) if isinstance(item, dict) else None
+        if changes:
+            item.update(changes)
+            changed += 1
+
+    directory = os.path.dirname(os.path.abspath(data_file))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.json.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            json.dump(verbs, file, ensure_ascii=False, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        # mkstemp creates the file readable by its owner only
+        shutil.copymode(data_file, temp_path)
+        os.replace(temp_path, data_file)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    os.remove(path)
+    return changed
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Fold the edit journal of a verb JSON file into the file.')
+    parser.add_argument('json_file', help='Path to the verb JSON file.')
+    args = parser.parse_args()
+    print(f"Updated {compact_journal(args.json_file)} verbs in '{args.json_file}'.")
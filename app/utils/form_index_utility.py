@@ -0,0 +1,161 @@
+from array import array
+from typing import Dict, Any, Iterator, List, NamedTuple, Sequence, Tuple
+
+from app.utils.batch_conjugation_utility import generate_full_paradigms
+from app.utils.form_sampler_utility import ENTRY_FORM_TENSES
+
+_HASH_MASK = (1 << 64) - 1
+_EMPTY = 0
+# Verbs conjugated to estimate the table size of a new index
+_SIZE_SAMPLE = 64
+
+
+class FormAnalysis(NamedTuple):
+    """
+    One way a surface form can be produced.
+    """
+    verb_index: int
+    verb: str
+    tense: str
+    pronoun: str
+    form_type: str  # 'analytic' or 'synthetic', empty for entry forms
+    form_marker: str  # 'unmarked', 'negative' or 'interrogative', empty for entry forms
+
+
+Slot = Tuple[str, str, str, str]  # (tense, pronoun, form_type, form_marker)
+
+
+def iter_form_slots(verbs: Sequence[Dict[str, Any]], dialect: str = "O") -> Iterator[Tuple[int, str, Slot]]:
+    """
+    Yield (verb offset, form, slot) for every form of each verb, including the
+    dictionary form, verbal nouns and verbal adjectives.
+    """
+    for offset, (verb_data, paradigm) in enumerate(zip(verbs, generate_full_paradigms(verbs, dialect))):
+        for tense, conjugations in paradigm.items():
+            for pronoun, forms in conjugations.items():
+                for form, lytic, marker in forms:
+                    yield offset, form, (tense, pronoun, lytic, marker)
+        for tense, field in ENTRY_FORM_TENSES.items():
+            forms = [verb_data['verb']] if field is None else verb_data.get(field) or ()
+            for form in forms:
+                yield offset, form, (tense, tense, '', '')
+
+
+class FormIndex:
+    """
+    Reverse index from surface forms to every (verb, tense, pronoun, marker) that
+    produces them.
+
+    Forms are not stored: the index is an open-addressing hash table held in three
+    flat arrays (64-bit form hash, verb index, slot id), about 14 bytes per form
+    plus free slots, and a small table of distinct (tense, pronoun, lytic, marker)
+    slots. A lookup probes a few adjacent entries, so it takes constant time. Two
+    different forms sharing a 64-bit hash would be reported with each other's
+    analyses; with the form counts of a lexicon this is vanishingly unlikely.
+    """
+
+    def __init__(self, dialect: str = "O", capacity: int = 1024):
+        self.dialect = dialect
+        self._verbs: List[str] = []
+        self._slots: List[Slot] = []
+        self._slot_ids: Dict[Slot, int] = {}
+        self._count = 0
+        self._allocate(max(16, 1 << (capacity - 1).bit_length()))
+
+    @classmethod
+    def build(cls, verbs: Sequence[Dict[str, Any]], dialect: str = "O") -> "FormIndex":
+        """
+        Index every form of the verbs. The table is sized from the form count of
+        up to `_SIZE_SAMPLE` evenly spaced verbs, so it seldom has to grow and is
+        not much larger than the forms need.
+        """
+        step = max(1, len(verbs) // _SIZE_SAMPLE)
+        sample = [verbs[idx] for idx in range(0, len(verbs), step)]
+        sample_forms = sum(1 for _ in iter_form_slots(sample, dialect))
+        expected_forms = sample_forms * len(verbs) // max(1, len(sample))
+        # Room for the expected forms within the 2/3 load factor
+        index = cls(dialect, capacity=expected_forms * 3 // 2 + 1)
+        index.add_verbs(verbs)
+        return index
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, form: str) -> bool:
+        return bool(self.analyses(form))
+
+    def add_verbs(self, verbs: Sequence[Dict[str, Any]]) -> None:
+        """
+        Index the forms of more verbs. Their verb indices continue from the verbs
+        already indexed, matching a verb list that is extended with them.
+        """
+        start = len(self._verbs)
+        self._verbs.extend(verb_data['verb'] for verb_data in verbs)
+        for offset, form, slot in iter_form_slots(verbs, self.dialect):
+            slot_id = self._slot_ids.get(slot)
+            if slot_id is None:
+                slot_id = self._slot_ids[slot] = len(self._slots)
+                self._slots.append(slot)
+            if (self._count + 1) * 3 > len(self._hashes) * 2:
+                self._grow()
+            self._insert(self._hash(form), start + offset, slot_id)
+            self._count += 1
+
+    def analyses(self, form: str) -> List[FormAnalysis]:
+        """
+        Every analysis of a surface form, ordered by verb index and then by slot.
+
+        Args:
+            form (str): A surface form, e.g. 'níor bhris'.
+
+        Returns:
+            list: FormAnalysis entries; empty if no indexed verb produces the form.
+        """
+        form_hash = self._hash(form)
+        hashes = self._hashes
+        mask = len(hashes) - 1
+        position = form_hash & mask
+        found = set()
+        while hashes[position] != _EMPTY:
+            if hashes[position] == form_hash:
+                # A set also drops repeats, e.g. a verbal noun listed twice
+                found.add((self._verb_indices[position], self._slot_refs[position]))
+            position = (position + 1) & mask
+        return [FormAnalysis(verb_index, self._verbs[verb_index], *self._slots[slot_id])
+                for verb_index, slot_id in sorted(found)]
+
+    def is_ambiguous(self, form: str) -> bool:
+        """
+        Whether more than one analysis produces the form.
+        """
+        return len(self.analyses(form)) > 1
+
+    # --- Internals ---
+
+    @staticmethod
+    def _hash(form: str) -> int:
+        # 0 marks a free entry
+        return (hash(form) & _HASH_MASK) or 1
+
+    def _allocate(self, size: int) -> None:
+        self._hashes = array('Q', bytes(8 * size))
+        self._verb_indices = array('I', bytes(4 * size))
+        self._slot_refs = array('H', bytes(2 * size))
+
+    def _insert(self, form_hash: int, verb_index: int, slot_id: int) -> None:
+        hashes = self._hashes
+        mask = len(hashes) - 1
+        position = form_hash & mask
+        while hashes[position] != _EMPTY:
+            position = (position + 1) & mask
+        hashes[position] = form_hash
+        self._verb_indices[position] = verb_index
+        self._slot_refs[position] = slot_id
+
+    def _grow(self) -> None:
+        entries = [(form_hash, verb_index, slot_id)
+                   for form_hash, verb_index, slot_id in zip(self._hashes, self._verb_indices, self._slot_refs)
+                   if form_hash != _EMPTY]
+        self._allocate(len(self._hashes) * 2)
+        for entry in entries:
+            self._insert(*entry)
@@ -0,0 +1,352 @@
+import random
+from collections import namedtuple
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+from app.utils.full_paradigm_utility import TENSE_CONJUGATORS
+
+# Quiz tenses whose forms come straight from the verb entry rather than from a conjugation
+ENTRY_FORM_TENSES = {
+    'verbal_noun': 'verbal_nouns',
+    'verbal_adjective': 'verbal_adjectives',
+    'dictionary_form': None,
+}
+
+QUIZ_TENSES = tuple(TENSE_CONJUGATORS) + tuple(ENTRY_FORM_TENSES)
+
+SampledForm = namedtuple('SampledForm', ['verb_index', 'tense', 'pronoun', 'form_index'])
+
+# Shape of a conjugated tense: ((pronoun, (marker, ...)), ...), which depends only on the tense,
+# the ending class/width and the dialect, never on the root itself.
+TenseShape = Tuple[Tuple[str, Tuple[str, ...]], ...]
+_shapes: Dict[Tuple, TenseShape] = {}
+
+
+def _shape_key(verb_data: Dict[str, Any], tense: str, dialect: str) -> Tuple:
+    if tense == 'Past':
+        return (tense, verb_data.get('past_class', verb_data['class']),
+                verb_data.get('past_width', verb_data['width']), dialect)
+    return (tense, verb_data.get('future_class', verb_data['class']),
+            verb_data.get('future_width', verb_data['width']), dialect)
+
+
+def tense_shape(verb_data: Dict[str, Any], tense: str, dialect: str = "O") -> TenseShape:
+    """
+    Return the pronouns and form markers a conjugated tense produces for a verb.
+
+    The shape is computed by conjugating the first verb of each (tense, class, width,
+    dialect) group and is shared by every other verb in that group.
+
+    Args:
+        verb_data (dict): The data of the verb.
+        tense (str): A paradigm tense name, e.g. 'Present'.
+        dialect (str): The dialect code. Defaults to "O".
+
+    Returns:
+        tuple: ((pronoun, (marker, ...)), ...) in paradigm order.
+    """
+    key = _shape_key(verb_data, tense, dialect)
+    shape = _shapes.get(key)
+    if shape is None:
+        conjugations = TENSE_CONJUGATORS[tense](verb_data, dialect)
+        shape = _shapes[key] = tuple(
+            (pronoun, tuple(form_entry[2] for form_entry in forms)) for pronoun, forms in conjugations.items()
+        )
+    return shape
+
+
+class _FenwickTree:
+    """
+    Binary indexed tree of non-negative weights with prefix-sum search.
+    """
+
+    def __init__(self, values: Sequence[float]):
+        self.values = list(values)
+        self.size = len(self.values)
+        self._tree = [0.0] * (self.size + 1)
+        for idx, value in enumerate(self.values, start=1):
+            self._tree[idx] += value
+            parent = idx + (idx & -idx)
+            if parent <= self.size:
+                self._tree[parent] += self._tree[idx]
+        self.total = sum(self.values)
+
+    def set(self, index: int, value: float) -> None:
+        delta = value - self.values[index]
+        if not delta:
+            return
+        self.values[index] = value
+        self.total += delta
+        idx = index + 1
+        while idx <= self.size:
+            self._tree[idx] += delta
+            idx += idx & -idx
+
+    def find(self, target: float) -> int:
+        """
+        Return the index whose cumulative weight range contains `target`.
+        """
+        pos = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self._tree[nxt] <= target:
+                pos = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        # Guard against floating point drift landing on a zero-weight entry
+        if pos < self.size and self.values[pos] > 0:
+            return pos
+        for idx in range(min(pos, self.size - 1), -1, -1):
+            if self.values[idx] > 0:
+                return idx
+        raise ValueError("Cannot sample from an empty selection.")
+
+
+class FormSampler:
+    """
+    Draw random quiz forms over verbs x tenses x pronouns x markers without
+    materialising the candidate forms.
+
+    By default (`uniform_verbs`) a draw picks a verb by its weight and then one of
+    its forms in the selected tenses by slot weight, as the quiz always has: a verb
+    with many verbal nouns is drawn no more often than one with a single form. A
+    single Fenwick tree of verb weights gives the verb by prefix-sum search in
+    O(log n); toggling a verb costs O(log n), and changing a slot weight, or the
+    tenses when some verbs may have no forms in them, rebuilds the tree on the
+    next draw.
+
+    Without `uniform_verbs`, each slot weighs `verb weight x slot weight` (both
+    default to 1.0), so every selected form is equally likely. Every quiz tense then
+    keeps a Fenwick tree of per-verb weights, so a draw picks a tense among at most
+    eight totals, a verb in O(log n), and a slot among that verb's few dozen forms.
+    Toggling a verb costs O(log n) per tense and toggling a tense costs O(1); only
+    changing a slot weight rebuilds one tree.
+    """
+
+    def __init__(self, verbs: Sequence[Dict[str, Any]], dialect: str = "O",
+                 selected_tenses: Iterable[str] = QUIZ_TENSES, rng: Optional[random.Random] = None,
+                 selected_verbs: Optional[Sequence[bool]] = None, uniform_verbs: bool = True):
+        self.verbs = verbs
+        self.dialect = dialect
+        self.uniform_verbs = uniform_verbs
+        self._rng = rng or random.Random()
+        self._verb_selected = bytearray([True]) * len(verbs) if selected_verbs is None \
+            else bytearray(map(bool, selected_verbs))
+        self._selected_count = sum(self._verb_selected)
+        self._verb_weights = [1.0] * len(verbs)
+        self._slot_weights: Dict[Tuple[str, str, str], float] = {}
+        self._shape_weights: Dict[Tuple, float] = {}
+        self._tense_selected = {tense: False for tense in QUIZ_TENSES}
+        # Verb weights for uniform_verbs draws, built on demand
+        self._verb_tree: Optional[_FenwickTree] = None
+        self._trees: Dict[str, _FenwickTree] = {}
+        for tense in selected_tenses:
+            self.set_tense_selected(tense, True)
+        self._build_trees()
+
+    # --- Selection and weights ---
+
+    def set_verb_selected(self, index: int, selected: bool) -> None:
+        if self._verb_selected[index] == selected:
+            return
+        self._verb_selected[index] = selected
+        self._selected_count += 1 if selected else -1
+        self._refresh_verb(index)
+
+    def set_all_verbs_selected(self, selected: bool) -> None:
+        """
+        Select or deselect every verb, rebuilding each tree once instead of
+        updating it verb by verb.
+        """
+        self._verb_selected[:] = bytearray([selected]) * len(self._verb_selected)
+        self._selected_count = len(self._verb_selected) if selected else 0
+        self._build_trees()
+
+    def set_verb_weight(self, index: int, weight: float) -> None:
+        if weight < 0:
+            raise ValueError("Weights must not be negative.")
+        self._verb_weights[index] = weight
+        self._refresh_verb(index)
+
+    def set_tense_selected(self, tense: str, selected: bool) -> None:
+        """
+        Include or exclude a quiz tense. Tense names are matched case-insensitively,
+        so the GUI checkbox keys ('present', 'verbal_noun', ...) can be used directly.
+        """
+        for quiz_tense in QUIZ_TENSES:
+            if quiz_tense.lower() == tense.lower():
+                if self._tense_selected[quiz_tense] != selected:
+                    every_verb_drawable = self._every_verb_has_forms()
+                    self._tense_selected[quiz_tense] = selected
+                    # Whether a verb has forms to draw depends on the selected tenses
+                    if not (every_verb_drawable and self._every_verb_has_forms()):
+                        self._verb_tree = None
+                return
+        raise KeyError(tense)
+
+    def set_slot_weight(self, tense: str, pronoun: str, marker: str, weight: float) -> None:
+        """
+        Weight one kind of slot, e.g. ('Past', 'impersonal', 'negative').
+
+        Forms taken from the verb entry use the tense as pronoun and 'unmarked' as marker.
+        """
+        if weight < 0:
+            raise ValueError("Weights must not be negative.")
+        self._slot_weights[(tense, pronoun, marker)] = weight
+        self._shape_weights = {key: value for key, value in self._shape_weights.items() if key[0] != tense}
+        if self.uniform_verbs:
+            self._verb_tree = None
+        else:
+            self._trees[tense] = self._build_tree(tense)
+
+    @property
+    def selected_verb_count(self) -> int:
+        return self._selected_count
+
+    @property
+    def total_weight(self) -> float:
+        if self.uniform_verbs:
+            return self._get_verb_tree().total
+        return sum(tree.total for tense, tree in self._trees.items() if self._tense_selected[tense])
+
+    # --- Sampling ---
+
+    def sample(self) -> Optional[SampledForm]:
+        """
+        Draw one form from the selected verbs and tenses.
+
+        Returns:
+            SampledForm: The drawn slot, or None when nothing is selected.
+        """
+        if self.uniform_verbs:
+            tree = self._get_verb_tree()
+            if tree.total <= 0:
+                return None
+            return self.sample_for_verb(tree.find(self._rng.random() * tree.total))
+        tense = self._pick(
+            [(tense, tree.total) for tense, tree in self._trees.items() if self._tense_selected[tense]]
+        )
+        if tense is None:
+            return None
+        tree = self._trees[tense]
+        verb_index = tree.find(self._rng.random() * tree.total)
+        return self._sample_slot(verb_index, tense)
+
+    def sample_for_verb(self, verb_index: int) -> Optional[SampledForm]:
+        """
+        Draw one form of a given verb from the selected tenses, whether or not the
+        verb itself is selected (used when the current verb is frozen).
+        """
+        tense = self._pick(
+            [(tense, self._verb_tense_weight(verb_index, tense))
+             for tense in QUIZ_TENSES if self._tense_selected[tense]]
+        )
+        if tense is None:
+            return None
+        return self._sample_slot(verb_index, tense)
+
+    # --- Internals ---
+
+    def _pick(self, weighted: List[Tuple[Any, float]]):
+        total = sum(weight for _, weight in weighted)
+        if total <= 0:
+            return None
+        target = self._rng.random() * total
+        for item, weight in weighted:
+            if target < weight:
+                return item
+            target -= weight
+        # Floating point drift: fall back to the last item with a weight
+        return next(item for item, weight in reversed(weighted) if weight > 0)
+
+    def _slots(self, verb_data: Dict[str, Any], tense: str) -> List[Tuple[str, str, int]]:
+        """
+        (pronoun, marker, form_index) for every form a verb has in a quiz tense.
+        """
+        if tense in ENTRY_FORM_TENSES:
+            field = ENTRY_FORM_TENSES[tense]
+            if field is None:
+                return [(tense, 'unmarked', 0)]
+            forms = verb_data.get(field)
+            if not isinstance(forms, list):
+                return []
+            return [(tense, 'unmarked', idx) for idx in range(len(forms))]
+        return [(pronoun, marker, idx)
+                for pronoun, markers in tense_shape(verb_data, tense, self.dialect)
+                for idx, marker in enumerate(markers)]
+
+    def _slot_weight(self, tense: str, pronoun: str, marker: str) -> float:
+        return self._slot_weights.get((tense, pronoun, marker), 1.0)
+
+    def _verb_tense_weight(self, verb_index: int, tense: str) -> float:
+        weight = self._verb_weights[verb_index]
+        if not weight:
+            return 0.0
+        verb_data = self.verbs[verb_index]
+        if tense in ENTRY_FORM_TENSES:
+            return weight * sum(self._slot_weight(tense, pronoun, marker)
+                                for pronoun, marker, _ in self._slots(verb_data, tense))
+        # Conjugated tenses: the slot total is shared by every verb with the same shape
+        key = _shape_key(verb_data, tense, self.dialect)
+        shape_weight = self._shape_weights.get(key)
+        if shape_weight is None:
+            shape_weight = self._shape_weights[key] = sum(
+                self._slot_weight(tense, pronoun, marker) for pronoun, marker, _ in self._slots(verb_data, tense)
+            )
+        return weight * shape_weight
+
+    def _verb_draw_weight(self, verb_index: int) -> float:
+        """
+        Weight of a verb in uniform_verbs draws: its own weight if it is selected
+        and has a form with a weight in a selected tense, else 0.
+        """
+        if not self._verb_selected[verb_index]:
+            return 0.0
+        if any(self._verb_tense_weight(verb_index, tense) > 0
+               for tense in QUIZ_TENSES if self._tense_selected[tense]):
+            return self._verb_weights[verb_index]
+        return 0.0
+
+    def _every_verb_has_forms(self) -> bool:
+        """
+        Whether a selected tense gives every verb a form with a weight: a conjugated
+        tense or the dictionary form with no slot weighted 0.
+        """
+        return any(
+            self._tense_selected[tense] and not any(
+                weight == 0 for key, weight in self._slot_weights.items() if key[0] == tense)
+            for tense in QUIZ_TENSES if tense not in ENTRY_FORM_TENSES or ENTRY_FORM_TENSES[tense] is None
+        )
+
+    def _get_verb_tree(self) -> _FenwickTree:
+        if self._verb_tree is None:
+            self._verb_tree = _FenwickTree([self._verb_draw_weight(idx) for idx in range(len(self._verb_selected))])
+        return self._verb_tree
+
+    def _build_trees(self) -> None:
+        if self.uniform_verbs:
+            self._verb_tree = None
+        else:
+            self._trees = {tense: self._build_tree(tense) for tense in QUIZ_TENSES}
+
+    def _build_tree(self, tense: str) -> _FenwickTree:
+        return _FenwickTree([
+            self._verb_tense_weight(idx, tense) if selected else 0.0
+            for idx, selected in enumerate(self._verb_selected)
+        ])
+
+    def _refresh_verb(self, index: int) -> None:
+        if self.uniform_verbs:
+            if self._verb_tree is not None:
+                self._verb_tree.set(index, self._verb_draw_weight(index))
+            return
+        for tense, tree in self._trees.items():
+            tree.set(index, self._verb_tense_weight(index, tense) if self._verb_selected[index] else 0.0)
+
+    def _sample_slot(self, verb_index: int, tense: str) -> Optional[SampledForm]:
+        slots = self._slots(self.verbs[verb_index], tense)
+        slot = self._pick([(slot, self._slot_weight(tense, slot[0], slot[1])) for slot in slots])
+        if slot is None:
+            return None
+        pronoun, _, form_index = slot
+        return SampledForm(verb_index, tense, pronoun, form_index)
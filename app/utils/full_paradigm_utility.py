@@ -1,9 +1,18 @@
-import pprint
-from typing import Dict, Any
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator
 
 from app.utils.conjugation_utility import conjugate_future_tense, conjugate_present_tense, conjugate_past_tense, \
     conjugate_conditional_tense, conjugate_past_habitual_tense
 
+# Tense name -> conjugation function, in display order
+TENSE_CONJUGATORS = {
+    'Present': conjugate_present_tense,
+    'Future': conjugate_future_tense,
+    'Past': conjugate_past_tense,
+    'Conditional': conjugate_conditional_tense,
+    'Past Habitual': conjugate_past_habitual_tense,
+}
+
 def generate_full_paradigm(verb_data: Dict[str, Any], dialect = "O") -> Dict[str, Any]:
     """
     Generate the full verb paradigm for all tenses.
@@ -15,25 +24,61 @@ def generate_full_paradigm(verb_data: Dict[str, Any], dialect = "O") -> Dict[str
         dict: A dictionary containing conjugations for all tenses.
     """
 
-    tenses = ['Present', 'Future', 'Past', 'Conditional', 'Past Habitual']
-
     paradigm = {}
 
-    for tense_name in tenses:
-        if tense_name.lower() == 'future':
-            conjugations = conjugate_future_tense(verb_data, dialect)
-        elif tense_name.lower() == 'present':
-            conjugations = conjugate_present_tense(verb_data, dialect)
-        elif tense_name.lower() == 'past':
-            conjugations = conjugate_past_tense(verb_data, dialect)
-        elif tense_name.lower() == 'conditional':
-            conjugations = conjugate_conditional_tense(verb_data, dialect)
-        elif tense_name.lower() == 'past habitual':
-            conjugations = conjugate_past_habitual_tense(verb_data, dialect)
-
-        else:
-            continue
-        paradigm[tense_name] = conjugations
+    for tense_name, conjugate in TENSE_CONJUGATORS.items():
+        paradigm[tense_name] = conjugate(verb_data, dialect)
 
     return paradigm
 
+
+class LazyParadigm(Mapping):
+    """
+    Paradigm that conjugates a tense only the first time it is read.
+
+    Iterating over the keys or checking membership never conjugates anything, so
+    callers that only need some tenses pay only for those.
+    """
+
+    def __init__(self, verb_data: Dict[str, Any], dialect: str = "O"):
+        self.verb_data = verb_data
+        self.dialect = dialect
+        self._tenses: Dict[str, Any] = {}
+
+    def __getitem__(self, tense_name: str) -> Dict[str, Any]:
+        conjugations = self._tenses.get(tense_name)
+        if conjugations is None:
+            conjugate = TENSE_CONJUGATORS[tense_name]
+            conjugations = self._tenses[tense_name] = conjugate(self.verb_data, self.dialect)
+        return conjugations
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(TENSE_CONJUGATORS)
+
+    def __len__(self) -> int:
+        return len(TENSE_CONJUGATORS)
+
+    def __contains__(self, tense_name) -> bool:
+        return tense_name in TENSE_CONJUGATORS
+
+    def built_tenses(self) -> Dict[str, Any]:
+        """
+        Return the tenses conjugated so far, without building the others.
+        """
+        return dict(self._tenses)
+
+    def __repr__(self) -> str:
+        return f"LazyParadigm({self.verb_data.get('verb')!r}, {self.dialect!r}, built={self._tenses!r})"
+
+
+def generate_lazy_paradigm(verb_data: Dict[str, Any], dialect = "O") -> LazyParadigm:
+    """
+    Create a paradigm whose tenses are conjugated on first access.
+
+    Args:
+        verb_data (dict): The data of the current verb.
+
+    Returns:
+        LazyParadigm: A read-only mapping of tense name to conjugations.
+    """
+    return LazyParadigm(verb_data, dialect)
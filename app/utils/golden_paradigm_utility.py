@@ -0,0 +1,288 @@
+import json
+import os
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from app.utils.batch_conjugation_utility import generate_full_paradigms
+from app.utils.load_verbs_utility import load_verbs
+
+GOLDEN_FORMAT = 1
+
+# Bytes of a slot hash and of a tense hash; they are stored as hex
+SLOT_HASH_SIZE = 4
+TENSE_HASH_SIZE = 8
+
+# One slot whose form differs from the corpus. `expected` is the corpus hash, or None
+# for a slot (or verb) the corpus does not have; `form` is the generated
+# "form (lytic)", or None for a slot (or verb) that is no longer generated. A tense
+# whose slots all match but whose hash does not (e.g. reordered forms) is reported
+# with no slot, the tense hash and every generated form.
+SlotDifference = namedtuple('SlotDifference', ['verb', 'dialect', 'tense', 'slot', 'expected', 'form'])
+
+VerifyStats = namedtuple('VerifyStats', ['verbs', 'tenses', 'differences', 'seconds'])
+
+# Verbs and corpus being verified, loaded once per worker process
+_worker_verbs: Optional[Sequence[Dict[str, Any]]] = None
+_worker_corpus: Optional[Dict[str, Any]] = None
+
+
+def _hash(text: str, size: int) -> str:
+    return blake2b(text.encode('utf-8'), digest_size=size).hexdigest()
+
+
+def iter_slots(conjugations: Dict[str, List[Tuple[str, str, str]]]) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield (slot, form, lytic) for every form of a conjugated tense. Slots are named
+    "<pronoun> <marker>", with "#2", "#3", ... for later forms of the same pronoun
+    and marker, so no form is hidden behind another.
+    """
+    seen: Dict[str, int] = {}
+    for pronoun, forms in conjugations.items():
+        for form, lytic, marker in forms:
+            slot = f"{pronoun} {marker}"
+            seen[slot] = seen.get(slot, 0) + 1
+            yield (slot if seen[slot] == 1 else f"{slot}#{seen[slot]}"), form, lytic
+
+
+def slot_hashes(conjugations: Dict[str, List[Tuple[str, str, str]]]) -> Dict[str, str]:
+    """
+    Hash the form and lytic type of every slot of a conjugated tense.
+    """
+    return {slot: _hash(f"{form}\t{lytic}", SLOT_HASH_SIZE) for slot, form, lytic in iter_slots(conjugations)}
+
+
+def tense_hash(conjugations: Dict[str, List[Tuple[str, str, str]]]) -> str:
+    """
+    Hash a whole conjugated tense, slots in order, so an unchanged tense is confirmed
+    with one hash and one comparison; slot hashes are only needed when it changed.
+    """
+    return _hash('\n'.join(f"{pronoun} {marker}\t{form}\t{lytic}"
+                           for pronoun, forms in conjugations.items() for form, lytic, marker in forms),
+                 TENSE_HASH_SIZE)
+
+
+def verb_keys(verbs: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    The corpus key of each verb: its name, with "#2", "#3", ... for later entries
+    of the same name.
+    """
+    seen: Dict[str, int] = {}
+    for verb_data in verbs:
+        verb = verb_data['verb']
+        seen[verb] = seen.get(verb, 0) + 1
+        yield verb if seen[verb] == 1 else f"{verb}#{seen[verb]}"
+
+
+def build_corpus(verbs: Sequence[Dict[str, Any]], dialects: Sequence[str] = ("O",)) -> Dict[str, Any]:
+    """
+    Hash the paradigm of every verb, per tense and dialect.
+
+    Each tense is stored as [tense hash, layout, slot hashes]: `layout` indexes the
+    corpus' list of slot name lists, shared by every tense with the same slots, and
+    the slot hashes are concatenated in layout order.
+
+    Returns:
+        dict: {'format': GOLDEN_FORMAT, 'layouts': [[slot, ...], ...],
+            'dialects': {dialect: {verb key: {tense: [tense hash, layout, slot hashes]}}}}
+    """
+    layouts: Dict[Tuple[str, ...], int] = {}
+    corpus = {'format': GOLDEN_FORMAT, 'layouts': [], 'dialects': {}}
+    keys = list(verb_keys(verbs))
+    for dialect in dialects:
+        entries = corpus['dialects'][dialect] = {}
+        for key, paradigm in zip(keys, generate_full_paradigms(verbs, dialect)):
+            tenses = entries[key] = {}
+            for tense, conjugations in paradigm.items():
+                slots = slot_hashes(conjugations)
+                layout = layouts.setdefault(tuple(slots), len(layouts))
+                if layout == len(corpus['layouts']):
+                    corpus['layouts'].append(list(slots))
+                tenses[tense] = [tense_hash(conjugations), layout, ''.join(slots.values())]
+    return corpus
+
+
+def write_corpus(corpus: Dict[str, Any], corpus_path: str) -> None:
+    # One verb per line keeps diffs of the corpus readable
+    with open(corpus_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(f'{{"format": {corpus["format"]},\n"layouts": [\n')
+        f.write(',\n'.join(json.dumps(layout) for layout in corpus['layouts']))
+        f.write('\n],\n"dialects": {\n')
+        dialects = [f'{json.dumps(dialect)}: {{\n' + ',\n'.join(
+            f'{json.dumps(key, ensure_ascii=False)}: {json.dumps(tenses, ensure_ascii=False)}'
+            for key, tenses in entries.items()) + '\n}' for dialect, entries in corpus['dialects'].items()]
+        f.write(',\n'.join(dialects))
+        f.write('\n}}\n')
+
+
+def read_corpus(corpus_path: str) -> Dict[str, Any]:
+    with open(corpus_path, encoding='utf-8') as f:
+        corpus = json.load(f)
+    if corpus.get('format') != GOLDEN_FORMAT:
+        raise ValueError(f"Unsupported golden corpus format {corpus.get('format')!r} in '{corpus_path}'.")
+    return corpus
+
+
+def compare_paradigm(verb: str, dialect: str, paradigm: Dict[str, Any], expected: Optional[Dict[str, List]],
+                     layouts: List[List[str]]) -> List[SlotDifference]:
+    """
+    The slots of a generated paradigm that differ from its corpus entry.
+    """
+    if expected is None:
+        return [SlotDifference(verb, dialect, None, None, None, None)]
+    differences = []
+    for tense in list(paradigm) + [tense for tense in expected if tense not in paradigm]:
+        conjugations = paradigm.get(tense)
+        expected_hash, layout, packed = expected.get(tense, (None, None, ''))
+        if conjugations is None:
+            differences.append(SlotDifference(verb, dialect, tense, None, expected_hash, None))
+            continue
+        if tense_hash(conjugations) == expected_hash:
+            continue
+        actual_slots = slot_hashes(conjugations)
+        expected_slots = {} if layout is None else {
+            slot: packed[idx * SLOT_HASH_SIZE * 2:(idx + 1) * SLOT_HASH_SIZE * 2]
+            for idx, slot in enumerate(layouts[layout])}
+        forms = {slot: f"{form} ({lytic})" for slot, form, lytic in iter_slots(conjugations)}
+        tense_differences = len(differences)
+        for slot, digest in actual_slots.items():
+            if expected_slots.get(slot) != digest:
+                differences.append(SlotDifference(verb, dialect, tense, slot, expected_slots.get(slot), forms[slot]))
+        for slot, digest in expected_slots.items():
+            if slot not in actual_slots:
+                differences.append(SlotDifference(verb, dialect, tense, slot, digest, None))
+        if len(differences) == tense_differences:
+            # Every slot matches, so the forms differ in order
+            differences.append(SlotDifference(verb, dialect, tense, None, expected_hash,
+                                              ', '.join(f"{slot}: {form}" for slot, form in forms.items())))
+    return differences
+
+
+def _init_worker(data_file: str, corpus_path: str) -> None:
+    global _worker_verbs, _worker_corpus
+    _worker_verbs = load_verbs(data_file)
+    _worker_corpus = read_corpus(corpus_path)
+
+
+def _verify_chunk(start: int, end: int, keys: List[str]) -> Tuple[int, List[SlotDifference]]:
+    """
+    Regenerate verbs [start, end) of the worker's data file in every corpus dialect
+    and compare them with the corpus.
+
+    Returns:
+        (int, list): The number of tenses compared and the differing slots.
+    """
+    verbs = _worker_verbs[start:end]
+    tenses = 0
+    differences = []
+    for dialect, entries in _worker_corpus['dialects'].items():
+        for key, paradigm in zip(keys, generate_full_paradigms(verbs, dialect)):
+            tenses += len(paradigm)
+            differences.extend(compare_paradigm(key, dialect, paradigm, entries.get(key), _worker_corpus['layouts']))
+    return tenses, differences
+
+
+def verify_corpus(data_file: str, corpus_path: str, workers: Optional[int] = None,
+                  chunk_size: int = 500) -> Tuple[List[SlotDifference], VerifyStats]:
+    """
+    Regenerate every paradigm of a data file and compare it with a golden corpus.
+
+    Verbs are split into chunks of `chunk_size` that worker processes conjugate
+    and compare; each worker loads the data file and the corpus itself, so only
+    index ranges and the differing slots cross process boundaries. Tenses whose
+    hash matches are not looked at further.
+
+    Args:
+        data_file (str): Path to the verb JSON file.
+        corpus_path (str): Path to the corpus written by `write_corpus`.
+        workers (int, optional): Number of worker processes; 1 verifies in this process.
+            Defaults to the number of CPUs.
+        chunk_size (int): Number of verbs per task.
+
+    Returns:
+        (list, VerifyStats): The differing slots, in verb order, and totals. Verbs of
+            the corpus that are not in the data file are reported last.
+    """
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+
+    # Make sure the compiled lexicon is up to date before the workers open it
+    verbs = load_verbs(data_file)
+    keys = list(verb_keys(verbs))
+    corpus = read_corpus(corpus_path)
+    ranges = [(start, min(start + chunk_size, len(keys))) for start in range(0, len(keys), chunk_size)]
+
+    tenses = 0
+    differences: List[SlotDifference] = []
+    executor = None
+    try:
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                           initargs=(data_file, corpus_path))
+        else:
+            _init_worker(data_file, corpus_path)
+        pending = deque()
+        for start, end in ranges:
+            if executor is None:
+                pending.append(_verify_chunk(start, end, keys[start:end]))
+            else:
+                pending.append(executor.submit(_verify_chunk, start, end, keys[start:end]))
+        for result in pending:
+            chunk_tenses, chunk_differences = result if executor is None else result.result()
+            tenses += chunk_tenses
+            differences.extend(chunk_differences)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    known = set(keys)
+    for dialect, entries in corpus['dialects'].items():
+        for key, expected in entries.items():
+            if key not in known:
+                differences.extend(SlotDifference(key, dialect, tense, None, digest[0], None)
+                                   for tense, digest in expected.items())
+
+    return differences, VerifyStats(len(keys), tenses, len(differences), time.perf_counter() - started)
+
+
+def format_difference(difference: SlotDifference) -> str:
+    where = ' '.join(part for part in (difference.verb, difference.dialect, difference.tense, difference.slot)
+                     if part)
+    if difference.expected is None:
+        return f"{where}: not in the corpus" + (f", generated {difference.form}" if difference.form else '')
+    if difference.form is None:
+        return f"{where}: no longer generated (expected {difference.expected})"
+    return f"{where}: generated {difference.form}, expected hash {difference.expected}"
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description='Build or verify the golden paradigm corpus.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build_parser = subparsers.add_parser('build', help='Hash every paradigm of a data file into a corpus.')
+    build_parser.add_argument('json_file', help='Path to the verb JSON file.')
+    build_parser.add_argument('corpus', help='Path of the corpus file to write.')
+    build_parser.add_argument('-d', '--dialect', action='append', help='Dialect code; repeat for several. '
+                                                                       'Defaults to O.')
+    verify_parser = subparsers.add_parser('verify', help='Regenerate every paradigm and compare with a corpus.')
+    verify_parser.add_argument('json_file', help='Path to the verb JSON file.')
+    verify_parser.add_argument('corpus', help='Path of the corpus file.')
+    verify_parser.add_argument('-j', '--workers', type=int, help='Worker processes. Defaults to the number of CPUs.')
+    verify_parser.add_argument('--chunk-size', type=int, default=500, help='Verbs per task.')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        verbs = load_verbs(args.json_file)
+        write_corpus(build_corpus(verbs, args.dialect or ['O']), args.corpus)
+        print(f"Wrote the golden paradigms of {len(verbs):,} verbs to '{args.corpus}'.")
+    else:
+        differences, stats = verify_corpus(args.json_file, args.corpus, args.workers, args.chunk_size)
+        for difference in differences:
+            print(format_difference(difference))
+        print(f"Compared {stats.tenses:,} tenses of {stats.verbs:,} verbs in {stats.seconds:.2f}s: "
+              f"{stats.differences:,} differing slots.")
+        sys.exit(1 if differences else 0)
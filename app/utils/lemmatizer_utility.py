@@ -0,0 +1,169 @@
+import re
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Sequence, Set, Tuple
+
+from app.utils.conjugation_utility import conditional_root_endings, future_root_endings, past_habitual_root_endings, \
+    past_root_endings, present_root_endings
+from app.utils.mutation_utility import eclipse, lenite
+
+# Preverbal particles, as typed before the verb form ("níor bhris") or elided onto it ("d'fhéach")
+PARTICLES = ('ní', 'níor', 'an', 'ar')
+ELIDED_PARTICLES = ("d'",)
+
+# Fields of a verb entry that hold a root the endings are added to
+ROOT_FIELDS = ('verb', 'future_root', 'present_root', 'past_root')
+
+_ENDING_TABLES = (present_root_endings, future_root_endings, past_habitual_root_endings, conditional_root_endings,
+                  past_root_endings)
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?")
+
+
+def _reverse_mutation(mutate) -> Dict[str, str]:
+    """
+    Map each mutated initial produced by `mutate` back to the initial it replaced,
+    e.g. {'bh': 'b', 'mb': 'b', ...}, by applying the rule to every letter.
+    """
+    reverse = {}
+    for letter in 'bcdfgmpst':
+        for following in 'aer':
+            mutated = mutate(letter + following)
+            if mutated != letter + following:
+                reverse[mutated[:-1]] = letter
+    return reverse
+
+
+LENITED_INITIALS = _reverse_mutation(lenite)
+ECLIPSED_INITIALS = _reverse_mutation(eclipse)
+
+
+def demutate(word: str) -> List[str]:
+    """
+    Every word that `word` could be before lenition or eclipsis, itself first.
+
+    For example 'bhris' -> ['bhris', 'bris'] and 'gcaill' -> ['gcaill', 'caill'].
+    """
+    candidates = [word]
+    for reverse in (LENITED_INITIALS, ECLIPSED_INITIALS):
+        for initial in (word[:3], word[:2]):
+            if initial in reverse and len(word) > len(initial):
+                candidates.append(reverse[initial] + word[len(initial):])
+                break
+    return candidates
+
+
+def normalize_token(token: str) -> str:
+    return token.strip().lower().replace('’', "'")
+
+
+def verb_endings(dialect: str = "O") -> Set[str]:
+    """
+    Every ending the conjugation tables add to a root in a dialect, including ''.
+    """
+    endings = {''}
+    for table in _ENDING_TABLES:
+        for widths in table.values():
+            for dialects in widths.values():
+                if isinstance(dialects, dict) and dialect in dialects:
+                    endings.update(dialects[dialect].values())
+    return endings
+
+
+class Lemmatizer:
+    """
+    Map inflected verb forms back to their dictionary forms without generating paradigms.
+
+    A form is analysed by stripping a preverbal particle, undoing lenition or eclipsis,
+    and splitting off a known ending; what is left is looked up in an index of the
+    roots of every verb (dictionary form, future root and any present/past roots).
+    Verbal nouns and adjectives are looked up whole. Building the index only reads
+    the entries, and analyses of repeated tokens are cached.
+    """
+
+    def __init__(self, verbs: Sequence[Dict[str, Any]], dialect: str = "O", cache_size: int = 100_000):
+        self.dialect = dialect
+        self._endings = verb_endings(dialect)
+        self._max_ending = max(map(len, self._endings))
+        self._roots: Dict[str, List[str]] = {}
+        self._entry_forms: Dict[str, List[str]] = {}
+        for verb_data in verbs:
+            verb = verb_data['verb']
+            for field in ROOT_FIELDS:
+                root = verb_data.get(field)
+                if root:
+                    self._add(self._roots, root.lower(), verb)
+            for field in ('verbal_nouns', 'verbal_adjectives'):
+                for forms in verb_data.get(field) or ():
+                    # Some entries list variants in one string: 'sní, snighe'
+                    for form in forms.split(','):
+                        self._add(self._entry_forms, form.strip().lower(), verb)
+        self._cached_lemmatize = lru_cache(maxsize=cache_size)(self._lemmatize) if cache_size else self._lemmatize
+
+    def lemmatize(self, token: str) -> List[str]:
+        """
+        The dictionary forms of the verbs that could produce a form.
+
+        Args:
+            token (str): A verb form, with or without its particle, e.g. 'níor bhris',
+                "d'fhéachamar" or 'gcaillfidh'.
+
+        Returns:
+            list: Dictionary forms, closest root match first; empty if none is found.
+        """
+        return list(self._cached_lemmatize(normalize_token(token)))
+
+    def lemmatize_text(self, text: str) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Yield (word, lemmas) for every word of a text; particles and other
+        non-verbs get an empty list.
+        """
+        lemmatize = self._cached_lemmatize
+        for match in _WORD_PATTERN.finditer(normalize_token(text)):
+            word = match.group()
+            yield word, list(lemmatize(word)) if word not in PARTICLES else []
+
+    # --- Internals ---
+
+    @staticmethod
+    def _add(index: Dict[str, List[str]], key: str, verb: str) -> None:
+        verbs = index.setdefault(key, [])
+        if verb not in verbs:
+            verbs.append(verb)
+
+    def _lemmatize(self, token: str) -> Tuple[str, ...]:
+        particle, _, word = token.rpartition(' ')
+        if particle and particle not in PARTICLES:
+            return ()
+        for elided in ELIDED_PARTICLES:
+            if word.startswith(elided):
+                word = word[len(elided):]
+        if not word:
+            return ()
+
+        roots, endings, entry_forms = self._roots, self._endings, self._entry_forms
+        lemmas = []
+        for candidate in demutate(word):
+            lemmas.extend(entry_forms.get(candidate, ()))
+            # Longest root first: 'scairteann' is 'scairt' + 'eann' before it is anything shorter
+            for cut in range(len(candidate), max(0, len(candidate) - self._max_ending) - 1, -1):
+                verbs = roots.get(candidate[:cut])
+                if verbs is not None and candidate[cut:] in endings:
+                    lemmas.extend(verbs)
+        return tuple(dict.fromkeys(lemmas))
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    from app.utils.load_verbs_utility import load_verbs
+
+    parser = argparse.ArgumentParser(description='Print the verb lemmas of each word read from standard input.')
+    parser.add_argument('json_file', help='Path to the verb JSON file.')
+    parser.add_argument('-d', '--dialect', default='O', help='Dialect code.')
+    args = parser.parse_args()
+
+    lemmatizer = Lemmatizer(load_verbs(args.json_file), args.dialect)
+    for line in sys.stdin:
+        for word, lemmas in lemmatizer.lemmatize_text(line):
+            if lemmas:
+                print(f"{word}\t{', '.join(lemmas)}")
@@ -0,0 +1,279 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+LEXICON_MAGIC = b'IVQLEX\x00\x00'
+LEXICON_VERSION = 2
+LEXICON_SUFFIX = '.ivqlex'
+
+# magic, version, record count, source mtime (ns), source size,
+# string index offset, string data offset, list table offset, record offset, skipped items offset
+_HEADER = struct.Struct('<8sIIqqQQQQQ')
+
+# verb, future_root, impersonal_present, class, width, definition,
+# verbal nouns (start, count), verbal adjectives (start, count)
+_RECORD = struct.Struct('<IIIiIIIIII')
+
+_NONE = 0xFFFFFFFF
+
+
+class LexiconFormatError(ValueError):
+    """
+    Raised when a compiled lexicon file is missing, truncated or of another version.
+    """
+
+
+def compiled_lexicon_path(data_file: str) -> str:
+    """
+    Get the path of the compiled lexicon that sits next to a verb data file.
+
+    Args:
+        data_file (str): Path to the verb JSON file.
+
+    Returns:
+        str: Path to the compiled lexicon.
+    """
+    return os.path.splitext(data_file)[0] + LEXICON_SUFFIX
+
+
+def compile_lexicon(entries: Iterable[Dict[str, Any]], lexicon_path: str, source_path: str,
+                    skipped: Iterable[Tuple[int, int, str]] = ()) -> int:
+    """
+    Write verb entries to a binary lexicon.
+
+    The file holds a deduplicated UTF-8 string table, a table of string ids for
+    the verbal noun/adjective lists, one fixed-width record per verb and, as JSON,
+    the items of the source that were skipped, so later loads can still report
+    them. It is written to a temporary file and renamed into place.
+
+    Args:
+        entries (iterable): The verb entries, as built by `load_verbs`.
+        lexicon_path (str): Where to write the compiled lexicon.
+        source_path (str): The JSON file the entries came from; its size and
+            modification time are recorded so staleness can be detected.
+        skipped (iterable, optional): (index, offset, message) of every item of the
+            source that was skipped, e.g. VerbLoadErrors. It is read once `entries`
+            is exhausted, so it may be filled while they are produced.
+
+    Returns:
+        int: The number of records written.
+    """
+    string_ids: Dict[str, int] = {}
+    string_data = bytearray()
+    string_index = array('I', [0])
+    list_table = array('I')
+    records = bytearray()
+
+    def sid(value: Optional[str]) -> int:
+        if value is None:
+            return _NONE
+        if not isinstance(value, str):
+            raise LexiconFormatError(f"Cannot compile non-string value {value!r} of '{entry['verb']}'.")
+        string_id = string_ids.get(value)
+        if string_id is None:
+            string_id = string_ids[value] = len(string_ids)
+            string_data.extend(value.encode('utf-8'))
+            string_index.append(len(string_data))
+        return string_id
+
+    def list_ref(values: Optional[List[str]]):
+        if values is None:
+            return _NONE, 0
+        if not isinstance(values, list):
+            raise LexiconFormatError(f"Cannot compile non-list value {values!r} of '{entry['verb']}'.")
+        start = len(list_table)
+        list_table.extend(sid(value) for value in values)
+        return start, len(values)
+
+    count = 0
+    for entry in entries:
+        if not isinstance(entry['class'], int):
+            raise LexiconFormatError(f"Cannot compile non-integer class {entry['class']!r} of '{entry['verb']}'.")
+        records += _RECORD.pack(
+            sid(entry['verb']), sid(entry['future_root']), sid(entry.get('impersonal_present')),
+            entry['class'], sid(entry['width']), sid(entry['definition']),
+            *list_ref(entry.get('verbal_nouns')), *list_ref(entry.get('verbal_adjectives')),
+        )
+        count += 1
+
+    source_stat = os.stat(source_path)
+    string_index_offset = _HEADER.size
+    string_data_offset = string_index_offset + len(string_index) * 4
+    list_table_offset = string_data_offset + len(string_data)
+    list_table_offset += -list_table_offset % 4
+    records_offset = list_table_offset + len(list_table) * 4
+    skipped_offset = records_offset + len(records)
+    skipped_data = json.dumps([list(item) for item in skipped], ensure_ascii=False).encode('utf-8')
+    header = _HEADER.pack(LEXICON_MAGIC, LEXICON_VERSION, count, source_stat.st_mtime_ns, source_stat.st_size,
+                          string_index_offset, string_data_offset, list_table_offset, records_offset,
+                          skipped_offset)
+
+    directory = os.path.dirname(os.path.abspath(lexicon_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=LEXICON_SUFFIX + '.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(header)
+            file.write(string_index.tobytes())
+            file.write(string_data)
+            file.write(b'\x00' * (list_table_offset - string_data_offset - len(string_data)))
+            file.write(list_table.tobytes())
+            file.write(records)
+            file.write(skipped_data)
+        os.replace(temp_path, lexicon_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return count
+
+
+def lexicon_is_stale(lexicon_path: str, source_path: str) -> bool:
+    """
+    Check whether a compiled lexicon is missing or older than its JSON source.
+
+    Args:
+        lexicon_path (str): Path to the compiled lexicon.
+        source_path (str): Path to the verb JSON file.
+
+    Returns:
+        bool: True if the lexicon has to be (re)compiled.
+    """
+    try:
+        with open(lexicon_path, 'rb') as file:
+            header = file.read(_HEADER.size)
+        source_stat = os.stat(source_path)
+    except OSError:
+        return True
+    if len(header) < _HEADER.size:
+        return True
+    magic, version, _, mtime_ns, size = _HEADER.unpack(header)[:5]
+    return (magic != LEXICON_MAGIC or version != LEXICON_VERSION
+            or mtime_ns != source_stat.st_mtime_ns or size != source_stat.st_size)
+
+
+class Lexicon(Sequence):
+    """
+    Memory-mapped, read-only view of a compiled lexicon.
+
+    Opening it only reads the header; each verb entry is decoded the first time it
+    is accessed and then kept, so changes made to an entry (e.g. an edited
+    definition) persist for the lifetime of the view. Edits recorded in the edit
+    journal are applied as entries are decoded (see `apply_edits`).
+    """
+
+    def __init__(self, lexicon_path: str):
+        self.path = lexicon_path
+        with open(lexicon_path, 'rb') as file:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise LexiconFormatError(f"Lexicon '{lexicon_path}' is empty.")
+        if len(self._map) < _HEADER.size:
+            raise LexiconFormatError(f"Lexicon '{lexicon_path}' is truncated.")
+        (magic, version, self._count, _, _, self._string_index_offset, self._string_data_offset,
+         self._list_table_offset, self._records_offset, self._skipped_offset) = _HEADER.unpack_from(self._map, 0)
+        if magic != LEXICON_MAGIC or version != LEXICON_VERSION:
+            raise LexiconFormatError(f"'{lexicon_path}' is not a version {LEXICON_VERSION} verb lexicon.")
+        if not self._records_offset + self._count * _RECORD.size <= self._skipped_offset <= len(self._map):
+            raise LexiconFormatError(f"Lexicon '{lexicon_path}' is truncated.")
+        self._entries: Dict[int, Dict[str, Any]] = {}
+        self._edits: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("lexicon index out of range")
+        entry = self._entries.get(index)
+        if entry is None:
+            entry = self._entries[index] = self._decode(index)
+            changes = self._edits.get(entry['verb'])
+            if changes:
+                entry.update(changes)
+        return entry
+
+    def apply_edits(self, edits: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Overlay edits on the entries of the lexicon without touching the file.
+
+        Args:
+            edits (dict): verb -> {field: value}, as returned by `read_journal`.
+        """
+        self._edits = edits
+        for entry in self._entries.values():
+            changes = edits.get(entry['verb'])
+            if changes:
+                entry.update(changes)
+
+    def skipped_items(self) -> List[Tuple[int, int, str]]:
+        """
+        The (index, offset, message) of every item of the source that was skipped
+        when the lexicon was compiled.
+        """
+        return [tuple(item) for item in json.loads(self._map[self._skipped_offset:].decode('utf-8'))]
+
+    def _string(self, string_id: int) -> Optional[str]:
+        if string_id == _NONE:
+            return None
+        start, end = struct.unpack_from('<II', self._map, self._string_index_offset + string_id * 4)
+        base = self._string_data_offset
+        return self._map[base + start:base + end].decode('utf-8')
+
+    def _list(self, start: int, count: int) -> Optional[List[str]]:
+        if start == _NONE:
+            return None
+        ids = struct.unpack_from(f'<{count}I', self._map, self._list_table_offset + start * 4)
+        return [self._string(string_id) for string_id in ids]
+
+    def _decode(self, index: int) -> Dict[str, Any]:
+        (verb, future_root, impersonal_present, verb_class, width, definition,
+         nouns_start, nouns_count, adjectives_start, adjectives_count) = _RECORD.unpack_from(
+            self._map, self._records_offset + index * _RECORD.size)
+        return {
+            'verb': self._string(verb),
+            'future_root': self._string(future_root),
+            'impersonal_present': self._string(impersonal_present),
+            'class': verb_class,
+            'width': self._string(width),
+            'definition': self._string(definition),
+            'verbal_nouns': self._list(nouns_start, nouns_count),
+            'verbal_adjectives': self._list(adjectives_start, adjectives_count),
+        }
+
+
+def open_lexicon(lexicon_path: str) -> Lexicon:
+    """
+    Memory-map a compiled lexicon.
+
+    Args:
+        lexicon_path (str): Path to the compiled lexicon.
+
+    Returns:
+        Lexicon: A lazily decoded sequence of verb entries.
+    """
+    return Lexicon(lexicon_path)
+
+
+if __name__ == "__main__":
+    import argparse
+    from app.utils.load_verbs_utility import load_verbs_json
+
+    parser = argparse.ArgumentParser(description='Compile a verb JSON file to a binary lexicon.')
+    parser.add_argument('json_file', help='Path to the verb JSON file.')
+    parser.add_argument('-o', '--output', help='Path of the compiled lexicon. Defaults to the JSON path with '
+                                               f'a {LEXICON_SUFFIX} suffix.')
+    args = parser.parse_args()
+    output = args.output or compiled_lexicon_path(args.json_file)
+    errors = []
+    written = compile_lexicon(load_verbs_json(args.json_file, errors), output, args.json_file, errors)
+    print(f"Compiled {written} verbs to '{output}', skipping {len(errors)} item(s).")
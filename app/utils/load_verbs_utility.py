@@ -1,8 +1,17 @@
+import codecs
 import json
+import logging
+import os
+import re
 
+from app.utils.edit_journal_utility import apply_edits, read_journal
 from app.utils.file_utility import ensure_data_file, get_data_file_path
+from app.utils.lexicon_utility import LexiconFormatError, compile_lexicon, compiled_lexicon_path, \
+    lexicon_is_stale, open_lexicon
 
-from typing import TypedDict, Optional, List
+from typing import TypedDict, Optional, List, Sequence, NamedTuple, Callable, Iterator
+
+logger = logging.getLogger(__name__)
 
 VerbEntry = TypedDict('VerbEntry', {
     'verb': str,
@@ -15,37 +24,281 @@ VerbEntry = TypedDict('VerbEntry', {
     'verbal_adjectives': Optional[List[str]],
 }, total=False)
 
-def load_verbs(custom_path: str = None) -> List[VerbEntry]:
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+class VerbLoadError(NamedTuple):
+    """
+    A verb data item that could not be loaded.
+    """
+    index: int  # Position of the item in the top-level array
+    offset: int  # Byte offset of the item in the file
+    message: str
+
+def load_verbs(custom_path: str = None, errors: Optional[List[VerbLoadError]] = None) -> Sequence[VerbEntry]:
     """
     Load the verbs from the JSON data file.
 
+    The JSON file is compiled to a binary lexicon next to it the first time it is
+    loaded (and again whenever it changes); later loads memory-map the lexicon and
+    decode entries on access. If the lexicon cannot be written or read, the JSON
+    file is parsed directly. Edits recorded in the file's edit journal are applied
+    on top of the entries.
+
     Args:
         custom_path (str, optional): Custom path to the verb data file. Defaults to None.
+        errors (list, optional): Receives a VerbLoadError for every item of the JSON
+            file that is skipped; the compiled lexicon keeps them, so they are reported
+            on every load.
 
     Returns:
-        List[VerbEntry]: A list of verb entries with their data.
+        Sequence[VerbEntry]: A sequence of verb entries with their data.
+    """
+    ensure_data_file(custom_path)
+    data_file = get_data_file_path(custom_path)
+    edits = read_journal(data_file)
+    try:
+        lexicon = load_compiled_verbs(data_file, errors)
+    except (OSError, LexiconFormatError) as e:
+        logger.warning("Falling back to parsing '%s': %s", data_file, e)
+    else:
+        lexicon.apply_edits(edits)
+        return lexicon
+    return list(apply_edits(load_verbs_json(data_file, errors), edits))
+
+def iter_verb_chunks(custom_path: str = None, chunk_size: int = 1000,
+                     errors: Optional[List[VerbLoadError]] = None,
+                     on_progress: Optional[Callable[[int, int], None]] = None) -> Iterator[Sequence[VerbEntry]]:
+    """
+    Load the verbs of a data file as a series of chunks.
+
+    A fresh compiled lexicon is yielded whole, as a single lazily decoded chunk;
+    otherwise the JSON file is streamed and the lexicon is compiled once the last
+    chunk has been produced.
+    Meant for background loading, where the first chunk can be used before the
+    whole file has been read. Edits from the file's edit journal are applied.
+
+    Args:
+        custom_path (str, optional): Custom path to the verb data file. Defaults to None.
+        chunk_size (int): Number of entries per chunk parsed from JSON.
+        errors (list, optional): Receives a VerbLoadError for every skipped item.
+        on_progress (callable, optional): Called as on_progress(done, total), in bytes
+            when parsing JSON or in entries when reading a compiled lexicon.
+
+    Yields:
+        Sequence[VerbEntry]: Consecutive chunks of verb entries: lists, or the whole
+            memory-mapped lexicon.
     """
     ensure_data_file(custom_path)
     data_file = get_data_file_path(custom_path)
-    with open(data_file, 'r', encoding='utf-8') as file:
-        data = json.load(file)
+    lexicon_path = compiled_lexicon_path(data_file)
+    edits = read_journal(data_file)
 
-    verbs: List[VerbEntry] = []
-    for item in data:
+    if not lexicon_is_stale(lexicon_path, data_file):
         try:
-            verb_entry: VerbEntry = {
-                'verb': item['verb'],
-                'future_root': item['future_root'],
-                'impersonal_present': item.get('impersonal_present'),
-                'class': item['class'],
-                'width': item['width'],
-                'definition': item['definition'],
-                'verbal_nouns': item.get('verbal_nouns'),
-                'verbal_adjectives': item.get('verbal_adjectives'),
-            }
-            verbs.append(verb_entry)
-        except KeyError as e:
-            print(f"Missing key {e} in item: {item}")
-            # Handle the error as needed
-
-    return verbs
+            lexicon = open_lexicon(lexicon_path)
+        except (OSError, LexiconFormatError) as e:
+            logger.warning("Falling back to parsing '%s': %s", data_file, e)
+        else:
+            lexicon.apply_edits(edits)
+            if errors is not None:
+                errors.extend(VerbLoadError(*item) for item in lexicon.skipped_items())
+            # Slicing would decode every entry into a list
+            yield lexicon
+            if on_progress is not None:
+                on_progress(len(lexicon), len(lexicon))
+            return
+
+    # The lexicon is compiled from the unedited entries; edits stay in the journal
+    entries: List[VerbEntry] = []
+    skipped = [] if errors is None else errors
+    for entry in stream_verbs(data_file, skipped, on_progress):
+        entries.append(entry)
+        if len(entries) % chunk_size == 0:
+            yield list(apply_edits(entries[-chunk_size:], edits))
+    if len(entries) % chunk_size:
+        yield list(apply_edits(entries[-(len(entries) % chunk_size):], edits))
+
+    try:
+        compile_lexicon(entries, lexicon_path, data_file, skipped)
+    except (OSError, LexiconFormatError) as e:
+        logger.warning("Could not compile verb lexicon '%s': %s", lexicon_path, e)
+
+def load_compiled_verbs(data_file: str, errors: Optional[List[VerbLoadError]] = None) -> Sequence[VerbEntry]:
+    """
+    Load verbs through the compiled lexicon of a data file, rebuilding it if stale.
+
+    Args:
+        data_file (str): Path to the verb JSON file.
+        errors (list, optional): Receives a VerbLoadError for every item of the JSON
+            file that was skipped when the lexicon was compiled.
+
+    Returns:
+        Sequence[VerbEntry]: A memory-mapped, lazily decoded sequence of verb entries.
+    """
+    lexicon_path = compiled_lexicon_path(data_file)
+    if lexicon_is_stale(lexicon_path, data_file):
+        # Entries are streamed straight into the compiler, never held as one list
+        skipped: List[VerbLoadError] = []
+        compile_lexicon(stream_verbs(data_file, skipped), lexicon_path, data_file, skipped)
+        logger.debug("Compiled verb lexicon '%s'", lexicon_path)
+    lexicon = open_lexicon(lexicon_path)
+    if errors is not None:
+        errors.extend(VerbLoadError(*item) for item in lexicon.skipped_items())
+    return lexicon
+
+def load_verbs_json(data_file: str, errors: Optional[List[VerbLoadError]] = None) -> List[VerbEntry]:
+    """
+    Parse every verb of a JSON data file.
+
+    Args:
+        data_file (str): Path to the verb JSON file.
+        errors (list, optional): Receives a VerbLoadError for every skipped item.
+
+    Returns:
+        List[VerbEntry]: A list of verb entries with their data.
+    """
+    return list(stream_verbs(data_file, errors))
+
+def stream_verbs(data_file: str, errors: Optional[List[VerbLoadError]] = None,
+                 on_progress: Optional[Callable[[int, int], None]] = None,
+                 chunk_size: int = 1 << 16) -> Iterator[VerbEntry]:
+    """
+    Parse the top-level JSON array of a verb data file one item at a time.
+
+    Only the current chunk and the item being parsed are held in memory, so the
+    first entries are available long before a large file has been read.
+
+    Args:
+        data_file (str): Path to the verb JSON file.
+        errors (list, optional): Receives a VerbLoadError for every item that is not
+            an object or lacks a required key. Such items are skipped.
+        on_progress (callable, optional): Called as on_progress(bytes_read, total_bytes)
+            after each chunk is read.
+        chunk_size (int): Number of bytes read at a time.
+
+    Yields:
+        VerbEntry: The entries, in file order.
+
+    Raises:
+        json.JSONDecodeError: If the file is not a JSON array; entries before the
+            malformed position have already been yielded.
+    """
+    decoder = json.JSONDecoder()
+    total_bytes = os.path.getsize(data_file)
+    with open(data_file, 'rb') as file:
+        text_decoder = codecs.getincrementaldecoder('utf-8')()
+        buffer = ''
+        pos = 0  # Parse position in buffer
+        offset = 0  # Byte offset of buffer[pos] in the file
+        bytes_read = 0
+        eof = False
+
+        def read_more():
+            nonlocal buffer, pos, offset, bytes_read, eof
+            chunk = file.read(chunk_size)
+            eof = not chunk
+            if not bytes_read and chunk.startswith(codecs.BOM_UTF8):
+                # Skip the byte order mark, keeping offsets relative to the file
+                offset += len(codecs.BOM_UTF8)
+                chunk = chunk[len(codecs.BOM_UTF8):]
+            bytes_read = file.tell()
+            # Drop the parsed prefix so the buffer only ever holds the current item
+            buffer = buffer[pos:] + text_decoder.decode(chunk, final=eof)
+            pos = 0
+            if on_progress is not None:
+                on_progress(bytes_read, total_bytes)
+
+        def advance(end):
+            nonlocal pos, offset
+            offset += len(buffer[pos:end].encode('utf-8'))
+            pos = end
+
+        def next_token():
+            # Skip whitespace and return the next character ('' at end of file)
+            while True:
+                advance(_WHITESPACE.match(buffer, pos).end())
+                if pos < len(buffer) or eof:
+                    return buffer[pos:pos + 1]
+                read_more()
+
+        def fail(message):
+            raise json.JSONDecodeError(f"{message} at byte {offset}", buffer, pos)
+
+        if next_token() != '[':
+            fail("Expected a JSON array")
+        advance(pos + 1)
+
+        index = 0
+        expect_item = True
+        while True:
+            token = next_token()
+            if token == ']' and (index == 0 or not expect_item):
+                return
+            if not token:
+                fail("Unterminated JSON array")
+            if not expect_item:
+                if token != ',':
+                    fail("Expected ',' or ']'")
+                advance(pos + 1)
+                expect_item = True
+                continue
+
+            # Decode one item, reading more data until it is complete
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if eof:
+                        raise json.JSONDecodeError(f"{e.msg} in item {index} at byte {offset}",
+                                                   e.doc, e.pos) from None
+                    read_more()
+                    continue
+                if end == len(buffer) and not eof:
+                    # A number or literal may continue in the next chunk
+                    read_more()
+                    continue
+                break
+
+            item_offset = offset
+            advance(end)
+            try:
+                if not isinstance(item, dict):
+                    raise TypeError(f"expected an object, got {type(item).__name__}")
+                entry = verb_entry_from_item(item)
+            except KeyError as e:
+                _record_load_error(errors, VerbLoadError(index, item_offset, f"Missing key {e}"))
+            except TypeError as e:
+                _record_load_error(errors, VerbLoadError(index, item_offset, str(e)))
+            else:
+                yield entry
+            index += 1
+            expect_item = False
+
+def _record_load_error(errors: Optional[List[VerbLoadError]], error: VerbLoadError) -> None:
+    logger.warning("Skipping verb item %d at byte %d: %s", error.index, error.offset, error.message)
+    if errors is not None:
+        errors.append(error)
+
+def verb_entry_from_item(item: dict) -> VerbEntry:
+    """
+    Build a verb entry from one item of the verb data file.
+
+    Args:
+        item (dict): A raw item from the JSON array.
+
+    Returns:
+        VerbEntry: The verb entry.
+
+    Raises:
+        KeyError: If a required key is missing.
+    """
+    return {
+        'verb': item['verb'],
+        'future_root': item['future_root'],
+        'impersonal_present': item.get('impersonal_present'),
+        'class': item['class'],
+        'width': item['width'],
+        'definition': item['definition'],
+        'verbal_nouns': item.get('verbal_nouns'),
+        'verbal_adjectives': item.get('verbal_adjectives'),
+    }
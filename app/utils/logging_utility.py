@@ -0,0 +1,125 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from typing import Dict, Optional, Union
+
+# Overrides the configured levels: "INFO" or "WARNING,app.utils.load_verbs_utility=DEBUG"
+LOG_LEVEL_ENV = 'VERB_QUIZ_LOG'
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record, with the message formatted only when written.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """
+    Parse "LEVEL,module=LEVEL,..." into {logger name: level}; the bare level is
+    the root logger's, under the name ''.
+    """
+    levels = {}
+    for part in filter(None, (part.strip() for part in spec.split(','))):
+        name, _, level = part.rpartition('=')
+        level_number = logging.getLevelName(level.strip().upper())
+        if not isinstance(level_number, int):
+            raise ValueError(f"Unknown log level '{level}' in '{spec}'")
+        levels[name.strip()] = level_number
+    return levels
+
+
+def configure_logging(log_file: Optional[str] = None, level: Union[int, str] = logging.INFO,
+                      module_levels: Optional[Dict[str, Union[int, str]]] = None, json_format: bool = False,
+                      max_bytes: int = LOG_MAX_BYTES, backup_count: int = LOG_BACKUP_COUNT) -> None:
+    """
+    Route all logging through a queue to a background writer thread.
+
+    Callers only put records on a queue; a QueueListener formats them and writes
+    them to `log_file`, rotated once it reaches `max_bytes`, or to stderr. Levels
+    are set per logger, so a disabled DEBUG call returns before its message is
+    built. Calling this again replaces the previous configuration.
+
+    Args:
+        log_file (str, optional): File to write to. Defaults to stderr; also used
+            if the file cannot be opened.
+        level: Level of the root logger. Defaults to INFO.
+        module_levels (dict, optional): Levels of individual loggers, e.g.
+            {'app.utils.load_verbs_utility': 'DEBUG'}.
+        json_format (bool): Write one JSON object per record instead of text lines.
+        max_bytes (int): Size at which the log file is rotated.
+        backup_count (int): Number of rotated files kept.
+
+    The VERB_QUIZ_LOG environment variable ("DEBUG" or
+    "INFO,app.gui=DEBUG") overrides `level` and `module_levels`.
+    """
+    global _listener, _queue_handler
+    shutdown_logging()
+
+    levels = {'': level, **(module_levels or {})}
+    if os.environ.get(LOG_LEVEL_ENV):
+        levels.update(parse_levels(os.environ[LOG_LEVEL_ENV]))
+
+    fallback_error = None
+    handler: logging.Handler
+    if log_file:
+        try:
+            handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                                           encoding='utf-8')
+        except OSError as e:
+            handler, fallback_error = logging.StreamHandler(sys.stderr), e
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT))
+
+    records = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+    _listener.start()
+
+    _queue_handler = logging.handlers.QueueHandler(records)
+    logging.getLogger().addHandler(_queue_handler)
+    for name, name_level in levels.items():
+        logging.getLogger(name or None).setLevel(name_level.upper() if isinstance(name_level, str) else name_level)
+
+    if fallback_error is not None:
+        logging.getLogger(__name__).error("Failed to write log to %s: %s", log_file, fallback_error)
+
+
+def shutdown_logging() -> None:
+    """
+    Write any queued records and stop the writer thread.
+    """
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,90 @@
+from functools import lru_cache
+from typing import Dict, Tuple
+
+VOWELS = 'aeiouáéíóú'
+
+# Initial -> lenited initial (séimhiú); 's' is handled separately, as it only
+# lenites before a vowel, l, n or r
+LENITION: Dict[str, str] = {initial: initial + 'h' for initial in 'bcdfgmpt'}
+S_LENITES_BEFORE = frozenset(VOWELS + 'lnr')
+
+# Initial -> eclipsed initial (urú)
+ECLIPSIS: Dict[str, str] = {
+    'b': 'mb',
+    'c': 'gc',
+    'd': 'nd',
+    'f': 'bhf',
+    'g': 'ng',
+    'p': 'bp',
+    't': 'dt',
+}
+
+# Initials that take d' after the past particle "do"
+ELIDING_INITIALS = frozenset(VOWELS + 'f')
+
+# Mutation kinds accepted by `mutate`
+LENITION_KIND = 'lenition'
+ECLIPSIS_KIND = 'eclipsis'
+PAST_PARTICLE_KIND = 'past_particle'
+
+MUTATION_CACHE_SIZE = 65536
+
+
+def starts_with_vowel_or_f(word: str) -> bool:
+    return word[:1] in ELIDING_INITIALS
+
+
+def lenite(root: str) -> str:
+    initial = root[:1]
+    mutated = LENITION.get(initial)
+    if mutated is not None:
+        return mutated + root[1:]
+    if initial == 's' and root[1:2] in S_LENITES_BEFORE:
+        return 'sh' + root[1:]
+    return root
+
+
+def eclipse(root: str) -> str:
+    mutated = ECLIPSIS.get(root[:1])
+    return root if mutated is None else mutated + root[1:]
+
+
+def add_past_particle(root: str) -> str:
+    """
+    The root after the past particle "do": lenited, and d' before a vowel or f.
+    """
+    lenited = lenite(root)
+    return f"d'{lenited}" if root[:1] in ELIDING_INITIALS else lenited
+
+
+MUTATION_KINDS = (LENITION_KIND, ECLIPSIS_KIND, PAST_PARTICLE_KIND)
+_KIND_INDEX = {kind: index for index, kind in enumerate(MUTATION_KINDS)}
+
+
+@lru_cache(maxsize=MUTATION_CACHE_SIZE)
+def mutations(root: str) -> Tuple[str, str, str]:
+    """
+    The lenited, eclipsed and past-particle forms of a root, memoized.
+
+    Every tense mutates the same roots again, so bulk generation repeats the same
+    few mutations; the cache keeps the results for the most recent
+    MUTATION_CACHE_SIZE roots.
+    """
+    return lenite(root), eclipse(root), add_past_particle(root)
+
+
+def mutate(root: str, kind: str) -> str:
+    """
+    Apply an initial mutation to a root, memoized per root by `mutations`.
+
+    Args:
+        root (str): The root to mutate.
+        kind (str): LENITION_KIND, ECLIPSIS_KIND or PAST_PARTICLE_KIND.
+
+    Returns:
+        str: The mutated root.
+
+    Raises:
+        KeyError: If the kind is unknown.
+    """
+    return mutations(root)[_KIND_INDEX[kind]]
@@ -0,0 +1,138 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Dict, Any, Callable, Optional, Set, Tuple
+
+from app.utils.full_paradigm_utility import generate_full_paradigm, generate_lazy_paradigm
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+CacheKey = Tuple[str, str, str]
+
+
+def verb_content_hash(verb_data: Dict[str, Any]) -> str:
+    """
+    Compute a stable content hash of a verb entry.
+
+    Args:
+        verb_data (dict): The data of the verb.
+
+    Returns:
+        str: A hex digest that changes whenever any field of the entry changes.
+    """
+    payload = json.dumps(verb_data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ParadigmCache:
+    """
+    Bounded LRU store of generated paradigms.
+
+    Entries are keyed by (verb, dialect, content hash), so an edited verb entry never
+    returns a stale paradigm. Callers that change an entry should still call
+    `invalidate` (or `clear` when a new data file is loaded) so the old paradigms
+    do not occupy the cache until they are evicted.
+    """
+
+    def __init__(self, maxsize: int = 256,
+                 generator: Callable[..., Dict[str, Any]] = generate_full_paradigm):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        self.maxsize = maxsize
+        self._generator = generator
+        self._entries: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._keys_by_verb: Dict[str, Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, verb_data: Dict[str, Any], dialect: str = "O") -> Dict[str, Any]:
+        """
+        Return the paradigm for a verb, generating and storing it on a miss.
+
+        Args:
+            verb_data (dict): The data of the verb.
+            dialect (str): The dialect code. Defaults to "O".
+
+        Returns:
+            dict: The paradigm, as returned by `generate_full_paradigm`.
+        """
+        key = (verb_data['verb'], dialect, verb_content_hash(verb_data))
+        with self._lock:
+            paradigm = self._entries.get(key)
+            if paradigm is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return paradigm
+            self.misses += 1
+
+        # Generate outside the lock; a concurrent miss on the same key only costs a duplicate build.
+        paradigm = self._generator(verb_data, dialect=dialect)
+
+        with self._lock:
+            self._entries[key] = paradigm
+            self._entries.move_to_end(key)
+            self._keys_by_verb.setdefault(key[0], set()).add(key)
+            while len(self._entries) > self.maxsize:
+                old_key, _ = self._entries.popitem(last=False)
+                self._forget_key(old_key)
+                self.evictions += 1
+        return paradigm
+
+    def invalidate(self, verb: str) -> int:
+        """
+        Drop every cached paradigm of a verb, whatever its dialect or content hash.
+
+        Args:
+            verb (str): The dictionary form of the verb.
+
+        Returns:
+            int: The number of cached paradigms removed.
+        """
+        with self._lock:
+            keys = self._keys_by_verb.pop(verb, set())
+            for key in keys:
+                self._entries.pop(key, None)
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Drop every cached paradigm. The hit/miss counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_verb.clear()
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def _forget_key(self, key: CacheKey) -> None:
+        keys = self._keys_by_verb.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_verb[key[0]]
+
+
+# Shared cache used by the GUI and the definition editor. It stores lazy paradigms,
+# so a cached verb keeps every tense conjugated so far and builds the rest on demand.
+paradigm_cache = ParadigmCache(generator=generate_lazy_paradigm)
+
+
+def get_full_paradigm(verb_data: Dict[str, Any], dialect: str = "O",
+                      cache: Optional[ParadigmCache] = None) -> Dict[str, Any]:
+    """
+    Cached counterpart of `generate_full_paradigm`.
+
+    Args:
+        verb_data (dict): The data of the current verb.
+        dialect (str): The dialect code. Defaults to "O".
+        cache (ParadigmCache, optional): The cache to use. Defaults to the shared cache.
+
+    Returns:
+        Mapping: Conjugations for all tenses; the shared cache builds each tense on first access.
+    """
+    return (cache or paradigm_cache).get(verb_data, dialect)
@@ -0,0 +1,183 @@
+import csv
+import io
+import os
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from json.encoder import encode_basestring
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+
+from app.utils.batch_conjugation_utility import generate_full_paradigms
+from app.utils.form_sampler_utility import ENTRY_FORM_TENSES
+from app.utils.load_verbs_utility import load_verbs
+
+EXPORT_COLUMNS = ('verb', 'tense', 'pronoun', 'lytic', 'marker', 'form', 'dialect')
+EXPORT_FORMATS = ('jsonl', 'csv', 'parquet')
+
+_JSONL_TEMPLATE = '{' + ', '.join(f'"{column}": %s' for column in EXPORT_COLUMNS) + '}\n'
+
+ExportStats = namedtuple('ExportStats', ['verbs', 'forms', 'seconds'])
+
+# Verbs of the data file being exported, loaded once per worker process
+_worker_verbs: Optional[Sequence[Dict[str, Any]]] = None
+
+
+def iter_form_rows(verbs: Sequence[Dict[str, Any]], dialect: str = "O") -> Iterator[Tuple[str, ...]]:
+    """
+    Yield one row per form of each verb, in EXPORT_COLUMNS order.
+
+    Conjugated forms come first, followed by the verbal nouns and adjectives of
+    the entry (with empty pronoun, lytic and marker columns).
+
+    Args:
+        verbs (sequence): The verb entries.
+        dialect (str): The dialect code. Defaults to "O".
+
+    Yields:
+        tuple: (verb, tense, pronoun, lytic, marker, form, dialect)
+    """
+    for verb_data, paradigm in zip(verbs, generate_full_paradigms(verbs, dialect)):
+        verb = verb_data['verb']
+        for tense, conjugations in paradigm.items():
+            for pronoun, forms in conjugations.items():
+                for form, lytic, marker in forms:
+                    yield verb, tense, pronoun, lytic, marker, form, dialect
+        for tense, field in ENTRY_FORM_TENSES.items():
+            if field is not None:
+                for form in verb_data.get(field) or ():
+                    yield verb, tense, '', '', '', form, dialect
+
+
+def _init_worker(data_file: str) -> None:
+    global _worker_verbs
+    _worker_verbs = load_verbs(data_file)
+
+
+def _export_chunk(start: int, end: int, fmt: str, dialect: str):
+    """
+    Conjugate verbs [start, end) of the worker's data file and encode their rows.
+
+    Returns:
+        (int, object): The number of forms and the encoded chunk: text for 'jsonl'
+            and 'csv', a dict of column lists for 'parquet'.
+    """
+    rows = list(iter_form_rows(_worker_verbs[start:end], dialect))
+    if fmt == 'jsonl':
+        # Same output as json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False), without building dicts
+        encoded = ''.join(_JSONL_TEMPLATE % tuple(map(encode_basestring, row)) for row in rows)
+    elif fmt == 'csv':
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        encoded = buffer.getvalue()
+    else:
+        encoded = {column: [row[idx] for row in rows] for idx, column in enumerate(EXPORT_COLUMNS)}
+    return len(rows), encoded
+
+
+def _ordered_chunks(executor: Optional[ProcessPoolExecutor], ranges: List[Tuple[int, int]], fmt: str,
+                    dialect: str, window: int) -> Iterator[Tuple[int, Any]]:
+    """
+    Yield encoded chunks in verb order, keeping at most `window` chunks in flight
+    so finished output never piles up in memory.
+    """
+    if executor is None:
+        for start, end in ranges:
+            yield _export_chunk(start, end, fmt, dialect)
+        return
+    pending = deque()
+    for start, end in ranges:
+        pending.append(executor.submit(_export_chunk, start, end, fmt, dialect))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class _ParquetSink:
+    def __init__(self, output_path: str):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("Exporting to Parquet requires pyarrow: pip install pyarrow") from None
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema([(column, pyarrow.string()) for column in EXPORT_COLUMNS])
+        self._writer = pyarrow.parquet.ParquetWriter(output_path, self._schema)
+
+    def write(self, columns: Dict[str, List[str]]) -> None:
+        # Each chunk becomes one row group
+        self._writer.write_table(self._pyarrow.Table.from_pydict(columns, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def export_paradigms(data_file: str, output_path: str, fmt: str = 'jsonl', dialect: str = "O",
+                     workers: Optional[int] = None, chunk_size: int = 500) -> ExportStats:
+    """
+    Write every form of every verb of a data file to a JSONL, CSV or Parquet file.
+
+    Verbs are split into chunks of `chunk_size` that worker processes conjugate and
+    encode; each worker loads the data file itself (memory-mapping the compiled
+    lexicon), so only index ranges and encoded output cross process boundaries.
+    Chunks are written in verb order as they complete.
+
+    Args:
+        data_file (str): Path to the verb JSON file.
+        output_path (str): Where to write the export.
+        fmt (str): 'jsonl', 'csv' or 'parquet' (requires pyarrow).
+        dialect (str): The dialect code. Defaults to "O".
+        workers (int, optional): Number of worker processes; 1 exports in this process.
+            Defaults to the number of CPUs.
+        chunk_size (int): Number of verbs per task.
+
+    Returns:
+        ExportStats: The number of verbs and forms written and the elapsed seconds.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}'; expected one of {', '.join(EXPORT_FORMATS)}.")
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+
+    # Make sure the compiled lexicon is up to date before the workers open it
+    verb_count = len(load_verbs(data_file))
+    ranges = [(start, min(start + chunk_size, verb_count)) for start in range(0, verb_count, chunk_size)]
+
+    sink = _ParquetSink(output_path) if fmt == 'parquet' else open(output_path, 'w', encoding='utf-8', newline='')
+    executor = None
+    forms = 0
+    try:
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data_file,))
+        else:
+            _init_worker(data_file)
+        if fmt == 'csv':
+            csv.writer(sink).writerow(EXPORT_COLUMNS)
+        for form_count, encoded in _ordered_chunks(executor, ranges, fmt, dialect, window=workers * 2):
+            sink.write(encoded)
+            forms += form_count
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        sink.close()
+    return ExportStats(verb_count, forms, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Export every conjugated form of every verb.')
+    parser.add_argument('json_file', help='Path to the verb JSON file.')
+    parser.add_argument('output', help='Path of the export file.')
+    parser.add_argument('-f', '--format', choices=EXPORT_FORMATS,
+                        help='Output format. Defaults to the output file extension, or jsonl.')
+    parser.add_argument('-d', '--dialect', default='O', help='Dialect code.')
+    parser.add_argument('-j', '--workers', type=int, help='Worker processes. Defaults to the number of CPUs.')
+    parser.add_argument('--chunk-size', type=int, default=500, help='Verbs per task.')
+    args = parser.parse_args()
+
+    extension = os.path.splitext(args.output)[1].lstrip('.').lower()
+    fmt = args.format or (extension if extension in EXPORT_FORMATS else 'jsonl')
+    stats = export_paradigms(args.json_file, args.output, fmt, args.dialect, args.workers, args.chunk_size)
+    print(f"Exported {stats.forms:,} forms of {stats.verbs:,} verbs to '{args.output}' in {stats.seconds:.2f}s "
+          f"({stats.forms / stats.seconds:,.0f} forms/s).")
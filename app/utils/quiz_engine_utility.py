@@ -0,0 +1,400 @@
+import logging
+import random
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.utils.form_index_utility import FormAnalysis, FormIndex
+from app.utils.form_sampler_utility import ENTRY_FORM_TENSES, FormSampler
+from app.utils.paradigm_cache_utility import ParadigmCache, get_full_paradigm
+from app.utils.verb_selection_utility import VerbSelection
+
+logger = logging.getLogger(__name__)
+
+# Quiz tenses offered by default (the GUI checkbox keys)
+DEFAULT_QUIZ_TENSES = ('present', 'past', 'future', 'conditional', 'verbal_noun', 'verbal_adjective',
+                       'dictionary_form')
+
+# Tenses whose answers have no pronoun/form or form marker to check
+NO_FORM_TENSES = ('verbal_noun', 'verbal_adjective', 'dictionary_form')
+
+
+class QuizError(Exception):
+    """
+    Raised when no question can be drawn with the current verbs and selections.
+    """
+    title = "Quiz Error"
+
+
+class NoVerbsLoadedError(QuizError):
+    title = "No Verbs Loaded"
+
+
+class NoFormsSelectedError(QuizError):
+    title = "No Forms Selected"
+
+
+class NoVerbsSelectedError(QuizError):
+    title = "No Verbs Selected"
+
+
+class NoFormsAvailableError(QuizError):
+    title = "No Forms Available"
+
+
+class Question(NamedTuple):
+    """
+    One quiz item and its correct answer.
+    """
+    verb_index: int
+    verb: str
+    definition: str
+    tense: str  # Paradigm tense ('Present', ...) or entry form ('verbal_noun', ...)
+    pronoun: str
+    form: str
+    form_type: str  # 'analytic' or 'synthetic', empty for entry forms
+    form_marker: str  # 'unmarked', 'negative' or 'interrogative', empty for entry forms
+    recall_only: bool  # Only the dictionary form is quizzed: recall the definition
+    ambiguous: bool = False  # Other verbs or slots produce the same form
+
+    @property
+    def has_form(self) -> bool:
+        """
+        Whether the answer includes a pronoun/form and a form marker.
+        """
+        return self.tense.lower() not in NO_FORM_TENSES
+
+    @property
+    def prompt(self) -> str:
+        if self.recall_only:
+            return f"Recall the definition for the verb:\n\n{self.verb}\n"
+        return f"Identify the verb, tense, form, and type:\n\n{self.form}\n"
+
+
+class Answer(NamedTuple):
+    """
+    A user's answer to a question.
+    """
+    verb: str = ''
+    tense: str = ''
+    form_marker: str = ''
+    pronoun: str = ''
+
+
+class AnswerResult(NamedTuple):
+    """
+    Feedback on an answer: (message, 'correct' | 'incorrect') pairs, in display order.
+
+    The feedback is given against whichever analysis of the form the answer matches
+    best; `alternatives` lists the analyses of the form other than the one quizzed.
+    """
+    feedback: List[Tuple[str, str]]
+    definition: str
+    alternatives: Tuple[FormAnalysis, ...] = ()
+
+    @property
+    def correct(self) -> bool:
+        return all(tag == 'correct' for _, tag in self.feedback)
+
+
+def _verb_sequence(verbs: Iterable[Dict[str, Any]]) -> Sequence[Dict[str, Any]]:
+    # Keep lazily decoded sequences such as a compiled lexicon; lists are copied
+    if isinstance(verbs, Sequence) and not isinstance(verbs, list):
+        return verbs
+    return list(verbs)
+
+
+class QuizEngine:
+    """
+    Draws quiz questions and checks answers, independent of any user interface.
+
+    The engine holds the verb list, the dialect, the selected tenses and verbs,
+    and the verb of the last question (for frozen quizzing). Forms are drawn with
+    a FormSampler and resolved through the shared paradigm cache. A FormIndex of
+    every form of the verbs lets answers be checked against any analysis that
+    produces the quizzed form, not only the one that was drawn.
+    """
+
+    def __init__(self, verbs: Sequence[Dict[str, Any]] = (), dialect: str = "O",
+                 selected_tenses: Iterable[str] = DEFAULT_QUIZ_TENSES,
+                 rng: Optional[random.Random] = None, cache: Optional[ParadigmCache] = None,
+                 form_index: Optional[FormIndex] = None, lazy_form_index: bool = True):
+        self.verbs: Sequence[Dict[str, Any]] = _verb_sequence(verbs)
+        self.dialect = dialect
+        self.selected_tenses = set(selected_tenses)
+        self.selection = VerbSelection()
+        self._rng = rng
+        self._cache = cache
+        self._sampler: Optional[FormSampler] = None
+        # May be shared between engines over the same verbs and dialect
+        self._form_index = form_index
+        # Without a lazy form index, questions are not flagged as ambiguous and answers are
+        # only checked against the drawn analysis until `set_form_index` supplies one
+        self._lazy_form_index = lazy_form_index
+        self._verb_indices: Dict[str, List[int]] = {}
+        self._index_verbs(0)
+        self._reset_current()
+
+    # --- Verbs and selections ---
+
+    def set_verbs(self, verbs: Iterable[Dict[str, Any]], selection: Optional[VerbSelection] = None) -> None:
+        """
+        Replace the verb list. Verb selections are reset and the current verb is dropped.
+
+        A sequence other than a list, e.g. a memory-mapped lexicon, is kept as it is
+        until verbs are added; anything else is copied into a list.
+
+        Args:
+            verbs (iterable): The new verbs.
+            selection (VerbSelection, optional): Selections of these verbs to keep
+                instead, e.g. when restoring a previous verb list.
+        """
+        self.verbs = _verb_sequence(verbs)
+        self.selection = VerbSelection()
+        self._verb_indices = {}
+        self._index_verbs(0)
+        if selection is not None:
+            self.selection = selection
+        self._reset_current()
+        self._sampler = None
+        self._form_index = None
+
+    def add_verbs(self, verbs: Iterable[Dict[str, Any]]) -> None:
+        """
+        Append verbs, e.g. the next chunk of a file being loaded.
+        """
+        start = len(self.verbs)
+        if not isinstance(self.verbs, list):
+            self.verbs = list(self.verbs)
+        self.verbs.extend(verbs)
+        self._index_verbs(start)
+        # The sampler is rebuilt with the new verbs on the next question, and the form
+        # index no longer covers every verb
+        self._sampler = None
+        self._form_index = None
+
+    def set_dialect(self, dialect: str) -> None:
+        if dialect != self.dialect:
+            self.dialect = dialect
+            # Form shapes depend on the dialect
+            self._sampler = None
+            self._form_index = None
+
+    def set_tense_selected(self, tense: str, selected: bool) -> None:
+        if selected:
+            self.selected_tenses.add(tense)
+        else:
+            self.selected_tenses.discard(tense)
+        if self._sampler is not None:
+            self._sampler.set_tense_selected(tense, selected)
+
+    def set_verb_selected(self, verb: str, selected: bool) -> None:
+        """
+        Include or exclude a verb (every entry with that dictionary form).
+        """
+        for idx in self._verb_indices.get(verb, []):
+            self.selection[idx] = selected
+            if self._sampler is not None:
+                self._sampler.set_verb_selected(idx, selected)
+
+    def set_all_verbs_selected(self, selected: bool) -> None:
+        self.selection.set_all(selected)
+        if self._sampler is not None:
+            self._sampler.set_all_verbs_selected(selected)
+
+    def is_verb_selected(self, verb: str) -> bool:
+        return any(self.selection[idx] for idx in self._verb_indices.get(verb, []))
+
+    @property
+    def selected_verb_indices(self) -> List[int]:
+        return self.selection.selected_indices()
+
+    @property
+    def recall_only(self) -> bool:
+        """
+        Whether the dictionary form is the only selected tense.
+        """
+        return self.selected_tenses == {'dictionary_form'}
+
+    @property
+    def form_index(self) -> Optional[FormIndex]:
+        """
+        The reverse index of every form of the verbs, built on first use; None until
+        `set_form_index` is called if the engine has no lazy form index.
+        """
+        if self._form_index is None and self._lazy_form_index:
+            self._form_index = FormIndex.build(self.verbs, self.dialect)
+        return self._form_index
+
+    def set_form_index(self, form_index: FormIndex) -> None:
+        """
+        Use a form index built elsewhere, e.g. on a worker thread. It must cover the
+        current verbs in the current dialect.
+        """
+        self._form_index = form_index
+
+    def prepare(self) -> None:
+        """
+        Build the form sampler and, unless it is supplied with `set_form_index`, the form
+        index now rather than on the first question.
+        """
+        self._get_sampler()
+        self.form_index
+
+    # --- Questions and answers ---
+
+    def next_question(self, frozen: bool = False, verb_index: Optional[int] = None) -> Question:
+        """
+        Draw a random form from the selected verbs and tenses.
+
+        Args:
+            frozen (bool): Draw a form of the verb of the previous question instead of
+                a random selected verb.
+            verb_index (int, optional): Draw a form of this verb instead, whether or not
+                it is selected. Lets callers that share one engine keep their own frozen verb.
+
+        Returns:
+            Question: The new question, which also becomes `current_question`.
+
+        Raises:
+            QuizError: If there is nothing to draw from.
+        """
+        if not self.verbs:
+            raise NoVerbsLoadedError("No verbs are loaded. Please load a verb data file first.")
+        if not self.selected_tenses:
+            raise NoFormsSelectedError("Please select at least one verb form to test on.")
+        logger.debug("Selected Tenses for Quiz: %s", self.selected_tenses)
+
+        sampler = self._get_sampler()
+        if not sampler.selected_verb_count:
+            raise NoVerbsSelectedError("Please select at least one verb to include in the quiz.")
+
+        if verb_index is None and frozen:
+            verb_index = self.current_verb_index
+        if verb_index is not None:
+            sampled_form = sampler.sample_for_verb(verb_index)
+        else:
+            sampled_form = sampler.sample()
+        if sampled_form is None:
+            raise NoFormsAvailableError("No verb forms found for the selected tenses. Please try selecting "
+                                        "different tenses or load a different verb.")
+
+        verb_data = self.verbs[sampled_form.verb_index]
+        verb = verb_data['verb']
+        # Generate (or reuse) the paradigm; only the sampled tense is conjugated
+        paradigm = get_full_paradigm(verb_data, dialect=self.dialect, cache=self._cache)
+
+        tense = sampled_form.tense
+        if tense in ENTRY_FORM_TENSES:
+            field = ENTRY_FORM_TENSES[tense]
+            form_entry = verb if field is None else verb_data[field][sampled_form.form_index]
+        else:
+            form_entry = paradigm[tense][sampled_form.pronoun][sampled_form.form_index]
+        logger.debug("Selected Form: Verb='%s', Tense='%s', Pronoun='%s', Form='%s'",
+                     verb, tense, sampled_form.pronoun, form_entry)
+
+        if isinstance(form_entry, (list, tuple)):
+            form, form_type, form_marker = (tuple(form_entry) + ('', ''))[:3]
+        else:
+            form, form_type, form_marker = form_entry, '', ''
+
+        recall_only = self.recall_only
+        form_index = None if recall_only else self.form_index
+        question = Question(sampled_form.verb_index, verb, verb_data.get('definition', ''), tense,
+                            sampled_form.pronoun, form, form_type, form_marker, recall_only,
+                            form_index is not None and form_index.is_ambiguous(form))
+        self.current_verb_index = sampled_form.verb_index
+        self.current_verb_data = verb_data
+        self.current_paradigm = paradigm
+        self.current_question = question
+        return question
+
+    def check_answer(self, question: Question, answer: Answer) -> AnswerResult:
+        """
+        Compare an answer with the correct one.
+
+        The verb and tense are compared case-insensitively. A 'relative' answer matches
+        either relative pronoun, and the form type ('analytic'/'synthetic') is accepted
+        in place of the pronoun. When other verbs or slots produce the same form, the
+        answer is checked against each of them and the best match is reported, so any
+        valid analysis of the form is accepted.
+
+        Args:
+            question (Question): The question that was asked.
+            answer (Answer): The user's answer.
+
+        Returns:
+            AnswerResult: The feedback lines, the definition of the matched verb and the
+                other analyses of the form.
+        """
+        if question.recall_only:
+            return AnswerResult([], question.definition)
+
+        asked = FormAnalysis(question.verb_index, question.verb, question.tense, question.pronoun,
+                             question.form_type, question.form_marker)
+        alternatives = {}
+        form_index = self.form_index
+        for analysis in form_index.analyses(question.form) if form_index is not None else ():
+            key = analysis[1:]
+            if key != asked[1:]:
+                alternatives.setdefault(key, analysis)
+
+        best, best_feedback = asked, self._feedback(asked, answer)
+        for analysis in alternatives.values():
+            feedback = self._feedback(analysis, answer)
+            # Ties keep the analysis that was asked
+            if self._score(feedback) > self._score(best_feedback):
+                best, best_feedback = analysis, feedback
+        definition = question.definition if best is asked else self.verbs[best.verb_index].get('definition', '')
+        return AnswerResult(best_feedback, definition, tuple(alternatives.values()))
+
+    # --- Internals ---
+
+    @staticmethod
+    def _feedback(target: FormAnalysis, answer: Answer) -> List[Tuple[str, str]]:
+        feedback = []
+        if answer.verb.strip().lower() == target.verb.lower():
+            feedback.append((f"Correct: Verb ({target.verb})", 'correct'))
+        else:
+            feedback.append((f"Incorrect: Verb (Correct: '{target.verb}')", 'incorrect'))
+
+        if answer.tense.lower() == target.tense.lower():
+            feedback.append((f"Correct: Tense '{target.tense}'", 'correct'))
+        else:
+            feedback.append((f"Incorrect: Tense (Correct: '{target.tense}')", 'incorrect'))
+
+        if target.tense.lower() not in NO_FORM_TENSES:
+            pronoun_match = (answer.pronoun == target.pronoun
+                             or (target.pronoun in ['relative1', 'relative2'] and answer.pronoun == 'relative')
+                             or answer.pronoun == target.form_type)
+            if pronoun_match:
+                feedback.append((f"Correct: Form [{target.pronoun}]", 'correct'))
+            else:
+                feedback.append((f"Incorrect: Form (Correct: [{target.pronoun}])", 'incorrect'))
+
+            if answer.form_marker == target.form_marker:
+                feedback.append((f"Correct: Form Type '{target.form_marker}'", 'correct'))
+            else:
+                feedback.append((f"Incorrect: Form Type (Correct: '{target.form_marker}')", 'incorrect'))
+        return feedback
+
+    @staticmethod
+    def _score(feedback: List[Tuple[str, str]]) -> Tuple[bool, int]:
+        # A fully correct answer beats any partial match
+        correct = sum(tag == 'correct' for _, tag in feedback)
+        return correct == len(feedback), correct
+
+    def _reset_current(self) -> None:
+        self.current_verb_index: Optional[int] = None
+        self.current_verb_data: Optional[Dict[str, Any]] = None
+        self.current_paradigm = None
+        self.current_question: Optional[Question] = None
+
+    def _index_verbs(self, start: int) -> None:
+        self.selection.extend(len(self.verbs) - start)
+        for idx in range(start, len(self.verbs)):
+            self._verb_indices.setdefault(self.verbs[idx]['verb'], []).append(idx)
+
+    def _get_sampler(self) -> FormSampler:
+        if self._sampler is None:
+            self._sampler = FormSampler(self.verbs, dialect=self.dialect, selected_tenses=self.selected_tenses,
+                                        rng=self._rng, selected_verbs=self.selection.to_bytes())
+        return self._sampler
@@ -0,0 +1,172 @@
+import builtins
+import os
+import sys
+import threading
+import time
+from typing import List, NamedTuple, Optional, TextIO, Tuple
+
+# Set to profile startup: imports and time to the first frame are written to stderr
+# and the app closes once its window has been drawn
+PROFILE_STARTUP_ENV = 'VERB_QUIZ_PROFILE_STARTUP'
+# Overrides STARTUP_TARGET_MS for a profiled run
+STARTUP_TARGET_ENV = 'VERB_QUIZ_STARTUP_TARGET_MS'
+
+# Cold-start targets: a profiled run exits with status 1 if the first frame takes
+# longer; the test suite, which runs without a display, checks the GUI imports
+STARTUP_TARGET_MS = 1500
+IMPORT_TARGET_MS = 500
+
+# Modules only needed after the user does something; none of them may be imported
+# before the first frame
+DEFERRED_MODULES = ('app.paradigm_display', 'app.utils.definition_utility', 'requests', 'playsound',
+                    'tkinter.filedialog')
+
+
+class ImportTime(NamedTuple):
+    depth: int
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+class ImportProfiler:
+    """
+    Times imports in-process, like `python -X importtime`.
+
+    `-X importtime` needs the interpreter's command line, which the frozen build
+    does not expose, so this wraps `builtins.__import__` instead. Only imports
+    that load new modules are recorded, and only on the thread that started the
+    profiler. Like `-X importtime`, each import is listed after the imports it
+    triggered.
+    """
+
+    def __init__(self):
+        self.times: List[ImportTime] = []
+        self._original = None
+        self._thread = None
+        self._child_us: List[int] = []
+
+    def __enter__(self) -> 'ImportProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._original = builtins.__import__
+        self._thread = threading.get_ident()
+        builtins.__import__ = self._import
+
+    def stop(self) -> None:
+        if self._original is not None:
+            builtins.__import__ = self._original
+            self._original = None
+
+    def total_us(self) -> int:
+        return sum(entry.cumulative_us for entry in self.times if entry.depth == 0)
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original or builtins.__import__
+        if threading.get_ident() != self._thread:
+            return original(name, globals, locals, fromlist, level)
+        loaded = len(sys.modules)
+        self._child_us.append(0)
+        start = time.perf_counter_ns()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed_us = (time.perf_counter_ns() - start) // 1000
+            child_us = self._child_us.pop()
+            if len(sys.modules) > loaded:
+                # A module is moved to the end of sys.modules once it has loaded, so the
+                # last one is what this statement imported, e.g. 'pkg.leaf' for
+                # `from pkg import leaf`
+                name = next(reversed(sys.modules))
+                self.times.append(ImportTime(len(self._child_us), name, elapsed_us - child_us, elapsed_us))
+                if self._child_us:
+                    self._child_us[-1] += elapsed_us
+
+
+def format_import_times(times: List[ImportTime]) -> str:
+    """
+    Format import times the way `python -X importtime` does.
+    """
+    lines = ['import time: self [us] | cumulative | imported package']
+    for entry in times:
+        lines.append(f"import time: {entry.self_us:>9} | {entry.cumulative_us:>10} | {'  ' * entry.depth}{entry.name}")
+    return '\n'.join(lines)
+
+
+class StartupProfile:
+    """
+    Milestones of one startup, in milliseconds since `started`.
+
+    Args:
+        started (float): `time.perf_counter()` at the start of startup.
+        target_ms (float): Time to the first frame above which `finish` fails.
+    """
+
+    def __init__(self, started: Optional[float] = None, target_ms: float = STARTUP_TARGET_MS):
+        self.started = time.perf_counter() if started is None else started
+        self.target_ms = target_ms
+        self.imports = ImportProfiler()
+        self.marks: List[Tuple[str, float]] = []
+        # DEFERRED_MODULES already imported when the first frame was drawn
+        self.deferred_loaded: List[str] = []
+
+    @classmethod
+    def from_environment(cls, started: Optional[float] = None) -> Optional['StartupProfile']:
+        """
+        A profile if VERB_QUIZ_PROFILE_STARTUP is set, otherwise None.
+        """
+        if not os.environ.get(PROFILE_STARTUP_ENV):
+            return None
+        return cls(started, float(os.environ.get(STARTUP_TARGET_ENV, STARTUP_TARGET_MS)))
+
+    def mark(self, label: str) -> float:
+        elapsed_ms = (time.perf_counter() - self.started) * 1000
+        self.marks.append((label, elapsed_ms))
+        return elapsed_ms
+
+    def watch_first_frame(self, root, on_done=None) -> None:
+        """
+        Mark 'first frame' once `root` has been mapped and drawn, then call
+        `on_done(profile)`.
+        """
+        def on_map(event):
+            if event.widget is root and not any(label == 'first frame' for label, _ in self.marks):
+                # Tk redraws at idle time, so the next idle callback runs after the first frame
+                root.after_idle(first_frame)
+
+        def first_frame():
+            self.mark('first frame')
+            self.deferred_loaded = [name for name in DEFERRED_MODULES if name in sys.modules]
+            if on_done is not None:
+                on_done(self)
+
+        root.bind('<Map>', on_map, add='+')
+
+    def first_frame_ms(self) -> Optional[float]:
+        return next((elapsed_ms for label, elapsed_ms in self.marks if label == 'first frame'), None)
+
+    def report(self) -> str:
+        lines = [format_import_times(self.imports.times), '']
+        lines += [f"startup: {label:<16}{elapsed_ms:8.1f} ms" for label, elapsed_ms in self.marks]
+        first_frame_ms = self.first_frame_ms()
+        if first_frame_ms is not None:
+            verdict = 'within' if first_frame_ms <= self.target_ms else 'over'
+            lines.append(f"startup: first frame {verdict} the {self.target_ms:.0f} ms target")
+        for name in self.deferred_loaded:
+            lines.append(f"startup: {name} was imported before the first frame")
+        return '\n'.join(lines)
+
+    def finish(self, stream: TextIO = None) -> int:
+        """
+        Write the report and return the exit status: 1 if the first frame missed the
+        target or a deferred module was imported during startup, else 0.
+        """
+        print(self.report(), file=stream or sys.stderr)
+        first_frame_ms = self.first_frame_ms()
+        failed = first_frame_ms is None or first_frame_ms > self.target_ms or self.deferred_loaded
+        return 1 if failed else 0
@@ -0,0 +1,65 @@
+from bisect import bisect_left
+from typing import Dict, List, Sequence
+
+
+class VerbSearchIndex:
+    """
+    Substring and prefix search over verb names, in alphabetical order.
+
+    Names are sorted once; every 1-, 2- and 3-letter sequence maps to the sorted
+    positions of the names containing it. A search term of up to three letters is
+    answered by one posting list. A longer term intersects the posting lists of its
+    trigrams, rarest first, and only checks the few remaining names. Prefixes are a
+    binary search over the sorted names. Results come out already sorted, so there
+    is nothing to re-sort per keystroke.
+
+    Positions returned are indices into the `names` sequence given to the index.
+    """
+
+    def __init__(self, names: Sequence[str]):
+        self._order = sorted(range(len(names)), key=lambda idx: (names[idx].lower(), idx))
+        self._keys = [names[idx].lower() for idx in self._order]
+        self._grams: Dict[str, List[int]] = {}
+        for position, key in enumerate(self._keys):
+            seen = set()
+            for size in (1, 2, 3):
+                for start in range(len(key) - size + 1):
+                    gram = key[start:start + size]
+                    if gram not in seen:
+                        seen.add(gram)
+                        self._grams.setdefault(gram, []).append(position)
+        self._last_term = None
+        self._last_positions: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def search(self, term: str) -> List[int]:
+        """
+        Indices of the names containing `term` (case-insensitive), in alphabetical order.
+
+        Typing usually extends the previous term, so when it does only the previous
+        matches are checked.
+        """
+        term = term.lower()
+        if not term:
+            positions = list(range(len(self._keys)))
+        elif len(term) <= 3:
+            positions = self._grams.get(term, [])
+        elif self._last_term and len(self._last_term) > 3 and self._last_term in term:
+            positions = [position for position in self._last_positions if term in self._keys[position]]
+        else:
+            postings = sorted((self._grams.get(term[start:start + 3], []) for start in range(len(term) - 2)), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:]) if postings[0] else ()
+            positions = sorted(position for position in candidates if term in self._keys[position])
+        self._last_term, self._last_positions = term, positions
+        return [self._order[position] for position in positions]
+
+    def prefix_search(self, prefix: str) -> List[int]:
+        """
+        Indices of the names starting with `prefix` (case-insensitive), in alphabetical order.
+        """
+        prefix = prefix.lower()
+        start = bisect_left(self._keys, prefix)
+        end = bisect_left(self._keys, prefix + '\U0010ffff', start)
+        return self._order[start:end]
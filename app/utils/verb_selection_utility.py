@@ -0,0 +1,64 @@
+from itertools import compress
+from typing import Iterable, List, Optional
+
+
+class VerbSelection:
+    """
+    Which verbs are selected, as one byte per verb index.
+
+    Selecting or deselecting every verb is a single slice assignment, the selected
+    count is kept up to date, and the list of selected indices is built once per
+    change and then reused.
+    """
+
+    def __init__(self, count: int = 0, selected: bool = True):
+        self._bits = bytearray([selected]) * count
+        self._count = count if selected else 0
+        self._indices: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return len(self._bits)
+
+    def __getitem__(self, index: int) -> bool:
+        return bool(self._bits[index])
+
+    def __setitem__(self, index: int, selected: bool) -> None:
+        selected = bool(selected)
+        if bool(self._bits[index]) != selected:
+            self._bits[index] = selected
+            self._count += 1 if selected else -1
+            self._indices = None
+
+    @property
+    def selected_count(self) -> int:
+        return self._count
+
+    def extend(self, count: int, selected: bool = True) -> None:
+        """
+        Add `count` verbs at the end, e.g. the next chunk of a file being loaded.
+        """
+        self._bits.extend(bytearray([selected]) * count)
+        if selected:
+            self._count += count
+            self._indices = None
+
+    def set_all(self, selected: bool) -> None:
+        self._bits[:] = bytearray([selected]) * len(self._bits)
+        self._count = len(self._bits) if selected else 0
+        self._indices = None
+
+    def set_many(self, indices: Iterable[int], selected: bool) -> None:
+        for index in indices:
+            self[index] = selected
+
+    def selected_indices(self) -> List[int]:
+        """
+        The selected verb indices in ascending order. The list is shared until the
+        next change, so do not modify it.
+        """
+        if self._indices is None:
+            self._indices = list(compress(range(len(self._bits)), self._bits))
+        return self._indices
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._bits)
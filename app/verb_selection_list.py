@@ -0,0 +1,166 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, List, Sequence
+
+
+class VirtualCheckList(ttk.Frame):
+    """
+    A scrollable grid of checkbuttons that only creates widgets for the visible rows.
+
+    Items are laid out row by row, `columns` per row. A fixed pool of Checkbuttons,
+    enough to fill the visible height, is rebound to the items of the rows scrolled
+    into view, so the widget count and the cost of showing a list do not depend on
+    how many items it holds. Texts are not wrapped, so every row has the same height.
+
+    Checked states live outside the widget: each pooled checkbutton has its own
+    BooleanVar, set from `is_checked` when it is bound to an item, and clicks are
+    reported through `on_toggle`.
+
+    Args:
+        master: The parent widget.
+        text_for (callable): Item -> text of its checkbutton.
+        is_checked (callable): Item -> whether it is checked.
+        on_toggle (callable): Called with (item, checked) when the user clicks an item.
+        columns (int): Items per row.
+        row_height (int): Height of one row in pixels.
+    """
+
+    def __init__(self, master, text_for: Callable[[int], str], is_checked: Callable[[int], bool],
+                 on_toggle: Callable[[int, bool], None], columns: int = 3, row_height: int = 26):
+        super().__init__(master)
+        self.text_for = text_for
+        self.is_checked = is_checked
+        self.on_toggle = on_toggle
+        self.columns = columns
+        self.row_height = row_height
+        self.items: Sequence[int] = ()
+        self.first_row = 0
+        self._pool: List[List[tk.Checkbutton]] = []
+        self._pool_vars: Dict[tk.Checkbutton, tk.BooleanVar] = {}
+        self._pool_items: Dict[tk.Checkbutton, int] = {}
+
+        self.body = ttk.Frame(self)
+        # The pool is sized to the frame, not the frame to the pool
+        self.body.grid_propagate(False)
+        self.body.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.body.bind('<Configure>', self._on_resize)
+        for widget in (self.body, self.scrollbar):
+            widget.bind('<MouseWheel>', self._on_mousewheel)
+            widget.bind('<Button-4>', lambda event: self.scroll(-1))
+            widget.bind('<Button-5>', lambda event: self.scroll(1))
+
+    @property
+    def row_count(self) -> int:
+        return -(-len(self.items) // self.columns)
+
+    @property
+    def visible_rows(self) -> int:
+        return len(self._pool)
+
+    def set_items(self, items: Sequence[int]) -> None:
+        """
+        Show a new list of items from the top.
+        """
+        self.items = items
+        self.first_row = 0
+        self.refresh()
+
+    def set_columns(self, columns: int) -> None:
+        if columns != self.columns:
+            for column in range(self.columns):
+                self.body.grid_columnconfigure(column, weight=0, uniform='')
+            self.columns = columns
+            for row in self._pool:
+                for cb in row:
+                    self._destroy(cb)
+            self._pool = []
+            self.first_row = 0
+            self._fill_pool(self.body.winfo_height())
+
+    def scroll(self, rows: int) -> None:
+        self._scroll_to(self.first_row + rows)
+
+    def refresh(self) -> None:
+        """
+        Rebind the pooled checkbuttons to the items of the visible rows, e.g. after
+        the checked states changed outside the widget.
+        """
+        for offset, row in enumerate(self._pool):
+            start = (self.first_row + offset) * self.columns
+            for column, cb in enumerate(row):
+                position = start + column
+                if position < len(self.items):
+                    item = self.items[position]
+                    self._pool_items[cb] = item
+                    self._pool_vars[cb].set(self.is_checked(item))
+                    cb.config(text=self.text_for(item))
+                    cb.grid()
+                else:
+                    cb.grid_remove()
+        rows = self.row_count
+        if rows:
+            self.scrollbar.set(self.first_row / rows, min(1.0, (self.first_row + self.visible_rows) / rows))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    # --- Internals ---
+
+    def _scroll_to(self, first_row: int) -> None:
+        first_row = max(0, min(first_row, self.row_count - self.visible_rows))
+        if first_row != self.first_row:
+            self.first_row = first_row
+            self.refresh()
+
+    def _fill_pool(self, height: int) -> None:
+        rows = max(1, height // self.row_height)
+        while len(self._pool) < rows:
+            row_index = len(self._pool)
+            row = []
+            for column in range(self.columns):
+                var = tk.BooleanVar(value=False)
+                cb = tk.Checkbutton(self.body, variable=var, justify='left', anchor='w')
+                cb.config(command=lambda cb=cb: self._on_click(cb))
+                self._pool_vars[cb] = var
+                cb.grid(row=row_index, column=column, sticky='we', padx=5)
+                cb.bind('<MouseWheel>', self._on_mousewheel)
+                cb.bind('<Button-4>', lambda event: self.scroll(-1))
+                cb.bind('<Button-5>', lambda event: self.scroll(1))
+                row.append(cb)
+            self.body.grid_rowconfigure(row_index, minsize=self.row_height)
+            self._pool.append(row)
+        while len(self._pool) > rows:
+            for cb in self._pool.pop():
+                self._destroy(cb)
+        for column in range(self.columns):
+            self.body.grid_columnconfigure(column, weight=1, uniform='column')
+        self._scroll_to(self.first_row)
+        self.refresh()
+
+    def _destroy(self, cb: tk.Checkbutton) -> None:
+        del self._pool_vars[cb]
+        self._pool_items.pop(cb, None)
+        cb.destroy()
+
+    def _on_click(self, cb: tk.Checkbutton) -> None:
+        item = self._pool_items.get(cb)
+        if item is not None:
+            self.on_toggle(item, self._pool_vars[cb].get())
+
+    def _on_resize(self, event) -> None:
+        if max(1, event.height // self.row_height) != len(self._pool):
+            self._fill_pool(event.height)
+
+    def _on_scrollbar(self, action, *args) -> None:
+        if action == 'moveto':
+            self._scroll_to(round(float(args[0]) * self.row_count))
+        elif action == 'scroll':
+            count, unit = int(args[0]), args[1]
+            self.scroll(count * (self.visible_rows if unit == 'pages' else 1))
+
+    def _on_mousewheel(self, event) -> None:
+        # Windows reports multiples of 120 per notch, macOS small deltas
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll(-delta * 3 if delta else 0)
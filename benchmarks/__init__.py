@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+# Standalone timing scripts. Run them with `python -m benchmarks.<module>`.
@@ -0,0 +1,52 @@
+import argparse
+import gc
+import time
+
+from app.utils.batch_conjugation_utility import generate_full_paradigms
+from app.utils.full_paradigm_utility import generate_full_paradigm
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+def best_of(repeat, func, *args):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def loop_paradigms(verbs):
+    return [generate_full_paradigm(verb_data) for verb_data in verbs]
+
+
+def loop_paradigms_without_gc(verbs):
+    # Separates the batch's compiled group functions from its pausing of the garbage collector
+    gc.disable()
+    try:
+        return loop_paradigms(verbs)
+    finally:
+        gc.enable()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare batch conjugation against a loop over generate_full_paradigm.')
+    parser.add_argument('--verbs', type=int, default=20000, help='Number of synthetic verbs.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of timed runs; the best is reported.')
+    args = parser.parse_args()
+
+    verbs = synthetic_verbs(args.verbs)
+    assert generate_full_paradigms(verbs[:500]) == loop_paradigms(verbs[:500])
+
+    loop_time = best_of(args.repeat, loop_paradigms, verbs)
+    loop_no_gc_time = best_of(args.repeat, loop_paradigms_without_gc, verbs)
+    batch_time = best_of(args.repeat, generate_full_paradigms, verbs)
+    print(f"verbs: {args.verbs}")
+    print(f"loop over generate_full_paradigm: {loop_time:.3f}s ({args.verbs / loop_time:,.0f} verbs/s)")
+    print(f"  the same loop, gc paused:       {loop_no_gc_time:.3f}s ({args.verbs / loop_no_gc_time:,.0f} verbs/s)")
+    print(f"generate_full_paradigms (batch):  {batch_time:.3f}s ({args.verbs / batch_time:,.0f} verbs/s)")
+    print(f"speedup: {loop_time / batch_time:.2f}x ({loop_no_gc_time / batch_time:.2f}x over the loop with gc paused)")
+
+
+if __name__ == "__main__":
+    main()
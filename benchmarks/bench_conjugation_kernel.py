@@ -0,0 +1,58 @@
+import argparse
+import os
+import time
+
+from app.utils.conjugation_utility import TENSE_RULES, conjugate
+import app.utils
+from app.utils.load_verbs_utility import load_verbs_json
+from benchmarks import legacy_conjugation
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+LEGACY_CONJUGATORS = {
+    'Present': legacy_conjugation.conjugate_present_tense,
+    'Future': legacy_conjugation.conjugate_future_tense,
+    'Past': legacy_conjugation.conjugate_past_tense,
+    'Conditional': legacy_conjugation.conjugate_conditional_tense,
+    'Past Habitual': legacy_conjugation.conjugate_past_habitual_tense,
+}
+
+DATA_FILE = os.path.join(os.path.dirname(app.utils.__file__), 'data', 'verbs.json')
+
+
+def best_of(repeat, func, *args):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def legacy_paradigms(verbs):
+    return [{tense: conjugator(verb_data) for tense, conjugator in LEGACY_CONJUGATORS.items()} for verb_data in verbs]
+
+
+def kernel_paradigms(verbs):
+    return [{tense: conjugate(verb_data, tense) for tense in TENSE_RULES} for verb_data in verbs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the rule-program kernel against the per-tense functions.')
+    parser.add_argument('--verbs', type=int, default=20000, help='Number of synthetic verbs.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of timed runs; the best is reported.')
+    args = parser.parse_args()
+
+    verbs = synthetic_verbs(args.verbs)
+    for sample in (load_verbs_json(DATA_FILE), verbs[:2000]):
+        assert kernel_paradigms(sample) == legacy_paradigms(sample)
+
+    legacy_time = best_of(args.repeat, legacy_paradigms, verbs)
+    kernel_time = best_of(args.repeat, kernel_paradigms, verbs)
+    print(f"verbs: {args.verbs}")
+    print(f"per-tense functions: {legacy_time:.3f}s ({args.verbs / legacy_time:,.0f} verbs/s)")
+    print(f"rule programs:       {kernel_time:.3f}s ({args.verbs / kernel_time:,.0f} verbs/s)")
+    print(f"speedup: {legacy_time / kernel_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import random
+import time
+
+from app.utils.lemmatizer_utility import Lemmatizer
+from app.utils.paradigm_export_utility import iter_form_rows
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+FILLER_WORDS = ['agus', 'sé', 'sí', 'an', 'fear', 'sa', 'teach', 'inniu', 'go', 'maith']
+
+
+def token_stream(verbs, count, seed=0):
+    """
+    A corpus-like stream of `count` tokens: words of random verb forms (particles
+    as separate words) mixed with filler words, and the source verb of each.
+    """
+    rng = random.Random(seed)
+    forms = [(row[5], row[0]) for row in iter_form_rows(verbs)]
+    tokens = []
+    while len(tokens) < count:
+        if rng.random() < 0.3:
+            tokens.append((rng.choice(FILLER_WORDS), None))
+            continue
+        form, verb = rng.choice(forms)
+        *particles, word = form.split(' ')
+        tokens.extend((particle, None) for particle in particles)
+        tokens.append((word, verb))
+    return tokens[:count]
+
+
+def paradigm_lookup(verbs):
+    # The alternative: conjugate everything and index the forms
+    index = {}
+    for verb, tense, pronoun, lytic, marker, form, dialect in iter_form_rows(verbs):
+        index.setdefault(form.split(' ')[-1], set()).add(verb)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lemmatize a synthetic token stream.')
+    parser.add_argument('--verbs', type=int, default=5000, help='Number of synthetic verbs.')
+    parser.add_argument('--tokens', type=int, default=1_000_000, help='Number of tokens in the stream.')
+    args = parser.parse_args()
+
+    verbs = synthetic_verbs(args.verbs)
+    tokens = token_stream(verbs, args.tokens)
+    words = [word for word, _ in tokens]
+
+    start = time.perf_counter()
+    paradigm_index = paradigm_lookup(verbs)
+    paradigm_build = time.perf_counter() - start
+    start = time.perf_counter()
+    for word in words:
+        paradigm_index.get(word)
+    paradigm_time = time.perf_counter() - start
+
+    results = {}
+    for label, cache_size in (('uncached', 0), ('cached', 100_000)):
+        start = time.perf_counter()
+        lemmatizer = Lemmatizer(verbs, cache_size=cache_size)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        lemmas = [lemmatizer.lemmatize(word) for word in words]
+        results[label] = (build, time.perf_counter() - start, lemmas)
+
+    lemmas = results['cached'][2]
+    verb_tokens = [(verb, found) for (_, verb), found in zip(tokens, lemmas) if verb is not None]
+    recall = sum(verb in found for verb, found in verb_tokens) / len(verb_tokens)
+    ambiguous = sum(len(found) > 1 for _, found in verb_tokens) / len(verb_tokens)
+
+    print(f"verbs: {args.verbs}, tokens: {len(words):,} ({len(set(words)):,} distinct)")
+    print(f"paradigm index: build {paradigm_build:.2f}s, lookup {paradigm_time:.2f}s")
+    for label, (build, elapsed, _) in results.items():
+        print(f"lemmatizer ({label}): build {build:.2f}s, {elapsed:.2f}s ({len(words) / elapsed:,.0f} tokens/s)")
+    print(f"verb tokens lemmatized to their verb: {recall:.2%}, with more than one lemma: {ambiguous:.2%}")
+
+
+if __name__ == "__main__":
+    main()
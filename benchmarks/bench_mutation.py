@@ -0,0 +1,84 @@
+import argparse
+import time
+
+from app.utils.conjugation_utility import TENSE_RULES
+from app.utils.mutation_utility import ECLIPSIS_KIND, LENITION_KIND, PAST_PARTICLE_KIND, add_past_particle, \
+    eclipse, lenite, mutate, mutations
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+def legacy_eclipse(verb):
+    # initial_mutation_utility.eclipse_verb before the lookup tables
+    eclipsis_map = {'b': 'mb', 'c': 'gc', 'd': 'nd', 'f': 'bhf', 'g': 'ng', 'p': 'bp', 't': 'dt'}
+    first_letter = verb[0]
+    if first_letter in eclipsis_map:
+        return eclipsis_map[first_letter] + verb[1:]
+    return verb
+
+
+def legacy_lenite(verb):
+    # initial_mutation_utility.lenite_verb before the lookup tables
+    if verb.startswith(('b', 'c', 'd', 'f', 'g', 'm', 'p', 's', 't')):
+        if verb.startswith('s') and len(verb) > 1 and verb[1] in 'aeiouáéíóúlnr':
+            return 'sh' + verb[1:]
+        elif verb.startswith('s'):
+            return 's' + verb[1:]
+        elif verb.startswith('f'):
+            return 'fh' + verb[1:]
+        else:
+            return verb[0] + 'h' + verb[1:]
+    return verb
+
+
+def legacy_past_particle(verb):
+    lenited = legacy_lenite(verb)
+    return f"d'{lenited}" if verb[0] in 'aeiouáéíóú' or verb.startswith('f') else lenited
+
+
+def workload(verbs):
+    # Every tense mutates each root again, as paradigm generation does
+    roots = [verb_data['future_root'] for verb_data in verbs]
+    return roots * len(TENSE_RULES)
+
+
+def run_legacy(roots):
+    return [(legacy_lenite(root), legacy_eclipse(root), legacy_past_particle(root)) for root in roots]
+
+
+def run_tables(roots):
+    return [(lenite(root), eclipse(root), add_past_particle(root)) for root in roots]
+
+
+def run_memoized(roots):
+    mutations.cache_clear()
+    return [(mutate(root, LENITION_KIND), mutate(root, ECLIPSIS_KIND), mutate(root, PAST_PARTICLE_KIND))
+            for root in roots]
+
+
+def best_of(repeat, func, *args):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the mutation functions over the roots of a synthetic lexicon.')
+    parser.add_argument('--verbs', type=int, default=20000, help='Number of synthetic verbs.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of timed runs; the best is reported.')
+    args = parser.parse_args()
+
+    roots = workload(synthetic_verbs(args.verbs))
+    assert run_legacy(roots) == run_tables(roots) == run_memoized(roots)
+
+    times = [(label, best_of(args.repeat, func, roots)) for label, func in (
+        ('startswith chains:', run_legacy), ('lookup tables:', run_tables), ('memoized mutate:', run_memoized))]
+    print(f"verbs: {args.verbs}, mutated roots: {len(roots)}")
+    for label, elapsed in times:
+        print(f"{label:<20}{elapsed:.3f}s ({len(roots) / elapsed:,.0f} roots/s, {times[0][1] / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
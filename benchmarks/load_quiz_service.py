@@ -0,0 +1,112 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from app.quiz_service import QuizService
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+class QuizClient:
+    """
+    Minimal keep-alive HTTP/1.1 JSON client for the quiz service.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader = None
+        self._writer = None
+
+    async def request(self, method, path, body=None):
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        payload = json.dumps(body).encode('utf-8') if body is not None else b''
+        self._writer.write((f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                            f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n")
+                           .encode('latin-1') + payload)
+        await self._writer.drain()
+        status = int((await self._reader.readline()).split()[1])
+        headers = {}
+        while True:
+            line = await self._reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        data = json.loads(await self._reader.readexactly(int(headers['content-length'])))
+        if headers.get('connection') == 'close':
+            await self.close()
+        return status, data
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._reader = self._writer = None
+
+
+async def learner(host, port, requests, latencies):
+    client = QuizClient(host, port)
+    try:
+        status, session = await client.request('POST', '/sessions', {})
+        assert status == 201, session
+        prefix = f"/sessions/{session['session_id']}"
+        for idx in range(requests):
+            start = time.perf_counter()
+            if idx % 2 == 0:
+                status, data = await client.request('POST', f'{prefix}/question', {})
+            else:
+                status, data = await client.request('POST', f'{prefix}/answer',
+                                                    {'verb': 'bris', 'tense': 'Present', 'form_marker': 'unmarked',
+                                                     'pronoun': '1sg'})
+            latencies.append(time.perf_counter() - start)
+            assert status == 200, data
+    finally:
+        await client.close()
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def run(args):
+    service = None
+    host, port = args.host, args.port
+    if args.spawn:
+        service = QuizService(synthetic_verbs(args.verbs), max_workers=args.workers)
+        port = await service.start(host, 0)
+
+    latencies = []
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(learner(host, port, args.requests, latencies) for _ in range(args.concurrency)))
+    finally:
+        if service is not None:
+            await service.stop()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"concurrency: {args.concurrency}, requests: {len(latencies)} in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:,.0f} req/s)")
+    print(f"p50: {percentile(latencies, 0.50) * 1000:.2f} ms")
+    print(f"p99: {percentile(latencies, 0.99) * 1000:.2f} ms")
+    print(f"mean: {statistics.mean(latencies) * 1000:.2f} ms, max: {latencies[-1] * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test the quiz service at a fixed concurrency.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--spawn', action='store_true',
+                        help='Start a service in this process on a synthetic lexicon instead of using --port.')
+    parser.add_argument('--verbs', type=int, default=5000, help='Synthetic verbs for --spawn.')
+    parser.add_argument('--workers', type=int, default=4, help='Service worker threads for --spawn.')
+    parser.add_argument('--concurrency', type=int, default=50, help='Number of simultaneous learners.')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per learner (question/answer pairs).')
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# pytest-benchmark suite over synthetic lexicons. Run it with `python -m pytest benchmarks/suite`.
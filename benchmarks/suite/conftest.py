@@ -0,0 +1,56 @@
+import json
+import random
+
+import pytest
+
+from app.utils.quiz_engine_utility import QuizEngine
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+LEXICON_SIZES = (1000, 10000, 100000)
+
+
+def pytest_addoption(parser):
+    parser.addoption('--lexicon-sizes', default=','.join(map(str, LEXICON_SIZES)),
+                     help='Comma-separated numbers of synthetic verbs to benchmark with.')
+
+
+def pytest_generate_tests(metafunc):
+    if 'lexicon_size' in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption('lexicon_sizes').split(',')]
+        metafunc.parametrize('lexicon_size', sizes, ids=[f'{size}verbs' for size in sizes], scope='session')
+
+
+def rounds_for(size: int) -> int:
+    # Enough rounds to be stable on small lexicons without minutes per case on large ones
+    return max(3, 20000 // size)
+
+
+@pytest.fixture(scope='session')
+def lexicon(lexicon_size):
+    return synthetic_verbs(lexicon_size)
+
+
+@pytest.fixture(scope='session')
+def lexicon_file(lexicon, lexicon_size, tmp_path_factory):
+    data_file = tmp_path_factory.mktemp('lexicon') / f'verbs_{lexicon_size}.json'
+    data_file.write_text(json.dumps(lexicon, ensure_ascii=False), encoding='utf-8')
+    return str(data_file)
+
+
+@pytest.fixture(scope='session')
+def prepared_engine(lexicon):
+    engine = QuizEngine(lexicon, rng=random.Random(0))
+    engine.prepare()
+    return engine
+
+
+@pytest.fixture
+def run(benchmark, lexicon_size):
+    """
+    Benchmark `func(*args)` with a round count suited to the lexicon size, and
+    record the size in the JSON output.
+    """
+    def run_benchmark(func, *args):
+        benchmark.extra_info['verbs'] = lexicon_size
+        return benchmark.pedantic(func, args, rounds=rounds_for(lexicon_size), iterations=1, warmup_rounds=1)
+    return run_benchmark
@@ -0,0 +1,22 @@
+import pytest
+
+from app.utils.full_paradigm_utility import TENSE_CONJUGATORS, generate_full_paradigm
+
+
+def full_paradigms(verbs):
+    return [generate_full_paradigm(verb_data) for verb_data in verbs]
+
+
+def conjugate_all(conjugate, verbs):
+    return [conjugate(verb_data) for verb_data in verbs]
+
+
+def test_generate_full_paradigm(run, lexicon):
+    paradigms = run(full_paradigms, lexicon)
+    assert len(paradigms) == len(lexicon)
+
+
+@pytest.mark.parametrize('tense', list(TENSE_CONJUGATORS))
+def test_conjugate_tense(run, lexicon, tense):
+    conjugations = run(conjugate_all, TENSE_CONJUGATORS[tense], lexicon)
+    assert all(conjugations)
@@ -0,0 +1,15 @@
+from app.utils.load_verbs_utility import load_verbs, load_verbs_json
+
+
+def load_all(data_file):
+    # The compiled lexicon decodes entries on access, so read every one
+    return [entry['verb'] for entry in load_verbs(data_file)]
+
+
+def test_load_verbs_json(run, lexicon, lexicon_file):
+    assert len(run(load_verbs_json, lexicon_file)) == len(lexicon)
+
+
+def test_load_verbs_compiled(run, lexicon, lexicon_file):
+    load_verbs(lexicon_file)  # Compiles the lexicon next to the JSON file
+    assert len(run(load_all, lexicon_file)) == len(lexicon)
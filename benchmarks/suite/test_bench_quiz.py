@@ -0,0 +1,30 @@
+from app.utils.verb_search_utility import VerbSearchIndex
+
+QUESTIONS_PER_ROUND = 1000
+
+
+def draw_questions(engine, count):
+    return [engine.next_question() for _ in range(count)]
+
+
+def typing_session(index, words):
+    # Each word typed letter by letter, as the Select Verbs search box filters on every keystroke
+    return [index.search(word[:length]) for word in words for length in range(1, len(word) + 1)]
+
+
+def test_next_question(run, prepared_engine):
+    questions = run(draw_questions, prepared_engine, QUESTIONS_PER_ROUND)
+    assert len(questions) == QUESTIONS_PER_ROUND
+
+
+def test_verb_search_index_build(run, lexicon):
+    names = [verb_data['verb'] for verb_data in lexicon]
+    assert len(run(VerbSearchIndex, names)) == len(names)
+
+
+def test_verb_search_typing(run, lexicon):
+    names = [verb_data['verb'] for verb_data in lexicon]
+    index = VerbSearchIndex(names)
+    words = [names[0], names[len(names) // 2][1:6], 'ai', names[-1][:4]]
+    results = run(typing_session, index, words)
+    assert 0 in results[len(names[0]) - 1]
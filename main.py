@@ -1,12 +1,40 @@
 # main.py
-import tkinter as tk
-from app.gui import VerbConjugationApp
-# from app.verb_conjugation_app import VerbConjugationApp
+import os
+import sys
+import tempfile
+import time
+
+from app.utils.startup_profile_utility import StartupProfile
+
 
 def main():
+    # Set VERB_QUIZ_PROFILE_STARTUP=1 to time the imports and the first frame
+    profile = StartupProfile.from_environment(time.perf_counter())
+    if profile:
+        profile.imports.start()
+
+    # Imported here so a startup profile can time them
+    import tkinter as tk
+    from app.gui import VerbConjugationApp
+    from app.utils.logging_utility import configure_logging
+
+    if profile:
+        profile.imports.stop()
+        profile.mark('imports')
+
+    # Written by a background thread and rotated at 1 MB; set VERB_QUIZ_LOG=DEBUG for debug output
+    configure_logging(os.path.join(tempfile.gettempdir(), 'app.log'))
     root = tk.Tk()
     app = VerbConjugationApp(root)
+
+    if profile:
+        profile.mark('window built')
+        profile.watch_first_frame(root, lambda profile: app.close())
+
     root.mainloop()
 
+    if profile:
+        sys.exit(profile.finish())
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,61 @@
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class AudioServer:
+    """
+    Local stand-in for the teanglann.ie recordings: serves /Can<dialect>/<verb>.mp3
+    for the recordings it holds and 404 for everything else, counting requests.
+    """
+
+    def __init__(self):
+        self.recordings = {}  # (dialect, verb) -> bytes
+        self.requests = []
+        self.delay = None  # Optional threading.Event every request waits for
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                path = urllib.parse.unquote(self.path)
+                server.requests.append(path)
+                if server.delay is not None:
+                    server.delay.wait(5)
+                dialect, _, name = path.lstrip('/').partition('/')
+                content = server.recordings.get((dialect[len('Can'):], name[:-len('.mp3')]))
+                if content is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'audio/mpeg')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._httpd.daemon_threads = True
+        self.base_url = f'http://127.0.0.1:{self._httpd.server_port}/Can{{dialect}}/{{verb}}.mp3'
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def shutdown(self):
+        if self.delay is not None:
+            self.delay.set()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def audio_server():
+    server = AudioServer()
+    yield server
+    server.shutdown()
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+import requests
+
+from app.utils.audio_cache_utility import AudioCache
+
+
+def test_recordings_are_downloaded_once_and_replayed_offline(tmp_path, audio_server):
+    audio_server.recordings[('U', 'déan')] = 'ID3 déan'.encode()
+    cache = AudioCache(str(tmp_path), base_url=audio_server.base_url)
+
+    path = cache.get('déan', 'U')
+    with open(path, 'rb') as file:
+        assert file.read() == 'ID3 déan'.encode()
+    assert cache.get('déan', 'U') == path
+    assert audio_server.requests == ['/CanU/déan.mp3']
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    audio_server.shutdown()
+    # A new cache over the same directory still has the recording without the server
+    offline = AudioCache(str(tmp_path), base_url=audio_server.base_url)
+    assert offline.get('déan', 'U') == path
+    with pytest.raises(requests.RequestException):
+        offline.get('déan', 'M')
+
+
+def test_missing_recordings_are_negative_cached(tmp_path, audio_server):
+    cache = AudioCache(str(tmp_path), base_url=audio_server.base_url)
+    assert cache.get('bris', 'C') is None
+    assert cache.get('bris', 'C') is None
+    assert AudioCache(str(tmp_path), base_url=audio_server.base_url).get('bris', 'C') is None
+    assert audio_server.requests == ['/CanC/bris.mp3']
+    assert cache.missing_hits == 1
+
+    expired = AudioCache(str(tmp_path), base_url=audio_server.base_url, missing_ttl=0)
+    audio_server.recordings[('C', 'bris')] = b'bris'
+    assert expired.get('bris', 'C') is not None
+    with pytest.raises(ValueError):
+        cache.get('bris', 'X')
+
+
+def test_least_recently_played_recordings_are_evicted(tmp_path, audio_server):
+    for verb in ('a', 'b', 'c'):
+        audio_server.recordings[('M', verb)] = verb.encode() * 40
+    cache = AudioCache(str(tmp_path), max_bytes=100, base_url=audio_server.base_url)
+
+    path_a = cache.get('a', 'M')
+    path_b = cache.get('b', 'M')
+    cache.get('a', 'M')  # 'b' is now the least recently played
+    cache.get('c', 'M')
+    assert os.path.exists(path_a)
+    assert not os.path.exists(path_b)
+    assert cache.total_bytes == 80
+
+    cache.get('b', 'M')
+    assert len(audio_server.requests) == 4
+    assert cache.total_bytes <= 100
@@ -0,0 +1,51 @@
+import threading
+
+from app.utils.audio_cache_utility import AudioCache
+from app.utils.audio_prefetch_utility import AudioPrefetcher
+
+
+def test_prefetched_recordings_are_played_without_a_second_download(tmp_path, audio_server):
+    for dialect in 'UMC':
+        audio_server.recordings[(dialect, 'ól')] = dialect.encode() * 10
+    audio_server.delay = threading.Event()
+    prefetcher = AudioPrefetcher(AudioCache(str(tmp_path), base_url=audio_server.base_url))
+
+    prefetcher.prefetch('ól')
+    results = []
+    clicks = [threading.Thread(target=lambda: results.append(prefetcher.get('ól', 'M'))) for _ in range(3)]
+    for click in clicks:
+        click.start()
+    audio_server.delay.set()
+    for click in clicks:
+        click.join(5)
+
+    assert len(set(results)) == 1 and results[0].endswith('.mp3')
+    assert prefetcher.get('ól', 'U') is not None
+    # Every recording was requested at most once ('C' may still be downloading)
+    assert {'/CanM/ól.mp3', '/CanU/ól.mp3'} <= set(audio_server.requests)
+    assert len(audio_server.requests) == len(set(audio_server.requests))
+    info = prefetcher.prefetch_info()
+    assert (info.prefetched, info.hits, info.misses) == (3, 2, 0)
+    assert prefetcher.hit_rate() == 1.0
+
+    # Moving on: 'C' was downloaded but never played
+    prefetcher.prefetch('ith')
+    assert prefetcher.prefetch_info().wasted == 1
+    prefetcher.shutdown()
+
+
+def test_superseded_prefetches_are_cancelled(tmp_path, audio_server):
+    audio_server.delay = threading.Event()
+    prefetcher = AudioPrefetcher(AudioCache(str(tmp_path), base_url=audio_server.base_url), max_workers=1)
+
+    prefetcher.prefetch('bris')  # The first download blocks the only worker
+    prefetcher.prefetch('dún')
+    info = prefetcher.prefetch_info()
+    assert (info.cancelled, info.wasted) == (2, 1)
+
+    audio_server.delay.set()
+    assert prefetcher.get('dún', 'U') is None  # 404, joined from the prefetch
+    prefetcher.shutdown()
+    assert '/CanM/bris.mp3' not in audio_server.requests
+    assert prefetcher.get('dún', 'U') is None  # Negative-cached, no new request
+    assert audio_server.requests.count('/CanU/dún.mp3') == 1
@@ -0,0 +1,43 @@
+import os
+
+from app.utils.batch_conjugation_utility import generate_full_paradigms
+from app.utils.full_paradigm_utility import generate_full_paradigm
+from app.utils.load_verbs_utility import load_verbs
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+DEFAULT_DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'app', 'utils', 'data', 'verbs.json')
+
+
+def test_batch_matches_single_verb_paradigms():
+    verbs = list(load_verbs(DEFAULT_DATA_FILE)) + synthetic_verbs(200)
+    expected = [generate_full_paradigm(verb_data) for verb_data in verbs]
+    assert generate_full_paradigms(verbs) == expected
+
+
+def test_batch_honours_root_and_class_overrides():
+    verb_data = {
+        "verb": "abair",
+        "future_root": "déar",
+        "present_root": "deir",
+        "past_root": "dúr",
+        "class": 1,
+        "width": "b",
+        "past_class": 2,
+        "past_width": "s",
+        "definition": "say",
+    }
+    assert generate_full_paradigms([verb_data]) == [generate_full_paradigm(verb_data)]
+
+
+def test_garbage_collector_state_is_restored():
+    import gc
+
+    verbs = synthetic_verbs(5)
+    generate_full_paradigms(verbs)
+    assert gc.isenabled()
+    gc.disable()
+    try:
+        generate_full_paradigms(verbs)
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
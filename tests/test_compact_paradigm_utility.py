@@ -0,0 +1,67 @@
+import os
+import pickle
+import subprocess
+import sys
+
+from app.utils.compact_paradigm_utility import CompactParadigm, compact_paradigms
+from app.utils.full_paradigm_utility import generate_full_paradigm
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+bac = {
+    "verb": "bac",
+    "future_root": "bac",
+    "class": 1,
+    "width": "b",
+    "definition": "1. balk, hinder. 3. heed."
+}
+
+
+def test_round_trip_matches_nested_paradigm():
+    paradigm = generate_full_paradigm(bac)
+    compact = CompactParadigm.from_paradigm(paradigm)
+    assert compact == paradigm
+    assert compact.to_dict() == paradigm
+    assert list(compact) == list(paradigm)
+    assert list(compact['Present']) == list(paradigm['Present'])
+    assert compact['Past']['impersonal'] == [('bacadh', 'synthetic', 'unmarked'),
+                                             ('níor bacadh', 'synthetic', 'negative'),
+                                             ('ar bacadh', 'synthetic', 'interrogative')]
+    assert compact.form_count() == sum(len(forms) for tense in paradigm.values() for forms in tense.values())
+
+
+def test_missing_keys_and_pickling():
+    compact = CompactParadigm.from_paradigm(generate_full_paradigm(bac))
+    assert 'Imperative' not in compact
+    assert '2sg' not in compact['Present']
+    assert pickle.loads(pickle.dumps(compact)) == compact
+
+
+def test_compact_paradigms_for_lexicon():
+    verbs = synthetic_verbs(50)
+    assert compact_paradigms(verbs) == [generate_full_paradigm(verb_data) for verb_data in verbs]
+
+
+def test_empty_pronouns_and_tenses_round_trip():
+    paradigm = {'Present': {'analytic': [('bacann', 'analytic', 'unmarked')], '1sg': []},
+                'Future': {},
+                'Past': {'impersonal': [('bacadh', 'synthetic', 'unmarked')]}}
+    compact = CompactParadigm.from_paradigm(paradigm)
+    assert compact.to_dict() == paradigm
+    assert compact['Present']['1sg'] == []
+    assert compact.form_count() == 2
+    assert pickle.loads(pickle.dumps(compact)).to_dict() == paradigm
+
+
+def test_pickled_labels_are_remapped_in_another_process():
+    # The other process interns 'Imperative' and 'ordú' first, so they get other codes there than here
+    script = (
+        "import pickle, sys\n"
+        "from app.utils.compact_paradigm_utility import CompactParadigm\n"
+        "paradigm = {'Imperative': {'2sg': [('bac', 'analytic', 'ordú')]}}\n"
+        "sys.stdout.buffer.write(pickle.dumps(CompactParadigm.from_paradigm(paradigm)))\n"
+    )
+    CompactParadigm.from_paradigm({'Jussive': {'2pl': [('bacaigí', 'synthetic', 'guí')]}})
+    pickled = subprocess.run([sys.executable, '-c', script], cwd=ROOT_DIR, capture_output=True, check=True).stdout
+    assert pickle.loads(pickled).to_dict() == {'Imperative': {'2sg': [('bac', 'analytic', 'ordú')]}}
@@ -1,5 +1,14 @@
-from app.utils.conjugation_utility import conjugate_past_tense
-from deepdiff import DeepDiff
+import os
+
+import pytest
+
+from app.utils.conjugation_utility import PLAIN, TENSE_RULES, TenseRule, add_past_particle, add_unmarked_particle, \
+    compile_tense, conjugate, conjugate_futurey, conjugate_past_tense
+from app.utils.load_verbs_utility import load_verbs_json
+from benchmarks import legacy_conjugation
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'app', 'utils', 'data', 'verbs.json')
 
 verb_data = [
     ({
@@ -41,7 +50,48 @@ verb_data = [
 ]
 
 
-for item, expected in verb_data:
-    actual = conjugate_past_tense(item)
-    diff = DeepDiff(actual, expected)
-    print('Difference: ' , diff)
\ No newline at end of file
+@pytest.mark.parametrize('item, expected', verb_data, ids=[item['verb'] for item, _ in verb_data])
+def test_past_tense_forms(item, expected):
+    assert conjugate_past_tense(item) == expected
+
+
+def test_conjugate_matches_the_legacy_functions():
+    legacy_functions = {
+        'Present': legacy_conjugation.conjugate_present_tense,
+        'Future': legacy_conjugation.conjugate_future_tense,
+        'Past': legacy_conjugation.conjugate_past_tense,
+        'Conditional': legacy_conjugation.conjugate_conditional_tense,
+        'Past Habitual': legacy_conjugation.conjugate_past_habitual_tense,
+    }
+    for item in list(load_verbs_json(DATA_FILE)) + synthetic_verbs(200):
+        for tense, legacy_function in legacy_functions.items():
+            assert conjugate(item, tense) == legacy_function(item), (item['verb'], tense)
+
+
+@pytest.mark.parametrize('root', ['bac', 'ól', 'fág', 'séid', 'tóg', 'achain'])
+def test_kept_helpers_match_the_legacy_ones(root):
+    for particle in ('do', 'níor', 'ar', ''):
+        assert add_past_particle(root, particle) == legacy_conjugation.add_past_particle(root, particle)
+    for particle in ('', 'Negative', 'Interrogative'):
+        assert add_unmarked_particle(root, particle) == legacy_conjugation.add_unmarked_particle(root, particle)
+    for tense in ('present', 'future'):
+        for root_class, root_width in ((1, 'b'), (1, 's'), (2, 'b'), (2, 's')):
+            assert conjugate_futurey(tense, root, root_class, root_width, 'O') == \
+                legacy_conjugation.conjugate_futurey(tense, root, root_class, root_width, 'O')
+
+
+def test_tense_is_added_as_data(monkeypatch):
+    endings = {1: {'b': {'O': {'2sg': '', '2pl': 'aigí'}}}}
+    monkeypatch.setitem(TENSE_RULES, 'Imperative', TenseRule(
+        endings, ('verb',), ('future_class', 'future_width'), 'ending',
+        (('unmarked', '', PLAIN), ('negative', 'ná ', PLAIN)), {}, {}))
+
+    assert conjugate(verb_data[1][0], 'Imperative') == {
+        '2sg': [('bac', 'analytic', 'unmarked'), ('ná bac', 'analytic', 'negative')],
+        '2pl': [('bacaigí', 'synthetic', 'unmarked'), ('ná bacaigí', 'synthetic', 'negative')],
+    }
+
+
+def test_unknown_dialect_raises():
+    with pytest.raises(KeyError):
+        compile_tense('Future', 1, 'b', 'X')
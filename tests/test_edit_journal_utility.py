@@ -0,0 +1,107 @@
+import json
+import os
+
+from app.utils.edit_journal_utility import append_edit, compact_journal, journal_path, read_journal
+from app.utils.lexicon_utility import compiled_lexicon_path, lexicon_is_stale
+from app.utils.load_verbs_utility import iter_verb_chunks, load_verbs, load_verbs_json
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+def write_verbs(path, verbs):
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(verbs, file, ensure_ascii=False)
+
+
+def test_edits_apply_over_lexicon_and_json(tmp_path):
+    data_file = str(tmp_path / 'verbs.json')
+    verbs = synthetic_verbs(20)
+    write_verbs(data_file, verbs)
+    load_verbs(data_file)  # Compile the lexicon
+
+    append_edit(data_file, verbs[3]['verb'], 'definition', 'first')
+    append_edit(data_file, verbs[3]['verb'], 'definition', 'to edit again')
+    append_edit(data_file, verbs[7]['verb'], 'definition', 'déanta')
+
+    # Editing leaves the data file, and so the lexicon, untouched
+    assert not lexicon_is_stale(compiled_lexicon_path(data_file), data_file)
+    lexicon = load_verbs(data_file)
+    assert lexicon[3]['definition'] == 'to edit again'
+    assert lexicon[7]['definition'] == 'déanta'
+    assert lexicon[4]['definition'] == verbs[4]['definition']
+
+    chunks = list(iter_verb_chunks(data_file, chunk_size=5))
+    assert [entry for chunk in chunks for entry in chunk] == list(lexicon)
+
+    os.remove(compiled_lexicon_path(data_file))
+    chunks = list(iter_verb_chunks(data_file, chunk_size=5))
+    assert [entry for chunk in chunks for entry in chunk] == list(lexicon)
+    # The rebuilt lexicon holds the file's own definitions; the journal is applied on load
+    assert load_verbs(data_file)[3]['definition'] == 'to edit again'
+    assert load_verbs_json(data_file)[3]['definition'] == verbs[3]['definition']
+
+
+def test_partial_last_line_is_ignored_and_not_continued(tmp_path):
+    data_file = str(tmp_path / 'verbs.json')
+    append_edit(data_file, 'bris', 'definition', 'to break')
+    with open(journal_path(data_file), 'a', encoding='utf-8') as file:
+        file.write('{"verb": "dún", "field": "defin')  # Interrupted write
+    assert read_journal(data_file) == {'bris': {'definition': 'to break'}}
+
+    append_edit(data_file, 'dún', 'definition', 'to close')
+    assert read_journal(data_file) == {'bris': {'definition': 'to break'}, 'dún': {'definition': 'to close'}}
+
+
+def test_compaction_folds_journal_into_file(tmp_path):
+    data_file = str(tmp_path / 'verbs.json')
+    verbs = synthetic_verbs(5)
+    verbs[2]['notes'] = 'kept'
+    write_verbs(data_file, verbs)
+    append_edit(data_file, verbs[2]['verb'], 'definition', 'nua')
+
+    assert compact_journal(data_file) == 1
+    assert not os.path.exists(journal_path(data_file))
+    with open(data_file, encoding='utf-8') as file:
+        compacted = json.load(file)
+    assert compacted[2] == dict(verbs[2], definition='nua')
+    assert compacted[:2] == verbs[:2]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+    assert load_verbs(data_file)[2]['definition'] == 'nua'
+    assert compact_journal(data_file) == 0
+
+
+def test_compaction_keeps_later_edits_and_file_mode(tmp_path, monkeypatch):
+    data_file = str(tmp_path / 'verbs.json')
+    verbs = synthetic_verbs(3)
+    write_verbs(data_file, verbs)
+    os.chmod(data_file, 0o644)
+    append_edit(data_file, verbs[0]['verb'], 'definition', 'folded')
+
+    # An edit saved while the data file is being rewritten
+    json_load = json.load
+
+    def load_and_edit(file):
+        append_edit(data_file, verbs[1]['verb'], 'definition', 'later')
+        return json_load(file)
+
+    monkeypatch.setattr(json, 'load', load_and_edit)
+    assert compact_journal(data_file) == 1
+    monkeypatch.undo()
+
+    assert read_journal(data_file) == {verbs[1]['verb']: {'definition': 'later'}}
+    assert os.stat(data_file).st_mode & 0o777 == 0o644
+    with open(data_file, encoding='utf-8') as file:
+        assert json.load(file)[0]['definition'] == 'folded'
+
+
+def test_interrupted_compaction_is_read_and_finished(tmp_path):
+    data_file = str(tmp_path / 'verbs.json')
+    verbs = synthetic_verbs(3)
+    write_verbs(data_file, verbs)
+    append_edit(data_file, verbs[0]['verb'], 'definition', 'first')
+    os.replace(journal_path(data_file), journal_path(data_file) + '.compacting')
+    append_edit(data_file, verbs[0]['verb'], 'definition', 'second')
+    assert read_journal(data_file) == {verbs[0]['verb']: {'definition': 'second'}}
+
+    compact_journal(data_file)
+    assert read_journal(data_file) == {}
+    assert load_verbs_json(data_file)[0]['definition'] == 'second'
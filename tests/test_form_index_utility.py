@@ -0,0 +1,49 @@
+from app.utils.form_index_utility import FormIndex
+from app.utils.paradigm_export_utility import iter_form_rows
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+def test_every_form_maps_back_to_its_analyses():
+    verbs = synthetic_verbs(30)
+    index = FormIndex.build(verbs)
+    expected = {}
+    for verb, tense, pronoun, lytic, marker, form, dialect in iter_form_rows(verbs):
+        expected.setdefault(form, set()).add((verb, tense, pronoun or tense, lytic, marker))
+    for verb_data in verbs:
+        # Not part of the export, but indexed
+        expected.setdefault(verb_data['verb'], set()).add((verb_data['verb'],) + ('dictionary_form',) * 2 + ('', ''))
+    for form, analyses in expected.items():
+        assert {analysis[1:] for analysis in index.analyses(form)} == analyses
+    assert index.analyses('not a form') == []
+    assert 'not a form' not in index
+
+
+def test_shared_forms_are_ambiguous():
+    first, second = synthetic_verbs(2)
+    # Two entries sharing a verbal noun that no other slot produces
+    first, second = dict(first, verbal_nouns=['comhrá']), dict(second, verbal_nouns=['comhrá'])
+    index = FormIndex.build([first, second])
+    noun = 'comhrá'
+    assert index.is_ambiguous(noun)
+    assert [(analysis.verb_index, analysis.tense) for analysis in index.analyses(noun)] == \
+        [(0, 'verbal_noun'), (1, 'verbal_noun')]
+    assert not index.is_ambiguous(first['verbal_adjectives'][0])
+
+
+def test_adding_verbs_grows_the_table_and_continues_indices():
+    verbs = synthetic_verbs(40)
+    index = FormIndex(capacity=16)
+    index.add_verbs(verbs[:25])
+    index.add_verbs(verbs[25:])
+    built = FormIndex.build(verbs)
+    assert len(index) == len(built)
+    for verb_data in verbs:
+        assert index.analyses(verb_data['verb']) == built.analyses(verb_data['verb'])
+    assert index.analyses(verbs[30]['verb'])[0].verb_index == 30
+
+
+def test_table_is_sized_from_the_form_count():
+    verbs = synthetic_verbs(300)
+    index = FormIndex.build(verbs)
+    # At most 2/3 full, and no more than a power of two above what that needs
+    assert len(index) * 3 <= len(index._hashes) * 2 < len(index) * 6
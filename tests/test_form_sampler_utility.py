@@ -0,0 +1,79 @@
+import random
+from collections import Counter
+
+from app.utils.form_sampler_utility import FormSampler
+from app.utils.full_paradigm_utility import generate_full_paradigm
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+def test_samples_resolve_to_real_forms():
+    verbs = synthetic_verbs(30)
+    sampler = FormSampler(verbs, rng=random.Random(1))
+    for _ in range(500):
+        verb_index, tense, pronoun, form_index = sampler.sample()
+        verb_data = verbs[verb_index]
+        if tense == 'verbal_noun':
+            assert verb_data['verbal_nouns'][form_index]
+        elif tense == 'verbal_adjective':
+            assert verb_data['verbal_adjectives'][form_index]
+        elif tense == 'dictionary_form':
+            assert form_index == 0
+        else:
+            assert generate_full_paradigm(verb_data)[tense][pronoun][form_index]
+
+
+def test_selection_changes_are_incremental():
+    verbs = synthetic_verbs(20)
+    sampler = FormSampler(verbs, selected_tenses=['past'], rng=random.Random(2))
+    for idx in range(len(verbs)):
+        sampler.set_verb_selected(idx, idx == 7)
+    draws = [sampler.sample() for _ in range(200)]
+    assert {draw.verb_index for draw in draws} == {7}
+    assert {draw.tense for draw in draws} == {'Past'}
+
+    sampler.set_tense_selected('past', False)
+    sampler.set_tense_selected('dictionary_form', True)
+    assert sampler.sample() == (7, 'dictionary_form', 'dictionary_form', 0)
+
+    sampler.set_verb_selected(7, False)
+    assert sampler.sample() is None
+    assert sampler.sample_for_verb(3) == (3, 'dictionary_form', 'dictionary_form', 0)
+
+
+def test_slot_weights():
+    verbs = synthetic_verbs(10)
+    sampler = FormSampler(verbs, selected_tenses=['present'], rng=random.Random(3))
+    sampler.set_slot_weight('Present', 'analytic', 'negative', 1000.0)
+    counts = Counter((draw.pronoun, draw.form_index) for draw in (sampler.sample() for _ in range(400)))
+    assert counts[('analytic', 1)] > 300
+
+    sampler.set_verb_weight(4, 0.0)
+    assert all(sampler.sample().verb_index != 4 for _ in range(200))
+
+
+def test_verbs_are_drawn_uniformly_whatever_their_form_count():
+    verbs = synthetic_verbs(2)
+    verbs[0]['verbal_nouns'] = [f"{verbs[0]['verb']}{idx}" for idx in range(9)]
+    verbs[1]['verbal_nouns'] = [verbs[1]['verb']]
+    tenses = ['verbal_noun', 'dictionary_form']
+
+    sampler = FormSampler(verbs, selected_tenses=tenses, rng=random.Random(4))
+    counts = Counter(sampler.sample().verb_index for _ in range(2000))
+    assert 900 < counts[0] < 1100
+
+    # Weighting every form equally draws the first verb 10 times out of 12
+    sampler = FormSampler(verbs, selected_tenses=tenses, rng=random.Random(4), uniform_verbs=False)
+    counts = Counter(sampler.sample().verb_index for _ in range(2000))
+    assert 1550 < counts[0] < 1800
+
+
+def test_verbs_without_forms_in_the_selected_tenses_are_not_drawn():
+    verbs = synthetic_verbs(3)
+    verbs[1]['verbal_nouns'] = []
+    sampler = FormSampler(verbs, selected_tenses=['verbal_noun'], rng=random.Random(5))
+    assert all(sampler.sample().verb_index != 1 for _ in range(200))
+
+    sampler.set_tense_selected('verbal_noun', False)
+    assert sampler.sample() is None
+    sampler.set_tense_selected('dictionary_form', True)
+    assert {sampler.sample().verb_index for _ in range(200)} == {0, 1, 2}
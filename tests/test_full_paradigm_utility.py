@@ -0,0 +1,25 @@
+from app.utils.full_paradigm_utility import generate_full_paradigm, generate_lazy_paradigm
+
+bac = {
+    "verb": "bac",
+    "future_root": "bac",
+    "class": 1,
+    "width": "b",
+    "definition": "1. balk, hinder. 3. heed."
+}
+
+
+def test_lazy_paradigm_builds_tenses_on_first_read():
+    paradigm = generate_lazy_paradigm(bac)
+    assert list(paradigm) == ['Present', 'Future', 'Past', 'Conditional', 'Past Habitual']
+    assert 'Past' in paradigm
+    assert paradigm.built_tenses() == {}
+
+    past = paradigm['Past']
+    assert paradigm['Past'] is past
+    assert list(paradigm.built_tenses()) == ['Past']
+
+
+def test_lazy_paradigm_matches_full_paradigm():
+    assert generate_lazy_paradigm(bac) == generate_full_paradigm(bac)
+    assert dict(generate_lazy_paradigm(bac, 'O').items()) == generate_full_paradigm(bac, 'O')
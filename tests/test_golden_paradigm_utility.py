@@ -0,0 +1,89 @@
+import json
+import os
+
+import pytest
+
+from app.utils.golden_paradigm_utility import build_corpus, compare_paradigm, format_difference, read_corpus, \
+    slot_hashes, tense_hash, verb_keys, verify_corpus, write_corpus
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_FILE = os.path.join(ROOT_DIR, 'app', 'utils', 'data', 'verbs.json')
+GOLDEN_CORPUS = os.path.join(ROOT_DIR, 'tests', 'golden_paradigms.json')
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    data_file = tmp_path / 'verbs.json'
+    data_file.write_text(json.dumps(synthetic_verbs(40), ensure_ascii=False), encoding='utf-8')
+    return str(data_file)
+
+
+def test_lexicon_matches_golden_corpus(tmp_path):
+    # Verify a copy, so the compiled lexicon is not written next to the bundled data file
+    data_file = tmp_path / 'verbs.json'
+    with open(DATA_FILE, encoding='utf-8') as f:
+        data_file.write_text(f.read(), encoding='utf-8')
+
+    differences, stats = verify_corpus(str(data_file), GOLDEN_CORPUS, workers=1)
+
+    assert [format_difference(difference) for difference in differences] == []
+    assert stats.verbs == 99 and stats.tenses == 99 * 5
+
+
+def test_only_differing_slots_are_reported(tmp_path, data_file):
+    with open(data_file, encoding='utf-8') as f:
+        verbs = json.load(f)
+    corpus = build_corpus(verbs)
+    entries = corpus['dialects']['O']
+    first, second = list(verb_keys(verbs))[:2]
+    # Corrupt the hash of the second slot of the first verb's past tense
+    tense_hash, layout, packed = entries[first]['Past']
+    entries[first]['Past'] = ['0' * len(tense_hash), layout, packed[:8] + '00000000' + packed[16:]]
+    del entries[second]
+    corpus_path = str(tmp_path / 'golden.json')
+    write_corpus(corpus, corpus_path)
+
+    for workers in (1, 2):
+        differences, stats = verify_corpus(data_file, corpus_path, workers=workers, chunk_size=7)
+        assert [(d.verb, d.tense, d.slot, d.expected) for d in differences] == [
+            (first, 'Past', corpus['layouts'][layout][1], '00000000'),
+            (second, None, None, None),
+        ]
+        assert differences[0].form.startswith('níor ')
+        assert stats.verbs == 40
+
+
+def test_write_corpus_round_trips(tmp_path, data_file):
+    with open(data_file, encoding='utf-8') as f:
+        corpus = build_corpus(json.load(f))
+    corpus_path = str(tmp_path / 'golden.json')
+    write_corpus(corpus, corpus_path)
+    assert read_corpus(corpus_path) == corpus
+
+
+def build_corpus_from_paradigm(paradigm):
+    # The corpus build_corpus would write for one verb 'bac' with this paradigm
+    layout = list(slot_hashes(paradigm['Present']))
+    return {'format': 1, 'layouts': [layout], 'dialects': {'O': {'bac': {
+        tense: [tense_hash(conjugations), 0, ''.join(slot_hashes(conjugations).values())]
+        for tense, conjugations in paradigm.items()}}}}
+
+
+def test_repeated_slots_and_reordered_forms_are_reported():
+    tense = {'1sg': [('bacaim', 'synthetic', 'unmarked'), ('bacaimse', 'synthetic', 'unmarked')],
+             'analytic': [('bacann', 'analytic', 'unmarked')]}
+    corpus = build_corpus_from_paradigm({'Present': tense})
+    expected = corpus['dialects']['O']['bac']
+    assert corpus['layouts'][0] == ['1sg unmarked', '1sg unmarked#2', 'analytic unmarked']
+
+    changed = {'1sg': [tense['1sg'][0], ('bacaimid', 'synthetic', 'unmarked')], 'analytic': tense['analytic']}
+    differences = compare_paradigm('bac', 'O', {'Present': changed}, expected, corpus['layouts'])
+    assert [(d.slot, d.form) for d in differences] == [('1sg unmarked#2', 'bacaimid (synthetic)')]
+
+    # Swapping the two forms keeps every slot name and hash but changes the tense
+    swapped = {'analytic': tense['analytic'], '1sg': tense['1sg']}
+    differences = compare_paradigm('bac', 'O', {'Present': swapped}, expected, corpus['layouts'])
+    assert [(d.tense, d.slot, d.expected) for d in differences] == [('Present', None, expected['Present'][0])]
+    assert differences[0].form.startswith('analytic unmarked: bacann (analytic)')
+
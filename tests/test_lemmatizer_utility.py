@@ -0,0 +1,31 @@
+from app.utils.lemmatizer_utility import Lemmatizer, demutate
+from app.utils.paradigm_export_utility import iter_form_rows
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+def test_demutate_reverses_lenition_and_eclipsis():
+    assert demutate('bhris') == ['bhris', 'bris']
+    assert demutate('bhféach') == ['bhféach', 'bféach', 'féach']
+    assert demutate('gcaill') == ['gcaill', 'caill']
+    assert demutate('oscail') == ['oscail']
+
+
+def test_every_generated_form_lemmatizes_to_its_verb():
+    verbs = synthetic_verbs(200)
+    lemmatizer = Lemmatizer(verbs)
+    for verb, tense, pronoun, lytic, marker, form, dialect in iter_form_rows(verbs):
+        assert verb in lemmatizer.lemmatize(form), form
+
+
+def test_particles_variants_and_text():
+    verbs = [
+        {'verb': 'féach', 'future_root': 'féach', 'class': 1, 'width': 'b', 'verbal_nouns': ['féachaint']},
+        {'verb': 'suigh', 'future_root': 'suí', 'class': 2, 'width': 's', 'verbal_nouns': ['suí, suíomh']},
+    ]
+    lemmatizer = Lemmatizer(verbs)
+    assert lemmatizer.lemmatize('An bhFéachfaidh') == ['féach']
+    assert lemmatizer.lemmatize('d’fhéachamar') == ['féach']
+    assert lemmatizer.lemmatize('suíomh') == ['suigh']
+    assert lemmatizer.lemmatize('agus féach') == []
+    assert lemmatizer.lemmatize('teach') == []
+    assert list(lemmatizer.lemmatize_text("Níor fhéach sé.")) == [('níor', []), ('fhéach', ['féach']), ('sé', [])]
@@ -0,0 +1,73 @@
+import json
+import os
+
+from app.utils.lexicon_utility import compiled_lexicon_path, lexicon_is_stale, open_lexicon
+from app.utils.load_verbs_utility import load_verbs, load_verbs_json
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+def write_verbs(path, verbs):
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(verbs, file, ensure_ascii=False)
+
+
+def test_compiled_lexicon_matches_json(tmp_path):
+    data_file = str(tmp_path / 'verbs.json')
+    verbs = synthetic_verbs(100)
+    verbs[3]['verbal_nouns'] = None
+    verbs[4]['verbal_adjectives'] = []
+    verbs[5]['impersonal_present'] = 'bhítear'
+    write_verbs(data_file, verbs)
+
+    lexicon = load_verbs(data_file)
+    assert os.path.exists(compiled_lexicon_path(data_file))
+    assert not lexicon_is_stale(compiled_lexicon_path(data_file), data_file)
+    assert len(lexicon) == 100
+    assert list(lexicon) == load_verbs_json(data_file)
+    assert lexicon[-1] == lexicon[99]
+    assert lexicon[5]['impersonal_present'] == 'bhítear'
+
+
+def test_entries_are_decoded_once_and_keep_edits(tmp_path):
+    data_file = str(tmp_path / 'verbs.json')
+    write_verbs(data_file, synthetic_verbs(10))
+    lexicon = load_verbs(data_file)
+    lexicon[2]['definition'] = 'edited'
+    assert lexicon[2] is lexicon[2]
+    assert lexicon[2]['definition'] == 'edited'
+
+
+def test_stale_lexicon_is_rebuilt(tmp_path):
+    data_file = str(tmp_path / 'verbs.json')
+    write_verbs(data_file, synthetic_verbs(10))
+    load_verbs(data_file)
+
+    verbs = synthetic_verbs(12, seed=1)
+    write_verbs(data_file, verbs)
+    assert lexicon_is_stale(compiled_lexicon_path(data_file), data_file)
+    assert [entry['verb'] for entry in load_verbs(data_file)] == [entry['verb'] for entry in verbs]
+    assert len(open_lexicon(compiled_lexicon_path(data_file))) == 12
+
+
+def test_corrupt_lexicon_falls_back_to_json(tmp_path):
+    data_file = str(tmp_path / 'verbs.json')
+    write_verbs(data_file, synthetic_verbs(5))
+    load_verbs(data_file)
+    with open(compiled_lexicon_path(data_file), 'r+b') as file:
+        file.write(b'garbage!')
+    # Corrupt magic is stale, so it is recompiled
+    assert len(load_verbs(data_file)) == 5
+
+
+def test_values_the_lexicon_cannot_hold_fall_back_to_json(tmp_path):
+    from app.utils.load_verbs_utility import iter_verb_chunks
+
+    data_file = str(tmp_path / 'verbs.json')
+    for field, value in (('verbal_nouns', [1]), ('definition', 3), ('width', 2), ('verbal_adjectives', 'x')):
+        verbs = synthetic_verbs(5)
+        verbs[2][field] = value
+        write_verbs(data_file, verbs)
+
+        assert list(load_verbs(data_file)) == load_verbs_json(data_file)
+        assert [entry for chunk in iter_verb_chunks(data_file) for entry in chunk] == load_verbs_json(data_file)
+        assert not os.path.exists(compiled_lexicon_path(data_file))
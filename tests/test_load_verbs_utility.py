@@ -0,0 +1,110 @@
+import codecs
+import json
+
+import pytest
+
+from app.utils.load_verbs_utility import load_verbs_json, stream_verbs, verb_entry_from_item
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+def write_json(path, data, prefix=b''):
+    with open(path, 'wb') as file:
+        file.write(prefix + json.dumps(data, ensure_ascii=False, indent=4).encode('utf-8'))
+
+
+def test_stream_matches_json_load_across_chunk_boundaries(tmp_path):
+    data_file = str(tmp_path / 'verbs.json')
+    verbs = synthetic_verbs(300)
+    verbs[10]['verbal_nouns'] = ['ó' * 200]  # Multi-byte text spanning chunks
+    write_json(data_file, verbs)
+    with open(data_file, encoding='utf-8') as file:
+        expected = [verb_entry_from_item(item) for item in json.load(file)]
+    for chunk_size in (7, 64, 1 << 16):
+        assert list(stream_verbs(data_file, chunk_size=chunk_size)) == expected
+
+
+def test_bad_items_are_reported_with_byte_offsets(tmp_path):
+    data_file = str(tmp_path / 'verbs.json')
+    verbs = synthetic_verbs(3)
+    del verbs[1]['future_root']
+    write_json(data_file, verbs[:2] + [42] + verbs[2:], prefix=codecs.BOM_UTF8)
+
+    errors = []
+    entries = list(stream_verbs(data_file, errors, chunk_size=32))
+    assert [entry['verb'] for entry in entries] == [verbs[0]['verb'], verbs[2]['verb']]
+    assert [(error.index, error.message) for error in errors] == [
+        (1, "Missing key 'future_root'"),
+        (2, "expected an object, got int"),
+    ]
+    with open(data_file, 'rb') as file:
+        raw = file.read()
+    assert raw[errors[0].offset:errors[0].offset + 1] == b'{'
+    assert raw[errors[1].offset:errors[1].offset + 2] == b'42'
+
+
+def test_progress_and_empty_array(tmp_path):
+    data_file = str(tmp_path / 'verbs.json')
+    write_json(data_file, [])
+    progress = []
+    assert load_verbs_json(data_file) == []
+    assert list(stream_verbs(data_file, on_progress=lambda done, total: progress.append((done, total)))) == []
+    assert progress[-1][0] == progress[-1][1]
+
+
+def test_malformed_json_raises_after_good_items(tmp_path):
+    data_file = str(tmp_path / 'verbs.json')
+    with open(data_file, 'w', encoding='utf-8') as file:
+        file.write(json.dumps(synthetic_verbs(2))[:-1] + ', {"verb": ')
+    stream = stream_verbs(data_file)
+    assert next(stream)
+    assert next(stream)
+    with pytest.raises(json.JSONDecodeError):
+        next(stream)
+
+
+def test_verb_chunks_from_json_then_lexicon(tmp_path):
+    from app.utils.lexicon_utility import Lexicon, compiled_lexicon_path
+    from app.utils.load_verbs_utility import iter_verb_chunks
+
+    data_file = str(tmp_path / 'verbs.json')
+    verbs = synthetic_verbs(25)
+    write_json(data_file, verbs)
+    expected = [verb_entry_from_item(item) for item in verbs]
+
+    chunks = list(iter_verb_chunks(data_file, chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert [entry for chunk in chunks for entry in chunk] == expected
+    assert (tmp_path / compiled_lexicon_path('verbs.json')).exists()
+
+    progress = []
+    chunks = list(iter_verb_chunks(data_file, chunk_size=10, on_progress=lambda *args: progress.append(args)))
+    # The fresh lexicon is handed over whole rather than decoded into slices
+    assert len(chunks) == 1 and isinstance(chunks[0], Lexicon)
+    assert list(chunks[0]) == expected
+    assert progress == [(25, 25)]
+
+
+def test_skipped_items_are_reported_by_every_load(tmp_path):
+    from app.utils.lexicon_utility import compiled_lexicon_path
+    from app.utils.load_verbs_utility import iter_verb_chunks, load_verbs
+
+    data_file = str(tmp_path / 'verbs.json')
+    verbs = synthetic_verbs(3)
+    write_json(data_file, verbs[:1] + ['not a verb'] + verbs[1:])
+    expected = []
+    list(stream_verbs(data_file, expected))
+
+    # The first load compiles the lexicon; the later ones read the skipped items from it
+    for load in (lambda errors: load_verbs(data_file, errors),
+                 lambda errors: load_verbs(data_file, errors),
+                 lambda errors: list(iter_verb_chunks(data_file, errors=errors))):
+        errors = []
+        load(errors)
+        assert errors == expected and errors[0].index == 1
+    (tmp_path / compiled_lexicon_path('verbs.json')).unlink()
+    errors = []
+    list(iter_verb_chunks(data_file, errors=errors))
+    assert errors == expected
+    errors = []
+    list(iter_verb_chunks(data_file, errors=errors))
+    assert errors == expected
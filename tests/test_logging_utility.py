@@ -0,0 +1,59 @@
+import json
+import logging
+
+import pytest
+
+from app.utils.logging_utility import configure_logging, parse_levels, shutdown_logging
+
+
+class CountingRepr:
+    calls = 0
+
+    def __repr__(self):
+        CountingRepr.calls += 1
+        return 'paradigm'
+
+
+@pytest.fixture
+def restore_levels():
+    names = ['', 'app.quiet', 'app.loud']
+    levels = {name: logging.getLogger(name or None).level for name in names}
+    yield
+    shutdown_logging()
+    for name, level in levels.items():
+        logging.getLogger(name or None).setLevel(level)
+
+
+def test_module_levels_lazy_formatting_and_rotation(tmp_path, monkeypatch, restore_levels):
+    monkeypatch.delenv('VERB_QUIZ_LOG', raising=False)
+    log_file = tmp_path / 'app.log'
+    configure_logging(str(log_file), level='WARNING', module_levels={'app.loud': 'DEBUG'}, max_bytes=2000,
+                      backup_count=2)
+    payload = CountingRepr()
+    logging.getLogger('app.quiet').debug("Paradigm: %r", payload)
+    assert CountingRepr.calls == 0  # Never formatted
+    for idx in range(100):
+        logging.getLogger('app.loud').debug("Paradigm %d: %r", idx, payload)
+    shutdown_logging()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['app.log', 'app.log.1', 'app.log.2']
+    assert log_file.stat().st_size <= 2000
+    assert 'DEBUG - app.loud - Paradigm 99: paradigm' in log_file.read_text(encoding='utf-8')
+
+
+def test_json_format_and_environment_override(tmp_path, monkeypatch, restore_levels):
+    monkeypatch.setenv('VERB_QUIZ_LOG', 'ERROR,app.quiet=INFO')
+    log_file = tmp_path / 'app.jsonl'
+    configure_logging(str(log_file), level='DEBUG', json_format=True)
+    logging.getLogger('app.loud').warning("dropped")
+    logging.getLogger('app.quiet').info("kept %s", 'é')
+    shutdown_logging()
+    records = [json.loads(line) for line in log_file.read_text(encoding='utf-8').splitlines()]
+    assert [(record['level'], record['logger'], record['message']) for record in records] == \
+        [('INFO', 'app.quiet', 'kept é')]
+
+
+def test_parse_levels():
+    assert parse_levels('info, app.gui=debug') == {'': logging.INFO, 'app.gui': logging.DEBUG}
+    with pytest.raises(ValueError):
+        parse_levels('loud')
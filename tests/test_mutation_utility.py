@@ -0,0 +1,39 @@
+import pytest
+
+from app.utils.mutation_utility import ECLIPSIS_KIND, LENITION_KIND, PAST_PARTICLE_KIND, add_past_particle, eclipse, \
+    lenite, mutate, mutations
+
+
+@pytest.mark.parametrize('root, lenited', [
+    ('bris', 'bhris'), ('fan', 'fhan'), ('sábháil', 'shábháil'), ('snámh', 'shnámh'),
+    ('scríobh', 'scríobh'), ('s', 's'), ('ól', 'ól'), ('léigh', 'léigh'), ('', ''),
+])
+def test_lenite(root, lenited):
+    assert lenite(root) == lenited
+
+
+@pytest.mark.parametrize('root, eclipsed', [
+    ('bris', 'mbris'), ('cuir', 'gcuir'), ('fan', 'bhfan'), ('tóg', 'dtóg'), ('ól', 'ól'), ('siúil', 'siúil'),
+])
+def test_eclipse(root, eclipsed):
+    assert eclipse(root) == eclipsed
+
+
+@pytest.mark.parametrize('root, form', [('bris', 'bhris'), ('ól', "d'ól"), ('fan', "d'fhan"), ('léigh', 'léigh')])
+def test_add_past_particle(root, form):
+    assert add_past_particle(root) == form
+
+
+def test_mutate_is_memoized():
+    mutations.cache_clear()
+    assert mutate('bris', LENITION_KIND) == 'bhris'
+    assert mutate('bris', ECLIPSIS_KIND) == 'mbris'
+    assert mutate('fan', PAST_PARTICLE_KIND) == "d'fhan"
+    assert mutations('bris') == ('bhris', 'mbris', 'bhris')
+    info = mutations.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
+def test_mutate_unknown_kind():
+    with pytest.raises(KeyError):
+        mutate('bris', 'aspiration')
@@ -0,0 +1,55 @@
+from app.utils.full_paradigm_utility import generate_full_paradigm
+from app.utils.paradigm_cache_utility import ParadigmCache
+
+bac = {
+    "verb": "bac",
+    "future_root": "bac",
+    "class": 1,
+    "width": "b",
+    "definition": "1. balk, hinder. 3. heed."
+}
+
+achainigh = {
+    "verb": "achainigh",
+    "future_root": "achain",
+    "class": 2,
+    "width": "s",
+    "definition": "request"
+}
+
+
+def test_hit_returns_same_paradigm():
+    cache = ParadigmCache(maxsize=4)
+    first = cache.get(dict(bac))
+    second = cache.get(dict(bac))
+    assert first is second
+    assert first == generate_full_paradigm(bac)
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_changed_entry_misses():
+    cache = ParadigmCache(maxsize=4)
+    cache.get(dict(bac))
+    cache.get(dict(bac, future_root="bacc"))
+    assert cache.cache_info().misses == 2
+
+
+def test_lru_eviction():
+    cache = ParadigmCache(maxsize=1)
+    cache.get(bac)
+    cache.get(achainigh)
+    cache.get(bac)
+    info = cache.cache_info()
+    assert (info.misses, info.evictions, info.currsize) == (3, 2, 1)
+
+
+def test_invalidate_and_clear():
+    cache = ParadigmCache(maxsize=4)
+    cache.get(bac)
+    cache.get(achainigh)
+    assert cache.invalidate("bac") == 1
+    assert cache.invalidate("bac") == 0
+    assert cache.cache_info().currsize == 1
+    cache.clear()
+    assert cache.cache_info().currsize == 0
@@ -0,0 +1,44 @@
+import csv
+import json
+
+import pytest
+
+from app.utils.paradigm_export_utility import EXPORT_COLUMNS, export_paradigms, iter_form_rows
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / 'verbs.json'
+    path.write_text(json.dumps(synthetic_verbs(23), ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+def test_jsonl_export_in_process_and_in_workers(tmp_path, data_file):
+    expected = list(iter_form_rows(synthetic_verbs(23)))
+    assert {row[1] for row in expected} >= {'Present', 'Past Habitual', 'verbal_noun'}
+    for workers in (1, 2):
+        output = tmp_path / f'forms{workers}.jsonl'
+        stats = export_paradigms(data_file, str(output), 'jsonl', workers=workers, chunk_size=5)
+        with open(output, encoding='utf-8') as file:
+            rows = [tuple(json.loads(line)[column] for column in EXPORT_COLUMNS) for line in file]
+        assert rows == expected
+        assert (stats.verbs, stats.forms) == (23, len(expected))
+
+
+def test_csv_export(tmp_path, data_file):
+    output = tmp_path / 'forms.csv'
+    export_paradigms(data_file, str(output), 'csv', workers=1, chunk_size=7)
+    with open(output, encoding='utf-8', newline='') as file:
+        rows = list(csv.reader(file))
+    assert tuple(rows[0]) == EXPORT_COLUMNS
+    assert [tuple(row) for row in rows[1:]] == list(iter_form_rows(synthetic_verbs(23)))
+
+
+def test_parquet_export(tmp_path, data_file):
+    parquet = pytest.importorskip('pyarrow.parquet')
+    output = tmp_path / 'forms.parquet'
+    stats = export_paradigms(data_file, str(output), 'parquet', workers=1, chunk_size=10)
+    table = parquet.read_table(str(output))
+    assert table.column_names == list(EXPORT_COLUMNS)
+    assert table.num_rows == stats.forms
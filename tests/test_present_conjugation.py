@@ -1,5 +1,6 @@
+import pytest
+
 from app.utils.conjugation_utility import conjugate_present_tense
-from deepdiff import DeepDiff
 
 verb_data = [
     ({
@@ -54,7 +55,7 @@ verb_data = [
 #         "definition": "1. balk, hinder. 3. heed."
 #     }))
 
-for item, expected in verb_data:
-    actual = conjugate_present_tense(item)
-    diff = DeepDiff(actual, expected)
-    print('Difference: ' , diff)
\ No newline at end of file
+
+@pytest.mark.parametrize('item, expected', verb_data, ids=[item['verb'] for item, _ in verb_data])
+def test_present_tense_forms(item, expected):
+    assert conjugate_present_tense(item) == expected
@@ -0,0 +1,146 @@
+import random
+
+import pytest
+
+from app.utils.form_index_utility import FormIndex
+from app.utils.full_paradigm_utility import generate_full_paradigm
+from app.utils.paradigm_cache_utility import ParadigmCache
+from app.utils.quiz_engine_utility import Answer, NoFormsSelectedError, NoVerbsLoadedError, \
+    NoVerbsSelectedError, QuizEngine
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+def new_engine(verbs, **kwargs):
+    return QuizEngine(verbs, rng=random.Random(3), cache=ParadigmCache(), **kwargs)
+
+
+def test_questions_are_answered_correctly_by_their_own_answer():
+    verbs = synthetic_verbs(20)
+    engine = new_engine(verbs)
+    for _ in range(200):
+        question = engine.next_question()
+        verb_data = verbs[question.verb_index]
+        assert question.verb == verb_data['verb']
+        if question.has_form:
+            assert (question.form, question.form_type, question.form_marker) in \
+                generate_full_paradigm(verb_data)[question.tense][question.pronoun]
+        answer = Answer(question.verb.upper(), question.tense.lower(), question.form_marker, question.pronoun)
+        result = engine.check_answer(question, answer)
+        assert result.correct
+        assert result.definition == verb_data['definition']
+
+
+def test_wrong_answers_and_accepted_alternatives():
+    engine = new_engine(synthetic_verbs(5), selected_tenses=['past'])
+    question = engine.next_question()
+    result = engine.check_answer(question, Answer('x', 'Future', 'none', 'none'))
+    assert [tag for _, tag in result.feedback] == ['incorrect'] * 4
+    assert not result.correct
+    # The form type is accepted in place of the pronoun
+    result = engine.check_answer(question, Answer(question.verb, 'Past', question.form_marker, question.form_type))
+    assert result.correct
+
+
+def test_selections_and_frozen_verb():
+    verbs = synthetic_verbs(10)
+    engine = new_engine(verbs, selected_tenses=['present', 'verbal_noun'])
+    for verb_data in verbs[1:]:
+        engine.set_verb_selected(verb_data['verb'], False)
+    assert {engine.next_question().verb for _ in range(20)} == {verbs[0]['verb']}
+
+    engine.set_verb_selected(verbs[5]['verb'], True)
+    engine.set_verb_selected(verbs[0]['verb'], False)
+    first = engine.next_question()
+    assert first.verb == verbs[5]['verb']
+    engine.set_verb_selected(verbs[5]['verb'], False)
+    engine.set_verb_selected(verbs[6]['verb'], True)
+    # A frozen verb keeps being quizzed even though it is no longer selected
+    assert {engine.next_question(frozen=True).verb for _ in range(10)} == {first.verb}
+    assert {question.tense for question in [engine.next_question(frozen=True) for _ in range(30)]} == \
+        {'Present', 'verbal_noun'}
+
+
+def test_select_and_deselect_all():
+    verbs = synthetic_verbs(10)
+    engine = new_engine(verbs)
+    engine.next_question()  # Builds the sampler
+    engine.set_all_verbs_selected(False)
+    with pytest.raises(NoVerbsSelectedError):
+        engine.next_question()
+    engine.set_verb_selected(verbs[4]['verb'], True)
+    assert engine.selected_verb_indices == [4]
+    assert {engine.next_question().verb for _ in range(10)} == {verbs[4]['verb']}
+    engine.set_all_verbs_selected(True)
+    assert engine.is_verb_selected(verbs[0]['verb'])
+    assert len(engine.selected_verb_indices) == 10
+
+
+def test_errors_and_recall_mode():
+    with pytest.raises(NoVerbsLoadedError):
+        new_engine([]).next_question()
+    verbs = synthetic_verbs(3)
+    engine = new_engine(verbs, selected_tenses=[])
+    with pytest.raises(NoFormsSelectedError) as excinfo:
+        engine.next_question()
+    assert excinfo.value.title == "No Forms Selected"
+
+    engine.set_tense_selected('dictionary_form', True)
+    for verb_data in verbs:
+        engine.set_verb_selected(verb_data['verb'], False)
+    with pytest.raises(NoVerbsSelectedError):
+        engine.next_question()
+
+    engine.set_verb_selected(verbs[2]['verb'], True)
+    question = engine.next_question()
+    assert question.recall_only
+    assert question.prompt == f"Recall the definition for the verb:\n\n{verbs[2]['verb']}\n"
+    assert engine.check_answer(question, Answer()).feedback == []
+
+
+def test_any_analysis_of_an_ambiguous_form_is_accepted():
+    first, second = synthetic_verbs(2)
+    first, second = dict(first, verbal_nouns=['comhrá']), dict(second, verbal_nouns=['comhrá'])
+    engine = new_engine([first, second], selected_tenses=['verbal_noun'])
+    engine.set_verb_selected(second['verb'], False)
+    question = engine.next_question()
+    assert question.verb == first['verb'] and question.ambiguous
+
+    result = engine.check_answer(question, Answer(second['verb'], 'verbal_noun'))
+    assert result.correct
+    assert result.definition == second['definition']
+    assert [analysis.verb for analysis in result.alternatives] == [second['verb']]
+    result = engine.check_answer(question, Answer(first['verb'], 'verbal_noun'))
+    assert result.correct and result.definition == first['definition']
+
+
+def test_form_index_supplied_later_is_used_once_set():
+    first, second = synthetic_verbs(2)
+    first, second = dict(first, verbal_nouns=['comhrá']), dict(second, verbal_nouns=['comhrá'])
+    engine = new_engine([first], selected_tenses=['verbal_noun'], lazy_form_index=False)
+    engine.add_verbs([second])
+    engine.set_verb_selected(second['verb'], False)
+    question = engine.next_question()
+    assert engine.form_index is None and not question.ambiguous
+    assert not engine.check_answer(question, Answer(second['verb'], 'verbal_noun')).correct
+
+    engine.set_form_index(FormIndex.build([first, second]))
+    question = engine.next_question()
+    assert question.ambiguous
+    assert engine.check_answer(question, Answer(second['verb'], 'verbal_noun')).correct
+
+
+def test_verb_sequences_are_kept_until_verbs_are_added():
+    verbs = tuple(synthetic_verbs(3))
+    engine = new_engine(verbs)
+    assert engine.verbs is verbs
+    engine.set_verb_selected(verbs[1]['verb'], False)
+    selection = engine.selection
+
+    engine.set_verbs(verbs[:2])
+    assert engine.is_verb_selected(verbs[1]['verb'])
+    engine.add_verbs(verbs[2:])
+    assert engine.verbs == list(verbs)
+
+    # Restoring a verb list keeps its selections
+    engine.set_verbs(verbs, selection)
+    assert not engine.is_verb_selected(verbs[1]['verb']) and engine.is_verb_selected(verbs[2]['verb'])
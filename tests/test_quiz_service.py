@@ -0,0 +1,101 @@
+import asyncio
+
+from app.quiz_service import QuizService, SessionStore
+from app.utils.quiz_engine_utility import QuizEngine
+from benchmarks.load_quiz_service import QuizClient
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+def run_with_service(scenario, **kwargs):
+    async def main():
+        service = QuizService(synthetic_verbs(50), **kwargs)
+        port = await service.start('127.0.0.1', 0)
+        client = QuizClient('127.0.0.1', port)
+        try:
+            return await scenario(service, client)
+        finally:
+            await client.close()
+            await service.stop()
+    return asyncio.run(main())
+
+
+def test_question_and_answer_round_trip():
+    async def scenario(service, client):
+        status, session = await client.request('POST', '/sessions', {'tenses': ['past', 'future']})
+        assert status == 201
+        prefix = f"/sessions/{session['session_id']}"
+
+        status, data = await client.request('POST', f'{prefix}/answer', {})
+        assert status == 409
+
+        status, question = await client.request('POST', f'{prefix}/question', {})
+        assert status == 200 and question['has_form']
+        status, result = await client.request('POST', f'{prefix}/answer', {'verb': 'x'})
+        assert status == 200 and not result['correct']
+
+        correct = result['answer']
+        status, frozen = await client.request('POST', f'{prefix}/question', {'frozen': True})
+        status, result = await client.request('POST', f'{prefix}/answer', {'verb': correct['verb']})
+        assert result['answer']['verb'] == correct['verb']
+        assert result['feedback'][0]['result'] == 'correct'
+
+        answer = result['answer']
+        status, result = await client.request('POST', f'{prefix}/answer', {
+            'verb': answer['verb'], 'tense': answer['tense'], 'form_marker': answer['form_marker'],
+            'pronoun': answer['pronoun']})
+        assert result['correct']
+        return (await client.request('GET', '/health'))[1]
+
+    assert run_with_service(scenario)['sessions'] == 1
+
+
+def test_bad_requests():
+    async def scenario(service, client):
+        assert (await client.request('POST', '/sessions/nope/question', {}))[0] == 404
+        assert (await client.request('POST', '/sessions', {'tenses': ['pluperfect']}))[0] == 400
+        assert (await client.request('POST', '/sessions', {'dialect': 'X'}))[0] == 400
+        assert (await client.request('GET', '/sessions'))[0] == 405
+        status, session = await client.request('POST', '/sessions', {'tenses': []})
+        status, data = await client.request('POST', f"/sessions/{session['session_id']}/question", {})
+        assert status == 422 and 'select at least one' in data['error']
+
+    run_with_service(scenario)
+
+
+def test_engine_errors_are_server_errors_and_failed_keys_keep_no_lock(monkeypatch):
+    def fail(*args, **kwargs):
+        raise ValueError("Cannot sample from an empty selection")
+
+    async def scenario(service, client):
+        assert (await client.request('POST', '/sessions', {'dialect': 'X'}))[0] == 400
+        status, session = await client.request('POST', '/sessions', {})
+        assert status == 201 and service._engine_locks == {}
+
+        monkeypatch.setattr(QuizEngine, 'next_question', fail)
+        status, data = await client.request('POST', f"/sessions/{session['session_id']}/question", {})
+        assert status == 500 and data == {'error': "Internal server error."}
+        # The connection is kept open after a server error
+        assert (await client.request('GET', '/health'))[0] == 200
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', client.port)
+        writer.write(b"POST /sessions HTTP/1.1\r\nContent-Length: -5\r\n\r\n")
+        assert (await reader.readline()).split()[1] == b'400'
+        writer.close()
+
+    run_with_service(scenario)
+
+
+def test_sessions_expire_after_ttl():
+    now = [0.0]
+    store = SessionStore(ttl=10, clock=lambda: now[0])
+    first = store.create(('O', frozenset()))
+    now[0] = 6
+    second = store.create(('O', frozenset()))
+    now[0] = 12
+    assert store.get(first.session_id) is None
+    assert store.get(second.session_id) is second
+    now[0] = 21
+    assert store.get(second.session_id) is second  # Refreshed at 12
+    now[0] = 40
+    assert store.expire() == 1
+    assert len(store) == 0
@@ -0,0 +1,88 @@
+import builtins
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.utils.startup_profile_utility import DEFERRED_MODULES, IMPORT_TARGET_MS, PROFILE_STARTUP_ENV, \
+    ImportProfiler, StartupProfile, format_import_times
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run in a fresh interpreter, so nothing is imported yet
+GUI_IMPORT_SCRIPT = """
+import json, sys
+from app.utils.startup_profile_utility import DEFERRED_MODULES, ImportProfiler
+with ImportProfiler() as profiler:
+    import tkinter
+    from app.gui import VerbConjugationApp
+print(json.dumps({'total_us': profiler.total_us(),
+                  'deferred': [name for name in DEFERRED_MODULES if name in sys.modules]}))
+"""
+
+
+def test_import_profiler_nests_like_importtime(tmp_path, monkeypatch):
+    package = tmp_path / 'startup_pkg'
+    package.mkdir()
+    (package / '__init__.py').write_text('from . import leaf\n')
+    (package / 'leaf.py').write_text('VALUE = 1\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    original_import = builtins.__import__
+
+    with ImportProfiler() as profiler:
+        import startup_pkg  # noqa: F401
+
+    assert builtins.__import__ is original_import
+    assert [(entry.depth, entry.name) for entry in profiler.times] == [(1, 'startup_pkg.leaf'), (0, 'startup_pkg')]
+    leaf, package_entry = profiler.times
+    assert package_entry.cumulative_us >= leaf.cumulative_us + package_entry.self_us
+    assert format_import_times(profiler.times).splitlines()[0] == \
+        'import time: self [us] | cumulative | imported package'
+    for name in ('startup_pkg', 'startup_pkg.leaf'):
+        sys.modules.pop(name)
+
+
+def test_gui_imports_meet_target_and_defer_rarely_used_modules():
+    result = subprocess.run([sys.executable, '-c', GUI_IMPORT_SCRIPT], cwd=ROOT_DIR, capture_output=True,
+                            text=True, check=True)
+    imports = json.loads(result.stdout)
+
+    assert imports['deferred'] == []
+    assert imports['total_us'] / 1000 < IMPORT_TARGET_MS
+
+
+def test_finish_fails_over_target_or_with_deferred_modules():
+    profile = StartupProfile(started=0.0, target_ms=100)
+    profile.marks = [('imports', 40.0), ('first frame', 90.0)]
+    assert profile.finish(io.StringIO()) == 0
+
+    profile.deferred_loaded = [DEFERRED_MODULES[0]]
+    stream = io.StringIO()
+    assert profile.finish(stream) == 1
+    assert f"{DEFERRED_MODULES[0]} was imported before the first frame" in stream.getvalue()
+
+    profile.deferred_loaded = []
+    profile.marks[-1] = ('first frame', 150.0)
+    stream = io.StringIO()
+    assert profile.finish(stream) == 1
+    assert 'first frame over the 100 ms target' in stream.getvalue()
+
+
+def test_from_environment(monkeypatch):
+    monkeypatch.delenv(PROFILE_STARTUP_ENV, raising=False)
+    assert StartupProfile.from_environment() is None
+    monkeypatch.setenv(PROFILE_STARTUP_ENV, '1')
+    monkeypatch.setenv('VERB_QUIZ_STARTUP_TARGET_MS', '250')
+    assert StartupProfile.from_environment().target_ms == 250
+
+
+@pytest.mark.skipif(sys.platform.startswith('linux') and not os.environ.get('DISPLAY'), reason='needs a display')
+def test_profiled_startup_meets_target():
+    env = dict(os.environ, **{PROFILE_STARTUP_ENV: '1'})
+    result = subprocess.run([sys.executable, 'main.py'], cwd=ROOT_DIR, env=env, capture_output=True, text=True,
+                            timeout=60)
+    assert 'startup: first frame' in result.stderr
+    assert result.returncode == 0, result.stderr
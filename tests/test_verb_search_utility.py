@@ -0,0 +1,23 @@
+from app.utils.verb_search_utility import VerbSearchIndex
+from benchmarks.synthetic_lexicon import synthetic_verbs
+
+
+def linear_search(names, term):
+    return sorted((idx for idx, name in enumerate(names) if term.lower() in name.lower()),
+                  key=lambda idx: (names[idx].lower(), idx))
+
+
+def test_search_matches_a_linear_scan():
+    names = [verb_data['verb'] for verb_data in synthetic_verbs(500)] + ['Oscail', 'oscail']
+    index = VerbSearchIndex(names)
+    # Extending terms exercise the incremental path, the others the trigram path
+    for term in ['', 'a', 'ai', 'aig', 'aigh', 'eaigh', 'eairt', 'osc', 'OSCAIL', 'zzz', 'rthaigh', 'igh']:
+        assert index.search(term) == linear_search(names, term), term
+
+
+def test_prefix_search():
+    names = ['scar', 'Scairt', 'oscail', 'scaoil', 'sábháil']
+    index = VerbSearchIndex(names)
+    assert [names[idx] for idx in index.prefix_search('sca')] == ['Scairt', 'scaoil', 'scar']
+    assert index.prefix_search('x') == []
+    assert len(index.prefix_search('')) == len(index) == 5
@@ -0,0 +1,84 @@
+import os
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith('linux') and not os.environ.get('DISPLAY'),
+                                reason='needs a display')
+
+
+@pytest.fixture
+def root():
+    import tkinter as tk
+
+    root = tk.Tk()
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def new_list(root, items, toggled=None):
+    from app.verb_selection_list import VirtualCheckList
+
+    checked = {1, 5}
+    verb_list = VirtualCheckList(root, lambda item: f"verb {item}", lambda item: item in checked,
+                                 lambda item, selected: toggled.append((item, selected)), columns=3, row_height=20)
+    # The pool is normally sized by <Configure>; 100 px holds five rows
+    verb_list._fill_pool(100)
+    verb_list.set_items(items)
+    return verb_list
+
+
+def bound_items(verb_list):
+    return [[verb_list._pool_items[cb] if cb.winfo_manager() else None for cb in row] for row in verb_list._pool]
+
+
+def test_pool_only_covers_the_visible_rows(root):
+    verb_list = new_list(root, range(1000))
+    assert verb_list.visible_rows == 5 and verb_list.row_count == 334
+    assert sum(len(row) for row in verb_list._pool) == 15
+    assert bound_items(verb_list)[0] == [0, 1, 2]
+    assert [verb_list._pool_vars[cb].get() for cb in verb_list._pool[0]] == [False, True, False]
+    assert verb_list._pool[1][2].cget('text') == 'verb 5'
+
+    verb_list._fill_pool(40)
+    assert verb_list.visible_rows == 2 and len(verb_list._pool_vars) == 6
+
+    verb_list.set_columns(9)
+    verb_list._fill_pool(40)
+    assert verb_list.row_count == 112 and [len(row) for row in verb_list._pool] == [9, 9]
+    assert bound_items(verb_list)[1] == list(range(9, 18))
+
+
+def test_scrolling_is_clamped_to_the_last_full_page(root):
+    verb_list = new_list(root, range(1000))
+    verb_list.scroll(2)
+    assert verb_list.first_row == 2 and bound_items(verb_list)[0] == [6, 7, 8]
+
+    verb_list.scroll(1000)
+    assert verb_list.first_row == 334 - 5
+    assert bound_items(verb_list)[-1] == [999, None, None]
+    verb_list.scroll(-1000)
+    assert verb_list.first_row == 0
+
+    verb_list._on_scrollbar('moveto', '0.5')
+    assert verb_list.first_row == 167
+    verb_list._on_scrollbar('scroll', '1', 'pages')
+    assert verb_list.first_row == 172
+
+    # New items are shown from the top, and a short list does not scroll
+    verb_list.set_items([10, 11, 12, 13])
+    assert verb_list.first_row == 0
+    verb_list.scroll(3)
+    assert verb_list.first_row == 0
+    assert bound_items(verb_list) == [[10, 11, 12], [13, None, None], [None] * 3, [None] * 3, [None] * 3]
+
+
+def test_clicks_report_the_bound_item(root):
+    toggled = []
+    verb_list = new_list(root, range(100, 200), toggled)
+    verb_list.scroll(1)
+    cb = verb_list._pool[0][1]
+    verb_list._pool_vars[cb].set(True)
+    cb.invoke()
+    assert toggled == [(104, False)]
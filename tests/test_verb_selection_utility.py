@@ -0,0 +1,27 @@
+from app.utils.verb_selection_utility import VerbSelection
+
+
+def test_counts_and_cached_indices():
+    selection = VerbSelection(5)
+    assert selection.selected_count == 5
+    selection[1] = False
+    selection[1] = False
+    selection[3] = False
+    assert selection.selected_count == 3
+    indices = selection.selected_indices()
+    assert indices == [0, 2, 4]
+    assert selection.selected_indices() is indices  # Reused until the next change
+    selection.extend(2, selected=False)
+    selection.set_many([1, 6], True)
+    assert selection.selected_indices() == [0, 1, 2, 4, 6]
+    assert not selection[5] and len(selection) == 7
+
+
+def test_bulk_selection():
+    selection = VerbSelection(100_000, selected=False)
+    assert selection.selected_indices() == []
+    selection.set_all(True)
+    assert selection.selected_count == 100_000
+    assert selection.to_bytes() == b'\x01' * 100_000
+    selection.set_all(False)
+    assert selection.selected_count == 0 and not any(selection.to_bytes())